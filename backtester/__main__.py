@@ -32,13 +32,13 @@ logger.add(sys.stdout, level="ERROR")
 from backtester.engine import BacktestEngine
 from backtester.strategy import DemarkStrategy
 
-FALLBACK_PATTERNS: tuple[str, ...] = (
-    "%Y-%m-%d",
-    "%Y/%m/%d",
-    "%Y%m%d",
-    "%Y-%m-%d %H:%M",
-    "%Y-%m-%d %H:%M:%S",
-)
+# 按字符串长度分桶, 只尝试长度匹配的格式
+FALLBACK_PATTERNS: dict[int, tuple[str, ...]] = {
+    10: ("%Y-%m-%d", "%Y/%m/%d"),
+    8: ("%Y%m%d",),
+    16: ("%Y-%m-%d %H:%M",),
+    19: ("%Y-%m-%d %H:%M:%S",),
+}
 
 
 def _parse_time_value(raw_value: str) -> int:
@@ -51,8 +51,11 @@ def _parse_time_value(raw_value: str) -> int:
     if epoch_candidate is not None:
         return epoch_candidate
 
-    iso_candidate = _normalize_iso_candidate(normalized)
-    dt = _parse_iso_datetime(iso_candidate)
+    dt = (
+        _parse_iso_datetime(_normalize_iso_candidate(normalized))
+        if _looks_like_iso_date(normalized)
+        else None
+    )
     if dt is None:
         dt = _parse_fallback_datetime(normalized)
     if dt is None:
@@ -63,11 +66,18 @@ def _parse_time_value(raw_value: str) -> int:
 
 
 def _parse_epoch_timestamp(value: str) -> int | None:
-    """将纯数字字符串解释为秒或毫秒时间戳."""
-    if not value.isdigit():
+    """将 10 位(秒)或 13 位(毫秒)纯数字字符串解释为时间戳."""
+    length = len(value)
+    # 先按长度筛选, ISO 日期等常见输入无需 isdigit 扫描
+    if length not in (10, 13) or not value.isdigit():
         return None
     timestamp = int(value)
-    return timestamp * 1000 if len(value) <= 10 else timestamp
+    return timestamp * 1000 if length == 10 else timestamp
+
+
+def _looks_like_iso_date(value: str) -> bool:
+    """按 YYYY-MM-DD 外形预判, 避免对明显非 ISO 文本走异常路径."""
+    return len(value) >= 10 and value[4] == "-" and value[7] == "-"
 
 
 def _normalize_iso_candidate(value: str) -> str:
@@ -84,8 +94,8 @@ def _parse_iso_datetime(value: str) -> datetime | None:
 
 
 def _parse_fallback_datetime(value: str) -> datetime | None:
-    """使用常见格式集合尝试解析日期/时间."""
-    for pattern in FALLBACK_PATTERNS:
+    """使用与输入长度匹配的常见格式尝试解析日期/时间."""
+    for pattern in FALLBACK_PATTERNS.get(len(value), ()):
         try:
             dt = datetime.strptime(value, pattern)
             return dt.replace(tzinfo=UTC)
@@ -182,15 +192,16 @@ def _validate_time_window(
 
 def _log_configuration(args: argparse.Namespace) -> None:
     """输出当前回测配置,便于排查."""
-    logger.info(
-        "Configuring backtest for %s on %s with $%s",
-        args.symbol,
-        args.timeframe,
-        f"{args.cash:,.2f}",
+    # loguru 使用 {} 占位符; 金额格式化放进 lazy 回调, 日志级别不输出时不执行
+    logger.opt(lazy=True).info(
+        "Configuring backtest for {} on {} with ${}",
+        lambda: args.symbol,
+        lambda: args.timeframe,
+        lambda: f"{args.cash:,.2f}",
     )
     if args.start or args.end:
         logger.info(
-            "Backtest window: start=%s end=%s",
+            "Backtest window: start={} end={}",
             args.start or "<default>",
             args.end or "<default>",
         )
@@ -5,6 +5,63 @@ Simulates a trading exchange. Manages account balance, positions,
 and order execution.
 """
 
+from collections.abc import Iterator, MutableMapping
+
+import numpy as np
+
+
+class PositionBook(MutableMapping[str, float]):
+    """
+    Symbol -> quantity mapping backed by a contiguous float64 array.
+
+    Each symbol owns a fixed slot in ``quantities`` so portfolio valuation
+    can be computed with a single ``np.vdot`` instead of a dict walk.
+    """
+
+    def __init__(self) -> None:
+        self.symbols: list[str] = []
+        self.quantities = np.zeros(0, dtype=np.float64)
+        self._slots: dict[str, int] = {}
+
+    def __getitem__(self, symbol: str) -> float:
+        return float(self.quantities[self._slots[symbol]])
+
+    def __setitem__(self, symbol: str, quantity: float) -> None:
+        slot = self._slot(symbol)  # may grow (reallocate) quantities
+        self.quantities[slot] = quantity
+
+    def _slot(self, symbol: str) -> int:
+        """Return the slot of ``symbol``, registering it on first touch."""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self.symbols)
+            self._slots[symbol] = slot
+            self.symbols.append(symbol)
+            self.quantities = np.append(self.quantities, 0.0)
+        return slot
+
+    def quantity(self, symbol: str) -> float:
+        """Return the quantity of ``symbol`` (0 when never traded) in one probe."""
+        slot = self._slots.get(symbol)
+        return 0.0 if slot is None else float(self.quantities[slot])
+
+    def add(self, symbol: str, delta: float) -> None:
+        """Add ``delta`` to the quantity of ``symbol`` in place."""
+        slot = self._slot(symbol)
+        self.quantities[slot] += delta
+
+    def __delitem__(self, symbol: str) -> None:
+        slot = self._slots.pop(symbol)
+        del self.symbols[slot]
+        self.quantities = np.delete(self.quantities, slot)
+        self._slots = {name: index for index, name in enumerate(self.symbols)}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
 
 class Broker:
     """
@@ -22,7 +79,43 @@ class Broker:
         self.initial_cash = initial_cash
         self.cash = initial_cash
         self.commission = commission
-        self.positions = {}  # Holds the quantity of each asset
+        self._book = PositionBook()  # Holds the quantity of each asset
+        # 单标的快速路径: 只交易过一个标的时持仓以标量维护, 不经过 PositionBook
+        self._single_symbol = True
+        self._sole_symbol: str | None = None
+        self._sole_qty = 0.0
+
+    @property
+    def positions(self) -> PositionBook:
+        """
+        Full symbol -> quantity book.
+
+        Direct access may mutate the book, so the scalar position is flushed
+        into it and the single-symbol fast path is left for good.
+        """
+        self._leave_fast_path()
+        return self._book
+
+    def position(self, symbol: str) -> float:
+        """Return the held quantity of ``symbol`` (0 when never traded)."""
+        if self._single_symbol:
+            return self._sole_qty if symbol == self._sole_symbol else 0.0
+        return self._book.quantity(symbol)
+
+    def _leave_fast_path(self) -> None:
+        if not self._single_symbol:
+            return
+        if self._sole_symbol is not None:
+            self._book[self._sole_symbol] = self._sole_qty
+        self._single_symbol = False
+
+    def _adjust_position(self, symbol: str, delta: float) -> None:
+        if self._single_symbol and self._sole_symbol in (None, symbol):
+            self._sole_symbol = symbol
+            self._sole_qty += delta
+            return
+        self._leave_fast_path()
+        self._book.add(symbol, delta)
 
     def get_portfolio_value(self, current_prices: dict[str, float]) -> float:
         """
@@ -34,11 +127,24 @@ class Broker:
         Returns:
             The total portfolio value (cash + value of all positions).
         """
-        value = self.cash
-        for symbol, quantity in self.positions.items():
-            if quantity > 0:
-                value += quantity * current_prices.get(symbol, 0)
-        return value
+        if self._single_symbol:
+            if self._sole_symbol is None or self._sole_qty <= 0:
+                return self.cash
+            return self.cash + self._sole_qty * current_prices.get(self._sole_symbol, 0)
+
+        symbols = self._book.symbols
+        quantities = self._book.quantities
+        # 持仓簿中只有一个标的时同样走标量计算, 避免 numpy 调用开销
+        if len(symbols) == 1:
+            quantity = float(quantities[0])
+            if quantity <= 0:
+                return self.cash
+            return self.cash + quantity * current_prices.get(symbols[0], 0)
+
+        prices = np.array(
+            [current_prices.get(symbol, 0) for symbol in symbols], dtype=np.float64
+        )
+        return self.cash + float(np.vdot(np.maximum(quantities, 0.0), prices))
 
     def buy(self, symbol: str, quantity: float, price: float):
         """
@@ -57,7 +163,7 @@ class Broker:
             return
 
         self.cash -= total_cost
-        self.positions[symbol] = self.positions.get(symbol, 0) + quantity
+        self._adjust_position(symbol, quantity)
         return
 
     def sell(self, symbol: str, quantity: float, price: float):
@@ -69,7 +175,7 @@ class Broker:
             quantity: The amount to sell.
             price: The price per unit.
         """
-        if self.positions.get(symbol, 0) < quantity:
+        if self.position(symbol) < quantity:
             return
 
         revenue = quantity * price
@@ -77,5 +183,5 @@ class Broker:
         total_revenue = revenue - commission_cost
 
         self.cash += total_revenue
-        self.positions[symbol] -= quantity
+        self._adjust_position(symbol, -quantity)
         return
@@ -5,11 +5,69 @@ if __name__ == "__main__" and __package__ is None:
         "请在项目根目录使用 `p -m backtester.data_loader` 运行该模块, 无需手动修改 sys.path"
     )
 
+import threading
+from collections import OrderedDict
+
 import pandas as pd
 from loguru import logger
 
 from database.db_config import get_db_manager
 
+KLINE_COLUMNS: tuple[str, ...] = (
+    "open_time",
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+)
+NUMERIC_DTYPES: dict[str, str] = {
+    "open_price": "float64",
+    "high_price": "float64",
+    "low_price": "float64",
+    "close_price": "float64",
+    "volume": "float64",
+    "quote_asset_volume": "float64",
+    "taker_buy_base_asset_volume": "float64",
+    "taker_buy_quote_asset_volume": "float64",
+}
+INTEGER_DTYPES: dict[str, str] = {
+    "open_time": "int64",
+    "close_time": "int64",
+    "number_of_trades": "int64",
+}
+# 输出列名: 价格列重命名以便 df.open 访问, 其余保持数据库列名
+OUTPUT_COLUMNS: dict[str, str] = {
+    "open_price": "open",
+    "high_price": "high",
+    "low_price": "low",
+    "close_price": "close",
+    "volume": "volume",
+    "close_time": "close_time",
+    "quote_asset_volume": "quote_asset_volume",
+    "number_of_trades": "number_of_trades",
+    "taker_buy_base_asset_volume": "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume": "taker_buy_quote_asset_volume",
+}
+READ_CHUNK_SIZE = 100_000
+# 进程内最近加载结果缓存: 参数扫描反复回测同一区间时免去重复查询与构建
+FRAME_CACHE_SIZE = 8
+
+_FrameKey = tuple[str, str, int | None, int | None]
+_frame_cache: OrderedDict[_FrameKey, pd.DataFrame] = OrderedDict()
+_frame_cache_lock = threading.Lock()
+
+
+def clear_klines_cache() -> None:
+    """清空已加载 K 线缓存 (同步新数据后调用)."""
+    with _frame_cache_lock:
+        _frame_cache.clear()
+
 
 def load_klines_to_dataframe(
     symbol: str,
@@ -30,11 +88,26 @@ def load_klines_to_dataframe(
     Returns:
         A pandas DataFrame containing the K-line data, with a DatetimeIndex.
         Returns an empty DataFrame if no data is found.
+        Results are cached per (symbol, timeframe, start_ts, end_ts); each call
+        returns its own deep copy so callers cannot mutate the cached frame
+        (a shallow copy only isolates it under Copy-on-Write, i.e. pandas 3).
     """
-    logger.info(f"Loading klines for {symbol} {timeframe} from database...")
+    key: _FrameKey = (symbol, timeframe, start_ts, end_ts)
+    with _frame_cache_lock:
+        cached = _frame_cache.get(key)
+        if cached is not None:
+            _frame_cache.move_to_end(key)
+    if cached is not None:
+        logger.debug("Using cached klines for {} {}", symbol, timeframe)
+        return cached.copy(deep=True)
+
+    logger.info("Loading klines for {} {} from database...", symbol, timeframe)
     db_manager = get_db_manager()
 
-    query = "SELECT * FROM backtest_klines WHERE symbol = ? AND timeframe = ?"
+    query = (
+        f"SELECT {', '.join(KLINE_COLUMNS)} FROM backtest_klines "
+        "WHERE symbol = ? AND timeframe = ?"
+    )
     params = [symbol, timeframe]
 
     if start_ts:
@@ -46,47 +119,45 @@ def load_klines_to_dataframe(
 
     query += " ORDER BY open_time ASC"
 
+    # dtype 在读取时完成类型转换, 省去逐列 to_numeric 的二次物化
     with db_manager.get_connection() as conn:
-        df = pd.read_sql_query(query, conn, params=params)
-
-    if df.empty:
-        logger.warning(f"No data found for {symbol} {timeframe} in the database.")
-        return df
-
-    # --- Data Cleaning and Preparation ---
-    # Convert timestamp columns to datetime objects (UTC)
-    df["open_time"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-    df["close_time"] = pd.to_datetime(df["close_time"], unit="ms", utc=True)
-
-    # Convert price and volume columns to numeric types
-    numeric_cols = [
-        "open_price",
-        "high_price",
-        "low_price",
-        "close_price",
-        "volume",
-        "quote_asset_volume",
-        "taker_buy_base_asset_volume",
-        "taker_buy_quote_asset_volume",
-    ]
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
-
-    # Set the datetime index
-    df.set_index("open_time", inplace=True)
-
-    # Rename columns for better access, e.g., df.open
-    df.rename(
-        columns={
-            "open_price": "open",
-            "high_price": "high",
-            "low_price": "low",
-            "close_price": "close",
-        },
-        inplace=True,
+        chunks = pd.read_sql_query(
+            query,
+            conn,
+            params=params,
+            dtype={**NUMERIC_DTYPES, **INTEGER_DTYPES},
+            chunksize=READ_CHUNK_SIZE,
+        )
+        raw = pd.concat(chunks, ignore_index=True)
+
+    if raw.empty:
+        logger.warning("No data found for {} {} in the database.", symbol, timeframe)
+        return raw
+
+    df = _project_klines(raw)
+    with _frame_cache_lock:
+        _frame_cache[key] = df
+        while len(_frame_cache) > FRAME_CACHE_SIZE:
+            _frame_cache.popitem(last=False)
+
+    logger.success(
+        "Successfully loaded {} klines for {} {}.", len(df), symbol, timeframe
     )
-
-    logger.success(f"Successfully loaded {len(df)} klines for {symbol} {timeframe}.")
-    return df
+    return df.copy(deep=True)
+
+
+def _project_klines(raw: pd.DataFrame) -> pd.DataFrame:
+    """一次性构建带 DatetimeIndex 的结果表, 替代 set_index + rename 的逐步拷贝."""
+    columns = {
+        target: raw[source].to_numpy(copy=False)
+        for source, target in OUTPUT_COLUMNS.items()
+    }
+    columns["close_time"] = pd.to_datetime(columns["close_time"], unit="ms", utc=True)
+    index = pd.DatetimeIndex(
+        pd.to_datetime(raw["open_time"].to_numpy(copy=False), unit="ms", utc=True),
+        name="open_time",
+    )
+    return pd.DataFrame(columns, index=index, copy=False)
 
 
 if __name__ == "__main__":
@@ -5,13 +5,19 @@ The core component that orchestrates the backtest, bringing together the
 data, strategy, and broker.
 """
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from backtester.broker import Broker
 from backtester.data_loader import load_klines_to_dataframe
+from backtester.kernels import first_trigger_offset
 from backtester.mock_client import MockBinanceClient
-from backtester.strategy import Strategy
+from backtester.strategy import Strategy, SymbolMetadataCache
+
+OHLC_COLUMNS: tuple[str, ...] = ("open", "high", "low", "close")
+# 挂单触发前瞻窗口: 一次向量化扫描最多覆盖的 K 线数, 限制挂单频繁变化时的重算成本
+FILL_LOOKAHEAD_BARS = 256
 
 
 class BacktestEngine:
@@ -28,6 +34,7 @@ class BacktestEngine:
         start_ts: int | None = None,
         end_ts: int | None = None,
         disable_trading_logs: bool = False,
+        metadata_cache: SymbolMetadataCache | None = None,
     ):
         self.symbol = symbol
         self.timeframe = timeframe
@@ -36,9 +43,14 @@ class BacktestEngine:
         self.start_ts = start_ts
         self.end_ts = end_ts
         self.disable_trading_logs = disable_trading_logs
+        # 多次 run() 或参数扫描共用同一份品种元数据缓存, 由调用方决定何时清空
+        self.metadata_cache: SymbolMetadataCache = (
+            {} if metadata_cache is None else metadata_cache
+        )
 
         self.broker = Broker(initial_cash=self.initial_cash)
         self.data: pd.DataFrame = pd.DataFrame()
+        self._ohlc: dict[str, np.ndarray] = {}
 
     def _prepare_data(self):
         """Loads data using the DataLoader."""
@@ -51,6 +63,12 @@ class BacktestEngine:
         if self.data.empty:
             raise ValueError("No data loaded, cannot run backtest.")
         self.data.name = self.symbol
+        # SoA 缓存: 主循环只读取连续 NumPy 数组, 避免逐 tick 走 pandas 索引层;
+        # copy 得到可写数组, 与 kernels 的显式签名匹配 (CoW 视图为只读)
+        self._ohlc = {
+            column: self.data[column].to_numpy(dtype="float64", copy=True)
+            for column in OHLC_COLUMNS
+        }
 
     def _clear_previous_orders(self):
         """No-op for external tables to avoid side effects in backtests.
@@ -74,42 +92,25 @@ class BacktestEngine:
 
         return restore
 
-    def _check_pending_orders(self, candle, mock_client):
-        """Checks and executes pending orders based on the current candle."""
-        for order in mock_client.pending_orders[:]:
-            if order["symbol"] != self.symbol:
-                continue
-            if not self._pending_order_triggered(order, candle):
-                continue
-            self._execute_pending_order(order, candle, mock_client)
-
-    def _pending_order_triggered(self, order: dict, candle) -> bool:
-        """Return True when a stop order is triggered by current candle highs/lows."""
-        stop_price = float(order["stopPrice"])
-        if order["side"] == "BUY":
-            return candle["high"] >= stop_price
-        return candle["low"] <= stop_price
-
-    def _execute_pending_order(self, order: dict, candle, mock_client) -> None:
-        """Execute a triggered pending order and record the fill."""
-        stop_price = float(order["stopPrice"])
-        qty = float(order["origQty"])
-        if order["side"] == "BUY":
-            self.broker.buy(order["symbol"], qty, stop_price)
-        else:
-            self.broker.sell(order["symbol"], qty, stop_price)
-
-        _, filled = mock_client._record_filled_order(
-            symbol=order["symbol"],
-            side=order["side"],
-            qty=qty,
-            price=stop_price,
-            timestamp=candle.name.to_pydatetime(),
-            order_id=order["orderId"],
-            client_order_id=order["clientOrderId"],
+    def _next_fill_position(self, mock_client: MockBinanceClient, start: int) -> int:
+        """
+        Return the first bar at or after ``start`` where a pending stop can fill.
+
+        Bars before it cannot trigger any order, so fill evaluation is skipped
+        for them. The scan covers at most FILL_LOOKAHEAD_BARS bars; when nothing
+        triggers inside the window the window end is returned for a re-scan.
+        """
+        if not mock_client.pending_orders:
+            return len(self.data)
+        buy_stop, sell_stop = mock_client.trigger_bounds()
+        end = start + FILL_LOOKAHEAD_BARS
+        offset = first_trigger_offset(
+            self._ohlc["high"][start:end],
+            self._ohlc["low"][start:end],
+            buy_stop,
+            sell_stop,
         )
-        mock_client.executed_orders.append(filled)
-        mock_client.pending_orders.remove(order)
+        return start + offset if offset >= 0 else min(end, len(self.data))
 
     def run(self):
         """Runs the backtest."""
@@ -127,21 +128,34 @@ class BacktestEngine:
                 mock_client,
                 symbol=self.symbol,
                 timeframe=self.timeframe,
+                metadata_cache=self.metadata_cache,
             )
             strategy.init()
 
-            # Main event loop - use efficient iteration instead of iterrows()
-            data_length = len(self.data)
-            for i in range(data_length):
-                # Get the index value (timestamp) for the current row
-                tick_index = self.data.index[i]
-                mock_client.update_tick(tick_index)
+            # Main event loop - iterate the index natively instead of index[i]
+            # and hand each bar's OHLC to the mock client as plain floats
+            bars = zip(
+                *(self._ohlc[column].tolist() for column in OHLC_COLUMNS), strict=True
+            )
+            # 订单时间戳直接取自 int64 毫秒索引, 避免逐 tick 构造 datetime
+            tick_ms = self.data.index.as_unit("ms").asi8.tolist()
+            next_fill_position = 0
+            seen_version = -1
+            for position, (tick_index, bar, ms) in enumerate(
+                zip(self.data.index, bars, tick_ms, strict=True)
+            ):
+                mock_client.update_tick(tick_index, bar, ms)
                 # Strategy runs before evaluating fills so it can cancel/update orders
                 strategy.next()
-                mock_client.process_pending_orders_now()
+                if mock_client.pending_version != seen_version:
+                    seen_version = mock_client.pending_version
+                    next_fill_position = self._next_fill_position(mock_client, position)
+                if position >= next_fill_position:
+                    mock_client.process_pending_orders_now()
+                    seen_version = -1  # re-scan from the next bar
 
             final_value = self.broker.get_portfolio_value(
-                {self.symbol: self.data["close"].iloc[-1]}
+                {self.symbol: float(self._ohlc["close"][-1])}
             )
             return final_value
         finally:
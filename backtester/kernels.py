@@ -0,0 +1,95 @@
+"""Backtester numerical kernels.
+
+挂单触发判断等逐 tick 调用的数值计算, 统一基于 SoA NumPy 数组实现.
+安装了 numba 时编译逐元素循环版本, 否则退化为等价的 NumPy 向量化实现.
+编译结果通过 cache=True 落盘到 __pycache__, 仅首次运行承担编译耗时;
+显式签名让编译在导入时完成, 不会延后到回测主循环的第一次调用.
+"""
+
+if __name__ == "__main__" and __package__ is None:
+    raise RuntimeError(
+        "请在项目根目录使用 `p -m backtester.kernels` 运行该模块, 无需手动修改 sys.path"
+    )
+
+import numpy as np
+
+try:
+    # numba 为可选加速依赖
+    from numba import njit
+except ImportError:  # pragma: no cover - 未安装 numba 时使用纯 NumPy 实现
+    njit = None
+
+SIDE_BUY = 0
+SIDE_SELL = 1
+
+
+def _scan_stop_triggers(
+    stop_prices: np.ndarray, sides: np.ndarray, high: float, low: float
+) -> np.ndarray:
+    """返回被当前 K 线高/低价穿越的 STOP_LOSS 挂单下标(升序)."""
+    triggered = ((sides == SIDE_BUY) & (high >= stop_prices)) | (
+        (sides == SIDE_SELL) & (low <= stop_prices)
+    )
+    return np.flatnonzero(triggered)
+
+
+def _first_trigger_offset(
+    high: np.ndarray, low: np.ndarray, buy_stop: float, sell_stop: float
+) -> int:
+    """返回窗口内首根可能触发挂单的 K 线偏移, 无触发返回 -1.
+
+    buy_stop 为最低 BUY 止损价(无则 +inf), sell_stop 为最高 SELL 止损价(无则 -inf);
+    任一 BUY 触发等价于 high 穿越最低 BUY 止损价, SELL 同理.
+    """
+    crossed = (high >= buy_stop) | (low <= sell_stop)
+    offset = int(np.argmax(crossed))
+    return offset if crossed[offset] else -1
+
+
+def _scan_stop_triggers_loop(
+    stop_prices: np.ndarray, sides: np.ndarray, high: float, low: float
+) -> np.ndarray:
+    """_scan_stop_triggers 的逐元素循环版本, 供 numba 编译为单趟扫描(无中间布尔数组)."""
+    triggered = np.empty(stop_prices.shape[0], dtype=np.int64)
+    count = 0
+    for i in range(stop_prices.shape[0]):
+        stop = stop_prices[i]
+        if (high >= stop) if sides[i] == SIDE_BUY else (low <= stop):
+            triggered[count] = i
+            count += 1
+    return triggered[:count]
+
+
+def _first_trigger_offset_loop(
+    high: np.ndarray, low: np.ndarray, buy_stop: float, sell_stop: float
+) -> int:
+    """_first_trigger_offset 的循环版本, 命中首根即返回, 不必扫描整个窗口."""
+    for i in range(high.shape[0]):
+        if high[i] >= buy_stop or low[i] <= sell_stop:
+            return i
+    return -1
+
+
+# 边界使用 ±inf 表示"该方向无挂单", 因此不启用 fastmath (其 ninf 假设会破坏比较语义)
+_SCAN_STOP_TRIGGERS_SIGNATURE = "int64[:](float64[:], int8[:], float64, float64)"
+_FIRST_TRIGGER_OFFSET_SIGNATURE = "int64(float64[:], float64[:], float64, float64)"
+
+if njit is None:
+    scan_stop_triggers = _scan_stop_triggers
+    first_trigger_offset = _first_trigger_offset
+else:
+    # 编译循环版本: numba 将比较融合进单趟循环, 省去 NumPy 表达式的临时数组
+    scan_stop_triggers = njit(_SCAN_STOP_TRIGGERS_SIGNATURE, cache=True)(
+        _scan_stop_triggers_loop
+    )
+    first_trigger_offset = njit(_FIRST_TRIGGER_OFFSET_SIGNATURE, cache=True)(
+        _first_trigger_offset_loop
+    )
+
+
+if __name__ == "__main__":
+    from loguru import logger
+
+    stops = np.array([5.0, 3.8, 7.0], dtype=np.float64)
+    side_flags = np.array([SIDE_BUY, SIDE_SELL, SIDE_BUY], dtype=np.int8)
+    logger.info(f"触发下标: {scan_stop_triggers(stops, side_flags, 6.2, 5.0)}")
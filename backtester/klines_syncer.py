@@ -1,8 +1,11 @@
 """Backtester K-line Synchronization Tool."""
 
 import argparse
+import sqlite3
+import threading
 import time
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -13,6 +16,7 @@ if __name__ == "__main__" and __package__ is None:
 
 from loguru import logger
 
+from backtester.data_loader import clear_klines_cache
 from database.db_config import get_db_manager
 from ibkr_api.common import get_configured_client
 
@@ -24,6 +28,45 @@ _INSERT_QUERY = """
     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 """
 
+PAGE_LIMIT = 1000
+# 并发拉取: 按时间窗口切分互不重叠的分页, 由线程池并发请求
+FETCH_WORKERS = 4
+# Binance 现货 REST 权重预算为 1200/min, 留出余量
+REQUESTS_PER_MINUTE = 1100
+INTERVAL_MS: dict[str, int] = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "2h": 2 * 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "6h": 6 * 60 * 60_000,
+    "8h": 8 * 60 * 60_000,
+    "12h": 12 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+    "3d": 3 * 24 * 60 * 60_000,
+    "1w": 7 * 24 * 60 * 60_000,
+}
+
+
+class _RateLimiter:
+    """线程安全的最小间隔限流器, 将请求均匀摊开到每分钟配额内."""
+
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 def get_latest_kline_timestamp(symbol: str, timeframe: str) -> int | None:
     """Retrieves the timestamp of the most recent K-line."""
@@ -35,76 +78,187 @@ def get_latest_kline_timestamp(symbol: str, timeframe: str) -> int | None:
     try:
         result = get_db_manager().execute_query(query, (symbol, timeframe))
     except Exception as exc:
-        logger.warning(f"Could not retrieve latest kline timestamp: {exc}")
+        logger.warning("Could not retrieve latest kline timestamp: {}", exc)
         return None
     if result and result[0]["last_ts"] is not None:
-        logger.debug(f"Latest kline for {symbol} {timeframe} at {result[0]['last_ts']}")
+        logger.debug(
+            "Latest kline for {} {} at {}", symbol, timeframe, result[0]["last_ts"]
+        )
         return int(result[0]["last_ts"])
-    logger.debug(f"No existing klines found for {symbol} {timeframe}.")
+    logger.debug("No existing klines found for {} {}.", symbol, timeframe)
     return None
 
 
-def save_klines_to_db(klines: Sequence[Sequence[Any]], symbol: str, timeframe: str):
-    """Saves a list of K-lines to the `backtest_klines` table."""
+def save_klines_to_db(
+    klines: Sequence[Sequence[Any]],
+    symbol: str,
+    timeframe: str,
+    conn: sqlite3.Connection | None = None,
+):
+    """Saves a list of K-lines to the `backtest_klines` table.
+
+    When ``conn`` is given the rows join the caller's open transaction,
+    otherwise a dedicated transaction is used.
+    """
     if not klines:
         return
-    rows_to_insert = [_build_row(symbol, timeframe, kline) for kline in klines]
+    _insert_rows(
+        [_build_row(symbol, timeframe, kline) for kline in klines],
+        symbol,
+        timeframe,
+        conn=conn,
+    )
+
+
+def _insert_rows(
+    rows: list[tuple[Any, ...]],
+    symbol: str,
+    timeframe: str,
+    conn: sqlite3.Connection | None = None,
+) -> None:
+    """Write prepared rows in the caller's transaction or a dedicated one."""
     try:
-        with get_db_manager().transaction() as conn:
-            conn.executemany(_INSERT_QUERY, rows_to_insert)
-        logger.debug(
-            f"Saved/updated {len(rows_to_insert)} klines for {symbol} {timeframe}."
-        )
+        if conn is not None:
+            conn.executemany(_INSERT_QUERY, rows)
+        else:
+            with get_db_manager().transaction() as own_conn:
+                own_conn.executemany(_INSERT_QUERY, rows)
+        logger.debug("Saved/updated {} klines for {} {}.", len(rows), symbol, timeframe)
     except Exception as exc:
-        logger.error(f"Failed to save klines to database: {exc}")
+        logger.error("Failed to save klines to database: {}", exc)
         raise
 
 
-def sync_klines(symbol: str, timeframe: str, start_ts: int):
-    """Fetches historical data from Binance and stores it for backtesting."""
-    logger.debug(f"Starting backtest kline sync for {symbol} {timeframe}...")
+def sync_klines(
+    symbol: str,
+    timeframe: str,
+    start_ts: int,
+    throttle: bool = True,
+    workers: int = FETCH_WORKERS,
+):
+    """Fetches historical data from Binance and stores it for backtesting.
+
+    All pages are fetched into memory first and then written with one short
+    transaction, so the database commits (and fsyncs) once per sync without
+    holding the write lock during network I/O. Timeframes with a fixed interval are fetched as concurrent, non-overlapping
+    time windows; others (e.g. ``1M``) fall back to sequential paging.
+    """
+    logger.debug("Starting backtest kline sync for {} {}...", symbol, timeframe)
     client = get_configured_client()
     start_time = _determine_start_time(symbol, timeframe, start_ts)
-    logger.debug(f"Syncing from timestamp: {start_time}")
+    logger.debug("Syncing from timestamp: {}", start_time)
+
+    # 先拉取全部分页再一次性写入: 网络请求期间不持有写锁, 不阻塞实盘写入
+    if workers > 1 and timeframe in INTERVAL_MS:
+        rows = _fetch_windows(client, symbol, timeframe, start_time, throttle, workers)
+    else:
+        rows = _fetch_pages(client, symbol, timeframe, start_time, throttle)
+    if rows:
+        # 连接级调优 (WAL, synchronous, cache_size, temp_store) 由 DatabaseManager 在建连时统一设置
+        _insert_rows(rows, symbol, timeframe)
+
+    # 新数据已落库, 丢弃进程内已加载的 K 线缓存
+    clear_klines_cache()
+    logger.debug("Finished backtest kline sync for {} {}.", symbol, timeframe)
 
+
+def _fetch_pages(
+    client: Any,
+    symbol: str,
+    timeframe: str,
+    start_time: int,
+    throttle: bool,
+) -> list[tuple[Any, ...]]:
+    """顺序分页拉取: 每页以上一页最后一根 K 线作为下一页起点, 返回待写入的行."""
+    rows: list[tuple[Any, ...]] = []
     while True:
         try:
             klines = client.get_klines(
-                symbol=symbol, interval=timeframe, limit=1000, startTime=start_time
+                symbol=symbol,
+                interval=timeframe,
+                limit=PAGE_LIMIT,
+                startTime=start_time,
             )
         except Exception as exc:
-            logger.error(f"An error occurred during kline sync: {exc}")
+            logger.error("An error occurred during kline sync: {}", exc)
             break
 
         if not klines:
             logger.debug("No more new klines to fetch. Sync complete.")
             break
 
-        save_klines_to_db(klines, symbol, timeframe)
-        start_time = _advance_start_time(klines, start_time)
-        if start_time is None:
+        rows.extend(_build_row(symbol, timeframe, kline) for kline in klines)
+        next_start = _advance_start_time(klines, start_time)
+        if next_start is None:
             logger.debug("Start time did not advance. Sync complete.")
             break
-        time.sleep(0.5)
+        start_time = next_start
+        if throttle:
+            time.sleep(0.5)
+    return rows
+
 
-    logger.debug(f"Finished backtest kline sync for {symbol} {timeframe}.")
+def _fetch_windows(
+    client: Any,
+    symbol: str,
+    timeframe: str,
+    start_time: int,
+    throttle: bool,
+    workers: int,
+) -> list[tuple[Any, ...]]:
+    """并发窗口拉取: 预先切分 [start, now) 为整页窗口, 按时间顺序返回待写入的行."""
+    span = PAGE_LIMIT * INTERVAL_MS[timeframe]
+    now_ms = int(time.time() * 1000)
+    windows = range(start_time, now_ms, span)
+    limiter = _RateLimiter(REQUESTS_PER_MINUTE) if throttle else None
+    logger.debug("Fetching {} windows with {} workers", len(windows), workers)
+
+    def fetch(window_start: int) -> list[list[Any]]:
+        if limiter is not None:
+            limiter.acquire()
+        return client.get_klines(
+            symbol=symbol,
+            interval=timeframe,
+            limit=PAGE_LIMIT,
+            startTime=window_start,
+            endTime=window_start + span - 1,
+        )
+
+    rows: list[tuple[Any, ...]] = []
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # map 按提交顺序返回结果, 行顺序与时间顺序一致
+        pages = executor.map(fetch, windows)
+        while True:
+            try:
+                klines = next(pages)
+            except StopIteration:
+                break
+            except Exception as exc:
+                logger.error("An error occurred during kline sync: {}", exc)
+                break
+            rows.extend(_build_row(symbol, timeframe, kline) for kline in klines)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return rows
 
 
 def _build_row(symbol: str, timeframe: str, kline: Sequence[Any]) -> tuple[Any, ...]:
+    """Bind Binance string fields as numbers so SQLite stores REAL/INTEGER."""
     return (
         symbol,
         timeframe,
-        kline[0],
-        kline[1],
-        kline[2],
-        kline[3],
-        kline[4],
-        kline[5],
-        kline[6],
-        kline[7],
-        kline[8],
-        kline[9],
-        kline[10],
+        int(kline[0]),
+        float(kline[1]),
+        float(kline[2]),
+        float(kline[3]),
+        float(kline[4]),
+        float(kline[5]),
+        int(kline[6]),
+        float(kline[7]),
+        int(kline[8]),
+        float(kline[9]),
+        float(kline[10]),
     )
 
 
@@ -140,6 +294,17 @@ if __name__ == "__main__":
         type=str,
         help="Start date in ISO format (e.g., 2024-11-01). Overrides --months.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Concurrent fetch workers, 1 for sequential paging (default: {FETCH_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-throttle",
+        action="store_true",
+        help="Skip the 0.5s pause between pages (for local/cached kline sources)",
+    )
     args = parser.parse_args()
 
     # Calculate start timestamp
@@ -168,4 +333,10 @@ if __name__ == "__main__":
         start_timestamp = int(start_date.timestamp() * 1000)
         logger.info(f"Syncing {args.months} months from {start_date.date()}")
 
-    sync_klines(args.symbol.upper(), args.timeframe.lower(), start_timestamp)
+    sync_klines(
+        args.symbol.upper(),
+        args.timeframe.lower(),
+        start_timestamp,
+        throttle=not args.no_throttle,
+        workers=args.workers,
+    )
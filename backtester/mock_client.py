@@ -5,18 +5,152 @@ if __name__ == "__main__" and __package__ is None:
         "请在项目根目录使用 `p -m backtester.mock_client` 运行该模块, 无需手动修改 sys.path"
     )
 
+import heapq
 import random
 from collections import defaultdict, deque
-from datetime import datetime
+from itertools import repeat
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from binance.exceptions import BinanceAPIException
 from loguru import logger
 
+from backtester.kernels import SIDE_BUY, SIDE_SELL, scan_stop_triggers
 from database.crud import get_symbol_info
 from database.db_config import get_db_manager
 
+# REAL columns are selected raw and formatted in Python by _binance_kline_rows;
+# SQLite's CAST(... AS TEXT) keeps only 15 significant digits
+_KLINE_SELECT = (
+    "SELECT open_time, open_price, high_price, low_price, close_price, volume, "
+    "close_time, quote_asset_volume, number_of_trades, "
+    "taker_buy_base_asset_volume, taker_buy_quote_asset_volume "
+    "FROM backtest_klines WHERE symbol = ? AND timeframe = ?"
+)
+
+
+def _build_kline_query(has_start: bool, has_end: bool, has_limit: bool) -> str:
+    query = _KLINE_SELECT
+    if has_start:
+        query += " AND open_time >= ?"
+    if has_end:
+        query += " AND open_time <= ?"
+    query += " ORDER BY open_time ASC" if has_start else " ORDER BY open_time DESC"
+    if has_limit:
+        query += " LIMIT ?"
+    return query
+
+
+# (has_start, has_end, has_limit) -> SQL, built once so sqlite3's statement cache hits
+_KLINE_QUERIES: dict[tuple[bool, bool, bool], str] = {
+    (has_start, has_end, has_limit): _build_kline_query(has_start, has_end, has_limit)
+    for has_start in (False, True)
+    for has_end in (False, True)
+    for has_limit in (False, True)
+}
+
+# Data columns served by recent_klines, in Binance kline array order
+_KLINE_ARRAY_COLUMNS: tuple[str, ...] = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+)
+# Positions of string-typed fields in a Binance kline array
+_KLINE_TEXT_POSITIONS: tuple[int, ...] = (1, 2, 3, 4, 5, 7, 9, 10)
+
+
+def _kline_text(value: float) -> str:
+    """Shortest round-trip text of a price/volume field, as Binance sends strings."""
+    return repr(float(value))
+
+
+def _binance_kline_rows(columns: list[Any]) -> list[tuple[Any, ...]]:
+    """
+    Zip kline columns (open time first, Binance array order) into Binance rows.
+
+    Shared by get_klines and recent_klines so both paths format identically:
+    prices and volumes become strings, times and the trade count stay ints,
+    and the constant ignore field is appended.
+    """
+    for position in _KLINE_TEXT_POSITIONS:
+        columns[position] = map(_kline_text, columns[position])
+    return list(zip(*columns, repeat("0"), strict=False))
+
+
+# Static exchange info payload, built once instead of on every call
+_EXCHANGE_INFO: dict[str, Any] = {
+    "symbols": [
+        {
+            "symbol": "ADAUSDC",
+            "baseAssetPrecision": 8,
+            "quoteAssetPrecision": 8,
+            "filters": [
+                {"filterType": "LOT_SIZE", "stepSize": "0.1"},
+                {"filterType": "PRICE_FILTER", "tickSize": "0.0001"},
+                {"filterType": "MIN_NOTIONAL", "minNotional": "10.0"},
+            ],
+        }
+    ]
+}
+
+
+class _PendingStops:
+    """
+    Growable SoA buffer of (stopPrice, side, quantity), one slot per pending order.
+
+    Capacity doubles on demand. Cancelled slots are tombstoned with a NaN stop,
+    which never triggers, and dropped in bulk by ``compress``; creating,
+    cancelling and filling orders neither reallocate nor shift the arrays.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self._stops = np.empty(capacity, dtype=np.float64)
+        self._sides = np.empty(capacity, dtype=np.int8)
+        self._quantities = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    @property
+    def stops(self) -> np.ndarray:
+        return self._stops[: self.size]
+
+    @property
+    def sides(self) -> np.ndarray:
+        return self._sides[: self.size]
+
+    @property
+    def quantities(self) -> np.ndarray:
+        return self._quantities[: self.size]
+
+    def append(self, stop: float, side: int, quantity: float) -> None:
+        if self.size == len(self._stops):
+            capacity = 2 * len(self._stops)
+            self._stops = np.resize(self._stops, capacity)
+            self._sides = np.resize(self._sides, capacity)
+            self._quantities = np.resize(self._quantities, capacity)
+        self._stops[self.size] = stop
+        self._sides[self.size] = side
+        self._quantities[self.size] = quantity
+        self.size += 1
+
+    def discard(self, index: int) -> None:
+        self._stops[index] = np.nan
+
+    def compress(self, keep: np.ndarray) -> None:
+        kept = int(np.count_nonzero(keep))
+        self._stops[:kept] = self.stops[keep]
+        self._sides[:kept] = self.sides[keep]
+        self._quantities[:kept] = self.quantities[keep]
+        self.size = kept
+
 
 class MockBinanceClient:
     """
@@ -34,23 +168,65 @@ class MockBinanceClient:
         self._broker = broker
         self._data = data
         self._tick = 0
+        # Current tick time in epoch milliseconds, stamped on created/filled orders
+        self._tick_ms = 0
+        # (open, high, low, close) of the current tick candle
+        self._bar: tuple[float, float, float, float] | None = None
+        # NumPy views of the data built once by _prepare_arrays: (N, 4) OHLC
+        # matrix, volume and the epoch-ms index, which also maps Timestamp
+        # ticks to rows. Only needed when update_tick gets no pre-extracted bar.
+        self._ohlc_rows: np.ndarray | None = None
+        self._volume: np.ndarray | None = None
+        self._index_ms: np.ndarray | None = None
+        # Epoch-ms open times plus one NumPy array per _KLINE_ARRAY_COLUMNS
+        # entry, built once by _prepare_kline_columns for recent_klines
+        self._kline_columns: tuple[np.ndarray, ...] | None = None
         self._db_manager = get_db_manager()
-        self.executed_orders: deque[dict[str, Any]] = deque()
-        self._executed_orders_by_symbol: defaultdict[
-            str, deque[dict[str, Any]]
-        ] = defaultdict(deque)
         self._history_order_limit = 100
+        # Single store of executed orders as (fill time ms, order) per symbol.
+        # Bounded deques drop the oldest entry on append; only the time window
+        # still needs explicit pruning, which reads the stored time directly.
+        self._executed_orders_by_symbol: defaultdict[
+            str, deque[tuple[int, dict[str, Any]]]
+        ] = defaultdict(lambda: deque(maxlen=self._history_order_limit))
         self._history_time_window_ms = 1 * 24 * 60 * 60 * 1000  # 1 day window
-        self.pending_orders: list[
-            dict[str, Any]
-        ] = []  # Stores pending orders during backtest
+        # orderId -> pending order in creation order; the canonical pending set,
+        # so cancel/fill remove an order in O(1) instead of list.index + pop
+        self._pending_by_id: dict[int, dict[str, Any]] = {}
+        # Per-symbol view (orderId -> order) so symbol queries skip a full scan
+        self.pending_orders_by_symbol: defaultdict[str, dict[int, dict[str, Any]]] = (
+            defaultdict(dict)
+        )
+        # SoA slots consumed by the trigger kernel; _slot_orders[i] is the order
+        # behind slot i (None once cancelled/filled) and _slot_by_id maps back
+        self._pending_stops = _PendingStops()
+        self._slot_orders: list[dict[str, Any] | None] = []
+        self._slot_by_id: dict[int, int] = {}
+        # clientOrderId -> earliest pending order carrying it (first-match semantics)
+        self._pending_by_client_id: dict[str, dict[str, Any]] = {}
+        # Price-ordered heaps of (stop, orderId) for O(log K) trigger bounds;
+        # SELL stops are negated to form a max-heap. Entries whose orderId left
+        # _pending_by_id (filled/cancelled) are dropped lazily when they surface.
+        self._buy_stops_heap: list[tuple[float, int]] = []
+        self._sell_stops_heap: list[tuple[float, int]] = []
+        # Bumped whenever the pending set changes so callers can cache trigger bounds
+        self.pending_version = 0
         self._virtual_historical_orders: list[dict[str, Any]] = []
         self._order_id_counter = 1  # Reset each backtest session per design
 
-        # Locked balances for current backtest symbol assets
-        self._locked: dict[str, float] = {}
+        # Locked balances for current backtest symbol assets; unseen assets read 0.0
+        self._locked: defaultdict[str, float] = defaultdict(float)
+        # symbol -> (base_asset, quote_asset); symbol info is invariant during a run
+        self._assets_cache: dict[str, tuple[str, str]] = {}
+        # symbol -> (tick_ms, ticker); a ticker is built at most once per tick
+        self._ticker_cache: dict[str, tuple[int, dict[str, str]]] = {}
 
-    def update_tick(self, new_tick: int | pd.Timestamp) -> None:
+    def update_tick(
+        self,
+        new_tick: int | pd.Timestamp,
+        bar: tuple[float, float, float, float] | None = None,
+        tick_ms: int | None = None,
+    ) -> None:
         """
         Updates the internal tick to synchronize with the backtest engine.
         Pending orders are no longer processed automatically here; the caller
@@ -58,39 +234,98 @@ class MockBinanceClient:
 
         Args:
             new_tick: Either an integer index or a pandas Timestamp (for efficient iteration).
+            bar: Optional pre-extracted (open, high, low, close) of the tick candle;
+                looked up from the data when omitted.
+            tick_ms: Optional pre-computed epoch milliseconds of the tick;
+                derived from the tick when omitted.
         """
         self._tick = new_tick
+        self._tick_ms = (
+            tick_ms if tick_ms is not None else self._resolve_tick_ms(new_tick)
+        )
+        self._bar = (
+            bar if bar is not None else self._lookup_bar(new_tick, self._tick_ms)
+        )
+
+    @property
+    def current_time_ms(self) -> int:
+        """Epoch milliseconds of the current tick, resolved once per update_tick."""
+        return self._tick_ms
+
+    def _resolve_tick_ms(self, tick: Any) -> int:
+        """Derive epoch milliseconds from a Timestamp tick or a positional index."""
+        if isinstance(tick, int):
+            self._prepare_arrays()
+            try:
+                return int(self._index_ms[tick])
+            except IndexError:
+                return 0
+        if isinstance(tick, pd.Timestamp):
+            return tick.value // 1_000_000
+        # Assume datetime-like
+        return int(tick.timestamp() * 1000)
+
+    def _prepare_arrays(self) -> None:
+        """Build the NumPy views of the data once, on first positional lookup."""
+        if self._ohlc_rows is not None:
+            return
+        self._ohlc_rows = self._data[["open", "high", "low", "close"]].to_numpy(
+            dtype=np.float64
+        )
+        self._volume = self._data["volume"].to_numpy(dtype=np.float64)
+        index = self._data.index
+        self._index_ms = (
+            index.as_unit("ms").asi8
+            if isinstance(index, pd.DatetimeIndex)
+            else np.zeros(len(index), dtype=np.int64)
+        )
+
+    def _lookup_bar(
+        self, tick: int | pd.Timestamp, tick_ms: int
+    ) -> tuple[float, float, float, float]:
+        """Read (open, high, low, close) of a tick candle from the cached arrays."""
+        self._prepare_arrays()
+        position = tick if isinstance(tick, int) else self._tick_position(tick, tick_ms)
+        open_, high, low, close = self._ohlc_rows[position].tolist()
+        return (open_, high, low, close)
+
+    def _tick_position(self, tick: Any, tick_ms: int) -> int:
+        """Row of a timestamp tick: binary search on the sorted epoch-ms index."""
+        position = int(np.searchsorted(self._index_ms, tick_ms))
+        if position < len(self._index_ms) and self._index_ms[position] == tick_ms:
+            return position
+        return self._data.index.get_loc(tick)
+
+    def _current_bar(self) -> tuple[float, float, float, float]:
+        """(open, high, low, close) of the current tick; row 0 before the first update_tick."""
+        if self._bar is None:
+            self._bar = self._lookup_bar(self._tick, self._tick_ms)
+        return self._bar
 
     def _current_open_price(self) -> float:
         """Return the open price of the current tick candle."""
-        if hasattr(self._tick, "to_pydatetime"):
-            return float(self._data.loc[self._tick, "open"])
-        if isinstance(self._tick, int):
-            return float(self._data["open"].iloc[self._tick])
-        # Assume datetime-like object usable as index
-        return float(self._data.loc[self._tick, "open"])
+        return self._current_bar()[0]
 
     def _current_close_price(self) -> float:
         """Return the close price of the current tick candle."""
-        if hasattr(self._tick, "to_pydatetime"):
-            return float(self._data.loc[self._tick, "close"])
-        if isinstance(self._tick, int):
-            return float(self._data["close"].iloc[self._tick])
-        # Assume datetime-like object usable as index
-        return float(self._data.loc[self._tick, "close"])
+        return self._current_bar()[3]
 
     def process_pending_orders_now(self) -> None:
         """Re-evaluate pending orders using the current tick's candle data."""
         self._process_pending_orders()
 
     def _get_assets(self, symbol: str) -> tuple[str, str]:
-        info = get_symbol_info(symbol)
-        return info.base_asset, info.quote_asset
+        """Return (base, quote) assets; symbol info is read from the DB once per symbol."""
+        assets = self._assets_cache.get(symbol)
+        if assets is None:
+            info = get_symbol_info(symbol)
+            assets = (info.base_asset, info.quote_asset)
+            self._assets_cache[symbol] = assets
+        return assets
 
     def _get_totals(self, symbol: str) -> tuple[float, float]:
-        _base_asset, _ = self._get_assets(symbol)
         base_total = float(
-            self._broker.positions.get(symbol, 0)
+            self._broker.position(symbol)
         )  # positions tracked by symbol in Broker
         quote_total = float(self._broker.cash)
         return base_total, quote_total
@@ -120,12 +355,9 @@ class MockBinanceClient:
             f"MockBinanceClient does not implement margin endpoint {endpoint}"
         )
 
-    def _ensure_locked_keys(self, symbol: str) -> None:
-        base_asset, quote_asset = self._get_assets(symbol)
-        if base_asset not in self._locked:
-            self._locked[base_asset] = 0.0
-        if quote_asset not in self._locked:
-            self._locked[quote_asset] = 0.0
+    def _release_locked(self, asset: str, amount: float) -> None:
+        """Release ``amount`` of ``asset``'s locked balance, never below zero."""
+        self._locked[asset] = max(0.0, self._locked[asset] - amount)
 
     @staticmethod
     def _raise_insufficient_balance() -> None:
@@ -144,131 +376,140 @@ class MockBinanceClient:
         Processes pending orders against current market data.
         Executes orders when market conditions are met.
         """
-        # Find the index of current tick in the data
-        try:
-            tick_index = self._data.index.get_loc(self._tick)
-        except KeyError:
-            return  # Tick not found in data
+        _, high, low, _ = self._current_bar()
+        # O(1) pre-check against the heap bounds: a candle that crosses neither
+        # the lowest BUY stop nor the highest SELL stop cannot fill anything
+        buy_stop, sell_stop = self.trigger_bounds()
+        if high < buy_stop and low > sell_stop:
+            return
+        triggered = scan_stop_triggers(
+            self._pending_stops.stops, self._pending_stops.sides, high, low
+        )
+        if not triggered.size:
+            return
 
-        if tick_index >= len(self._data):
+        # Execute only the orders selected by the kernel; numeric fields come
+        # from the SoA buffer instead of re-parsing the order's strings
+        executed = False
+        stops = self._pending_stops.stops
+        sides = self._pending_stops.sides
+        quantities = self._pending_stops.quantities
+        for i in triggered.tolist():
+            order = self._slot_orders[i]
+            executed_order = self._execute_pending_order(
+                order,
+                self._tick_ms,
+                float(quantities[i]),
+                float(stops[i]),
+                sides[i] == SIDE_BUY,
+            )
+            if executed_order:
+                self._store_executed_order(executed_order, self._tick_ms)
+                self._forget_pending(order)
+                self._slot_orders[i] = None
+                executed = True
+        if not executed:
             return
 
-        current_candle = self._data.iloc[tick_index]
-        current_time = (
-            self._tick.to_pydatetime()
-            if hasattr(self._tick, "to_pydatetime")
-            else self._tick
+        # Mark-and-compact: one O(K) pass over the slots after all fills
+        self._compact_pending_slots()
+        self.pending_version += 1
+
+    @property
+    def pending_orders(self) -> list[dict[str, Any]]:
+        """Pending orders in creation order (a snapshot list)."""
+        return list(self._pending_by_id.values())
+
+    def _compact_pending_slots(self) -> None:
+        """Drop tombstoned slots from the SoA buffer and re-index the rest."""
+        keep = [order is not None for order in self._slot_orders]
+        self._pending_stops.compress(np.fromiter(keep, dtype=bool, count=len(keep)))
+        self._slot_orders = [order for order in self._slot_orders if order is not None]
+        self._slot_by_id = {
+            int(order["orderId"]): slot for slot, order in enumerate(self._slot_orders)
+        }
+
+    def _forget_pending(self, order: dict[str, Any]) -> None:
+        """Drop a filled/cancelled order from the pending lookup maps."""
+        order_id = int(order["orderId"])
+        del self._pending_by_id[order_id]
+        del self.pending_orders_by_symbol[order["symbol"]][order_id]
+        client_order_id = order.get("clientOrderId")
+        if self._pending_by_client_id.get(client_order_id) is order:
+            del self._pending_by_client_id[client_order_id]
+
+    def trigger_bounds(self) -> tuple[float, float]:
+        """Return (lowest BUY stop, highest SELL stop); ±inf when a side is empty."""
+        buy_top = self._live_heap_top(self._buy_stops_heap)
+        sell_top = self._live_heap_top(self._sell_stops_heap)
+        return (
+            buy_top if buy_top is not None else np.inf,
+            -sell_top if sell_top is not None else -np.inf,
         )
 
-        # Process each pending order
-        orders_to_remove = []
-        for i, order in enumerate(self.pending_orders):
-            if self._should_execute_order(order, current_candle):
-                # Execute the order
-                executed_order = self._execute_pending_order(
-                    order, current_candle, current_time
-                )
-                if executed_order:
-                    self._store_executed_order(executed_order)
-                    orders_to_remove.append(i)
-
-        # Remove executed orders from pending list (in reverse order to maintain indices)
-        for i in reversed(orders_to_remove):
-            self.pending_orders.pop(i)
-
-    def _store_executed_order(self, order: dict[str, Any]) -> None:
-        """Insert executed order while keeping internal list sorted by orderId."""
+    def _live_heap_top(self, heap: list[tuple[float, int]]) -> float | None:
+        """Pop stale entries off ``heap`` and return the live top key, if any."""
+        while heap and heap[0][1] not in self._pending_by_id:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _store_executed_order(self, order: dict[str, Any], timestamp_ms: int) -> None:
+        """Append an executed order stamped with its fill time and trim the window."""
         try:
             _ = int(order["orderId"])
         except Exception as exc:  # pragma: no cover - defensive
             raise ValueError(f"Invalid orderId in executed order: {order}") from exc
 
         symbol = order.get("symbol", "").upper()
-        timestamp = self._extract_order_timestamp(order)
-
-        self.executed_orders.append(order)
-        self._trim_deque(self.executed_orders, timestamp)
-
-        symbol_history = self._executed_orders_by_symbol[symbol]
-        symbol_history.append(order)
-        self._trim_deque(symbol_history, timestamp)
-
-    def _extract_order_timestamp(self, order: dict[str, Any]) -> int | None:
-        ts = order.get("updateTime") or order.get("time")
-        if ts is None:
-            return None
-        try:
-            return int(ts)
-        except Exception:
-            return None
-
-    def _trim_deque(
-        self, history: deque[dict[str, Any]], latest_timestamp: int | None
-    ) -> None:
-        while len(history) > self._history_order_limit:
+        history = self._executed_orders_by_symbol[symbol]
+        history.append((timestamp_ms, order))
+        cutoff = timestamp_ms - self._history_time_window_ms
+        while history[0][0] < cutoff:
             history.popleft()
 
-        if latest_timestamp is None:
-            return
-
-        cutoff = latest_timestamp - self._history_time_window_ms
-        while history:
-            ts = self._extract_order_timestamp(history[0])
-            if ts is None or ts >= cutoff:
-                break
-            history.popleft()
-
-    def _should_execute_order(self, order: dict[str, Any], current_candle: Any) -> bool:
-        """
-        Determines if a pending order should be executed based on current market data.
-        """
-        order_type = order.get("type", "")
-        side = order.get("side", "")
-        stop_price = float(order.get("stopPrice", "0"))
-
-        return bool(
-            order_type == "STOP_LOSS"
-            and (
-                (side == "BUY" and current_candle["high"] >= stop_price)
-                or (side == "SELL" and current_candle["low"] <= stop_price)
-            )
-        )
+    @property
+    def executed_orders(self) -> list[dict[str, Any]]:
+        """Executed orders of all symbols in fill order, capped at the history limit."""
+        histories = [h for h in self._executed_orders_by_symbol.values() if h]
+        if len(histories) == 1:
+            return list(map(itemgetter(1), histories[0]))
+        merged = heapq.merge(*histories, key=itemgetter(0))
+        return list(map(itemgetter(1), merged))[-self._history_order_limit :]
 
     def _execute_pending_order(
-        self, order: dict[str, Any], current_candle: Any, current_time: datetime
+        self,
+        order: dict[str, Any],
+        fill_time_ms: int,
+        quantity: float,
+        stop_price: float,
+        is_buy: bool,
     ) -> dict[str, Any] | None:
         """
         Executes a pending order and returns the filled order data.
+
+        ``quantity``/``stop_price``/``is_buy`` are the numeric values recorded
+        when the order was created; the order's original strings are reused
+        for the filled payload.
         """
         try:
             symbol = order["symbol"]
-            side = order["side"]
-            quantity = float(order["origQty"])
-            stop_price = float(order["stopPrice"])
 
             # Use stop price as execution price for stop-loss orders
             execution_price = stop_price
 
             # Execute through broker (no fees)
-            if side == "BUY":
+            if is_buy:
                 self._broker.buy(symbol, quantity, execution_price)
-            elif side == "SELL":
-                self._broker.sell(symbol, quantity, execution_price)
             else:
-                return None
+                self._broker.sell(symbol, quantity, execution_price)
 
             # Release locked on fill
             base_asset, quote_asset = self._get_assets(symbol)
-            self._ensure_locked_keys(symbol)
             notional = quantity * execution_price
-            if side == "BUY":
-                self._locked[quote_asset] = max(
-                    0.0, self._locked.get(quote_asset, 0.0) - notional
-                )
+            if is_buy:
+                self._release_locked(quote_asset, notional)
             else:
-                self._locked[base_asset] = max(
-                    0.0, self._locked.get(base_asset, 0.0) - quantity
-                )
+                self._release_locked(base_asset, quantity)
 
             # Create filled order record per design
             filled_order_dict = {
@@ -280,18 +521,16 @@ class MockBinanceClient:
                     if order.get("clientOrderId")
                     else {}
                 ),
-                "time": int(
-                    order.get("time", int(current_time.timestamp() * 1000))
-                ),  # creation time
-                "updateTime": int(current_time.timestamp() * 1000),  # fill time
+                "time": int(order.get("time", fill_time_ms)),  # creation time
+                "updateTime": fill_time_ms,  # fill time
                 "price": "0",
-                "stopPrice": str(execution_price),
-                "origQty": str(quantity),
-                "executedQty": str(quantity),
-                "cummulativeQuoteQty": str(notional),
+                "stopPrice": order.get("stopPrice") or f"{execution_price:.8f}",
+                "origQty": order["origQty"],
+                "executedQty": order["origQty"],
+                "cummulativeQuoteQty": f"{notional:.8f}",
                 "status": "FILLED",
                 "type": order.get("type", "STOP_LOSS"),
-                "side": side.upper(),
+                "side": order["side"],
             }
 
             return filled_order_dict
@@ -312,17 +551,13 @@ class MockBinanceClient:
         num_orders = self._determine_virtual_order_count()
         self._virtual_historical_orders.clear()
 
-        for offset, candle, timestamp, side in self._iter_virtual_order_sources(
-            num_orders
-        ):
-            price = self._select_virtual_price(side, candle)
-            quantity = self._select_virtual_quantity(candle)
+        samples = self._sample_virtual_orders(num_orders)
+        for offset, (timestamp_ms, side, price, quantity) in enumerate(samples):
             order_id = self._virtual_order_id(num_orders, offset)
             client_order_id = self._virtual_client_order_id(order_id)
             historical_order = self._build_virtual_order(
                 symbol,
-                candle,
-                timestamp,
+                timestamp_ms,
                 side,
                 price,
                 quantity,
@@ -348,37 +583,38 @@ class MockBinanceClient:
         data_length = len(self._data)
         return min(50, data_length // 10)
 
-    def _iter_virtual_order_sources(
+    def _sample_virtual_orders(
         self, num_orders: int
-    ) -> list[tuple[int, Any, Any, str]]:
-        """Yield source candle information for virtual orders."""
-        sources: list[tuple[int, Any, Any, str]] = []
-        if num_orders <= 0:
-            return sources
-
-        data_length = len(self._data)
-        for offset in range(num_orders):
-            tick_index = random.randint(0, data_length - 1)
-            candle = self._data.iloc[tick_index]
-            timestamp = self._data.index[tick_index]
-            side = random.choice(["BUY", "SELL"])
-            sources.append((offset, candle, timestamp, side))
-        return sources
+    ) -> list[tuple[int, str, float, float]]:
+        """
+        Sample (time, side, price, quantity) for virtual orders in one vectorized pass.
 
-    @staticmethod
-    def _select_virtual_price(side: str, candle: Any) -> float:
-        """Select a realistic price for a virtual order."""
-        price_span = float(candle["high"]) - float(candle["low"])
-        adjustment = random.uniform(0, price_span * 0.3)
-        if side == "BUY":
-            return float(candle["low"]) + adjustment
-        return float(candle["high"]) - adjustment
+        BUY prices sit within the lower 30% of the candle range and SELL prices
+        within the upper 30%; quantity is capped by 1% of the candle volume.
+        """
+        if num_orders <= 0:
+            return []
 
-    @staticmethod
-    def _select_virtual_quantity(candle: Any) -> float:
-        """Select a realistic quantity for a virtual order."""
-        base_volume = float(candle["volume"])
-        return random.uniform(0.1, min(10.0, base_volume * 0.01))
+        self._prepare_arrays()
+        # Seed from the stdlib RNG so random.seed() keeps runs reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+        rows = rng.integers(0, len(self._data), size=num_orders)
+        highs = self._ohlc_rows[rows, 1]
+        lows = self._ohlc_rows[rows, 2]
+        is_buy = rng.integers(0, 2, size=num_orders).astype(bool)
+        adjustments = rng.uniform(0.0, (highs - lows) * 0.3)
+        prices = np.where(is_buy, lows + adjustments, highs - adjustments)
+        quantities = rng.uniform(0.1, np.minimum(10.0, self._volume[rows] * 0.01))
+        sides = np.where(is_buy, "BUY", "SELL")
+        return list(
+            zip(
+                self._index_ms[rows].tolist(),
+                sides.tolist(),
+                prices.tolist(),
+                quantities.tolist(),
+                strict=True,
+            )
+        )
 
     def _virtual_order_id(self, num_orders: int, offset: int) -> int:
         """Build a virtual order id relative to the current counter."""
@@ -392,8 +628,7 @@ class MockBinanceClient:
     @staticmethod
     def _build_virtual_order(
         symbol: str,
-        candle: Any,
-        timestamp: Any,
+        timestamp_ms: int,
         side: str,
         price: float,
         quantity: float,
@@ -402,7 +637,6 @@ class MockBinanceClient:
     ) -> dict[str, Any]:
         """Compose a virtual historical order payload."""
         quote_qty = quantity * price
-        timestamp_ms = int(timestamp.timestamp() * 1000)
         formatted_qty = f"{quantity:.8f}"
         formatted_price = f"{price:.8f}"
         formatted_quote_qty = f"{quote_qty:.8f}"
@@ -441,35 +675,26 @@ class MockBinanceClient:
             return {"free": "0", "locked": "0"}
         base_asset, quote_asset = self._get_assets(symbol)
         base_total, quote_total = self._get_totals(symbol)
-        self._ensure_locked_keys(symbol)
         if asset == quote_asset:
-            free = quote_total - self._locked.get(quote_asset, 0.0)
-            return {
-                "free": str(free),
-                "locked": str(self._locked.get(quote_asset, 0.0)),
-            }
+            locked = self._locked[quote_asset]
+            return {"free": f"{quote_total - locked:.8f}", "locked": f"{locked:.8f}"}
         if asset == base_asset:
-            free = base_total - self._locked.get(base_asset, 0.0)
-            return {"free": str(free), "locked": str(self._locked.get(base_asset, 0.0))}
+            locked = self._locked[base_asset]
+            return {"free": f"{base_total - locked:.8f}", "locked": f"{locked:.8f}"}
         return {"free": "0", "locked": "0"}
 
     def get_symbol_ticker(self, symbol: str) -> dict[str, str]:
-        """Mocks the get_symbol_ticker method."""
-        try:
-            if hasattr(self._tick, "to_pydatetime"):
-                # Tick is a Timestamp; use label-based access
-                price = self._data.loc[self._tick, "close"]
-            elif isinstance(self._tick, int):
-                price = self._data["close"].iloc[self._tick]
-            else:
-                # Fallback: try loc
-                price = self._data.loc[self._tick, "close"]
-            return {"symbol": symbol, "price": str(float(price))}
-        except Exception:
-            logger.error(
-                "Mock client failed to get current price for get_symbol_ticker."
-            )
-            return {"symbol": symbol, "price": "0"}
+        """Mocks the get_symbol_ticker method.
+
+        Repeated polls within one tick return the same dict, so callers must
+        treat it as read-only.
+        """
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and cached[0] == self._tick_ms:
+            return cached[1]
+        ticker = {"symbol": symbol, "price": str(self._current_close_price())}
+        self._ticker_cache[symbol] = (self._tick_ms, ticker)
+        return ticker
 
     def create_order(
         self,
@@ -487,6 +712,10 @@ class MockBinanceClient:
         side = side.upper()
         if type != "STOP_LOSS":
             raise ValueError("Only STOP_LOSS is supported in backtest mock")
+        if side not in ("BUY", "SELL"):
+            raise ValueError(f"Unsupported order side: {side}")
+        # Side is resolved once here; fills read the SoA side code instead
+        is_buy = side == "BUY"
 
         qty = float(quantity)
         stop = float(stopPrice or 0)
@@ -494,45 +723,28 @@ class MockBinanceClient:
         order_id = self._order_id_counter
         self._order_id_counter += 1
 
-        if side == "BUY" and stop <= current_open_price:
+        if is_buy and stop <= current_open_price:
             self._raise_stop_would_trigger_immediately()
-        if side == "SELL" and stop >= current_open_price:
+        if not is_buy and stop >= current_open_price:
             self._raise_stop_would_trigger_immediately()
 
         # Reserve locked based on side; fail-fast on insufficient free
         base_asset, quote_asset = self._get_assets(symbol)
-        self._ensure_locked_keys(symbol)
         base_total, quote_total = self._get_totals(symbol)
-        if side == "BUY":
+        if is_buy:
             need = qty * stop
-            free_quote = quote_total - self._locked.get(quote_asset, 0.0)
+            free_quote = quote_total - self._locked[quote_asset]
             if free_quote < need:
                 self._raise_insufficient_balance()
             self._locked[quote_asset] += need
         else:  # SELL
-            free_base = base_total - self._locked.get(base_asset, 0.0)
+            free_base = base_total - self._locked[base_asset]
             if free_base < qty:
                 self._raise_insufficient_balance()
             self._locked[base_asset] += qty
 
         # Use current candle timestamp for order creation timestamp
-        # Derive milliseconds robustly from either a Timestamp index value or a positional index
-        if hasattr(self._tick, "to_pydatetime"):
-            tick_dt = self._tick.to_pydatetime()
-            current_time_ms = int(tick_dt.timestamp() * 1000)
-        elif isinstance(self._tick, int):
-            try:
-                index_ts = self._data.index[self._tick]
-                if hasattr(index_ts, "to_pydatetime"):
-                    index_dt = index_ts.to_pydatetime()
-                else:
-                    index_dt = index_ts
-                current_time_ms = int(index_dt.timestamp() * 1000)
-            except Exception:
-                current_time_ms = 0
-        else:
-            # Assume datetime-like
-            current_time_ms = int(self._tick.timestamp() * 1000)
+        current_time_ms = self._tick_ms
         pending_order: dict[str, Any] = {
             "symbol": symbol,
             "orderId": int(order_id),
@@ -555,20 +767,70 @@ class MockBinanceClient:
             "origQuoteOrderQty": "0",
             "selfTradePreventionMode": "NONE",
         }
-        self.pending_orders.append(pending_order)
+        self._pending_by_id[int(order_id)] = pending_order
+        if newClientOrderId:
+            self._pending_by_client_id.setdefault(newClientOrderId, pending_order)
+        self.pending_orders_by_symbol[symbol][int(order_id)] = pending_order
+        self._slot_by_id[int(order_id)] = len(self._slot_orders)
+        self._slot_orders.append(pending_order)
+        self._pending_stops.append(stop, SIDE_BUY if is_buy else SIDE_SELL, qty)
+        if is_buy:
+            heapq.heappush(self._buy_stops_heap, (stop, int(order_id)))
+        else:
+            heapq.heappush(self._sell_stops_heap, (-stop, int(order_id)))
+        self.pending_version += 1
         return pending_order
 
     def _record_filled_order(self, *args: Any, **kwargs: Any):
         """Deprecated: no external DB writes in backtest mock."""
         raise NotImplementedError
 
+    def recent_klines(self, limit: int) -> list[tuple[Any, ...]] | None:
+        """
+        Serve the last ``limit`` klines up to the current tick from the loaded data.
+
+        Rows have the same layout as ``get_klines(endTime=current_time_ms)`` but
+        are sliced from NumPy arrays instead of queried from SQLite. Returns None
+        when the data lacks kline columns or holds fewer than ``limit`` rows up
+        to the tick, so callers can fall back to get_klines.
+        """
+        columns = self._prepare_kline_columns()
+        if columns is None:
+            return None
+        open_ms = columns[0]
+        end = int(np.searchsorted(open_ms, self._tick_ms, side="right"))
+        start = end - limit
+        if start < 0:
+            return None
+        return _binance_kline_rows([column[start:end].tolist() for column in columns])
+
+    def _prepare_kline_columns(self) -> tuple[np.ndarray, ...] | None:
+        """Build the column arrays behind recent_klines once per client."""
+        if self._kline_columns is None:
+            index = self._data.index
+            if not isinstance(index, pd.DatetimeIndex) or not set(
+                _KLINE_ARRAY_COLUMNS
+            ).issubset(self._data.columns):
+                self._kline_columns = ()
+                return None
+            columns = [index.as_unit("ms").asi8]
+            for name in _KLINE_ARRAY_COLUMNS:
+                if name == "close_time":
+                    columns.append(
+                        pd.DatetimeIndex(self._data[name]).as_unit("ms").asi8
+                    )
+                else:
+                    columns.append(self._data[name].to_numpy())
+            self._kline_columns = tuple(columns)
+        return self._kline_columns or None
+
     def get_klines(
         self,
         symbol: str | None = None,
         interval: str | None = None,
         limit: int | None = 500,
         **kwargs: Any,
-    ) -> list[Any]:
+    ) -> list[tuple[Any, ...]]:
         """
         Strict DB passthrough per design.
 
@@ -603,75 +865,41 @@ class MockBinanceClient:
                 # Interpret non-positive as no rows
                 return []
 
+        # Decide ordering and limiting strategy to emulate Binance behavior while returning ASC:
+        # - No start_time: the last `limit` rows up to end_time (or overall), reversed to ASC.
+        # - start_time provided: fetch ASC from start_time, apply end_time if provided, then LIMIT.
+        # Statements come prebuilt per parameter shape.
+        query = _KLINE_QUERIES[
+            (start_time is not None, end_time is not None, limit is not None)
+        ]
         params: list[Any] = [symbol.upper(), interval]
-        base_select = (
-            "SELECT open_time, open_price, high_price, low_price, close_price, volume, close_time, "
-            "quote_asset_volume, number_of_trades, taker_buy_base_asset_volume, taker_buy_quote_asset_volume "
-            "FROM backtest_klines WHERE symbol = ? AND timeframe = ?"
-        )
+        if start_time is not None:
+            params.append(int(start_time))
+        if end_time is not None:
+            params.append(int(end_time))
+        if limit is not None:
+            params.append(limit)
 
-        # Decide ordering and limiting strategy to emulate Binance behavior while returning ASC:
-        # - Only end_time provided (or only limit): choose the last `limit` rows up to end_time (or overall), then return ASC.
-        # - start_time provided (with or without end_time): fetch ASC from start_time, apply end_time if provided, then LIMIT.
-        rows = []
+        with self._db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples, no sqlite3.Row wrapping
+            rows = cursor.execute(query, params).fetchall()
+        if not rows:
+            return []
         if start_time is None:
-            # No start_time: we want the last `limit` rows up to end_time (or overall)
-            where = ""
-            if end_time is not None:
-                where = " AND open_time <= ?"
-                params_q = [*params, int(end_time)]
-            else:
-                params_q = params
-
-            query_desc = f"{base_select}{where} ORDER BY open_time DESC"
-            if limit is not None:
-                query_desc += f" LIMIT {limit}"
-            with self._db_manager.get_connection() as conn:
-                rows = conn.execute(query_desc, tuple(params_q)).fetchall()
-            # Reverse to ASC for return
-            rows = list(rows)[::-1]
-        else:
-            # start_time provided: fetch forward in ASC order
-            where = " AND open_time >= ?"
-            params_q = [*params, int(start_time)]
-            if end_time is not None:
-                where += " AND open_time <= ?"
-                params_q.append(int(end_time))
-            query_asc = f"{base_select}{where} ORDER BY open_time ASC"
-            if limit is not None:
-                query_asc += f" LIMIT {limit}"
-            with self._db_manager.get_connection() as conn:
-                rows = conn.execute(query_asc, tuple(params_q)).fetchall()
-
-        # Map rows to Binance array format (no transformation of values apart from str/int casting)
-        klines_data: list[Any] = []
-        for r in rows:
-            k = [
-                int(r[0]),
-                str(r[1]),
-                str(r[2]),
-                str(r[3]),
-                str(r[4]),
-                str(r[5]),
-                int(r[6]),
-                str(r[7]),
-                int(r[8]),
-                str(r[9]),
-                str(r[10]),
-                "0",
-            ]
-            klines_data.append(k)
-
-        return klines_data
+            rows.reverse()
+
+        # Format column-wise through the same helper as recent_klines
+        return _binance_kline_rows(list(zip(*rows, strict=True)))
 
     def get_open_orders(
         self, symbol: str | None = None, **kwargs: Any
     ) -> list[dict[str, Any]]:
         """Mocks get_open_orders. Returns the list of pending orders."""
-        orders = self.pending_orders
         if symbol:
-            orders = [o for o in orders if o.get("symbol") == symbol.upper()]
-        return orders
+            orders = self.pending_orders_by_symbol.get(symbol.upper())
+            return list(orders.values()) if orders else []
+        return self.pending_orders
 
     def get_all_orders(
         self,
@@ -709,7 +937,7 @@ class MockBinanceClient:
             order_id_filter = None
 
         history = (
-            self._executed_orders_by_symbol[symbol_filter]
+            list(map(itemgetter(1), self._executed_orders_by_symbol[symbol_filter]))
             if symbol_filter
             else self.executed_orders
         )
@@ -741,49 +969,31 @@ class MockBinanceClient:
         symbol = symbol.upper()
         # Find the order to cancel (robust match by int orderId or clientOrderId)
         target = None
-        idx = -1
         int_order_id: int | None = None
         if orderId is not None:
             try:
                 int_order_id = int(orderId)
             except Exception:
                 int_order_id = None
-        for i, order in enumerate(self.pending_orders):
-            oid = order.get("orderId")
-            try:
-                oid_int = int(oid) if oid is not None else None
-            except Exception:
-                oid_int = None
-            if int_order_id is not None and oid_int == int_order_id:
-                target = order
-                idx = i
-                break
-            if (
-                origClientOrderId is not None
-                and order.get("clientOrderId") == origClientOrderId
-            ):
-                target = order
-                idx = i
-                break
+        if int_order_id is not None:
+            target = self._pending_by_id.get(int_order_id)
+        if target is None and origClientOrderId is not None:
+            target = self._pending_by_client_id.get(origClientOrderId)
+        if target is None and origClientOrderId is not None:
+            # Duplicate clientOrderIds are only indexed once; fall back to a scan
+            target = next(
+                (
+                    order
+                    for order in self._pending_by_id.values()
+                    if order.get("clientOrderId") == origClientOrderId
+                ),
+                None,
+            )
         if target is None:
             # In backtest, treat cancel of non-existent order as idempotent no-op
             # to emulate robustness and avoid failing higher-level logic that
             # works with slightly stale snapshots. Return a synthetic canceled order.
-            if hasattr(self._tick, "to_pydatetime"):
-                tick_dt = self._tick.to_pydatetime()
-                update_ms = int(tick_dt.timestamp() * 1000)
-            elif isinstance(self._tick, int):
-                try:
-                    index_ts = self._data.index[self._tick]
-                    if hasattr(index_ts, "to_pydatetime"):
-                        index_dt = index_ts.to_pydatetime()
-                    else:
-                        index_dt = index_ts
-                    update_ms = int(index_dt.timestamp() * 1000)
-                except Exception:
-                    update_ms = 0
-            else:
-                update_ms = int(self._tick.timestamp() * 1000)
+            update_ms = self._tick_ms
             return {
                 "symbol": symbol,
                 "orderId": int_order_id if int_order_id is not None else None,
@@ -798,37 +1008,29 @@ class MockBinanceClient:
                 "updateTime": update_ms,
             }
 
-        # Release locked
+        # Release locked; the order's numbers come from its SoA slot
+        slot = self._slot_by_id.pop(int(target["orderId"]))
         base_asset, quote_asset = self._get_assets(symbol)
-        self._ensure_locked_keys(symbol)
-        qty = float(target["origQty"])
-        stop = float(target.get("stopPrice") or 0)
-        if target.get("side") == "BUY":
-            self._locked[quote_asset] = max(
-                0.0, self._locked.get(quote_asset, 0.0) - qty * stop
+        qty = float(self._pending_stops.quantities[slot])
+        if self._pending_stops.sides[slot] == SIDE_BUY:
+            self._release_locked(
+                quote_asset, qty * float(self._pending_stops.stops[slot])
             )
         else:
-            self._locked[base_asset] = max(0.0, self._locked.get(base_asset, 0.0) - qty)
-
-        # Remove and return
-        cancelled_order = self.pending_orders.pop(idx)
+            self._release_locked(base_asset, qty)
+
+        # Remove and return: O(1) dict pops plus a NaN tombstone in the SoA slot
+        cancelled_order = target
+        self._forget_pending(cancelled_order)
+        self._pending_stops.discard(slot)
+        self._slot_orders[slot] = None
+        # Compact once tombstones make up more than half of the slots
+        if 2 * len(self._pending_by_id) < len(self._slot_orders):
+            self._compact_pending_slots()
+        self.pending_version += 1
         cancelled_order["status"] = "CANCELED"
         # Robustly compute updateTime in ms
-        if hasattr(self._tick, "to_pydatetime"):
-            tick_dt = self._tick.to_pydatetime()
-            update_ms = int(tick_dt.timestamp() * 1000)
-        elif isinstance(self._tick, int):
-            try:
-                index_ts = self._data.index[self._tick]
-                if hasattr(index_ts, "to_pydatetime"):
-                    index_dt = index_ts.to_pydatetime()
-                else:
-                    index_dt = index_ts
-                update_ms = int(index_dt.timestamp() * 1000)
-            except Exception:
-                update_ms = 0
-        else:
-            update_ms = int(self._tick.timestamp() * 1000)
+        update_ms = self._tick_ms
         cancelled_order["updateTime"] = update_ms
         return cancelled_order
 
@@ -839,36 +1041,27 @@ class MockBinanceClient:
             return {"balances": []}
         base_asset, quote_asset = self._get_assets(symbol)
         base_total, quote_total = self._get_totals(symbol)
-        self._ensure_locked_keys(symbol)
-        base_free = base_total - self._locked.get(base_asset, 0.0)
-        quote_free = quote_total - self._locked.get(quote_asset, 0.0)
+        locked = self._locked
+        base_locked = locked[base_asset]
+        quote_locked = locked[quote_asset]
+        # Fixed 8-decimal strings, matching Binance's balance format
         balances = [
             {
                 "asset": base_asset,
-                "free": str(base_free),
-                "locked": str(self._locked.get(base_asset, 0.0)),
+                "free": f"{base_total - base_locked:.8f}",
+                "locked": f"{base_locked:.8f}",
             },
             {
                 "asset": quote_asset,
-                "free": str(quote_free),
-                "locked": str(self._locked.get(quote_asset, 0.0)),
+                "free": f"{quote_total - quote_locked:.8f}",
+                "locked": f"{quote_locked:.8f}",
             },
         ]
         return {"balances": balances}
 
     def get_exchange_info(self) -> dict[str, Any]:
-        """Mocks get_exchange_info with basic precision."""
-        return {
-            "symbols": [
-                {
-                    "symbol": "ADAUSDC",
-                    "baseAssetPrecision": 8,
-                    "quoteAssetPrecision": 8,
-                    "filters": [
-                        {"filterType": "LOT_SIZE", "stepSize": "0.1"},
-                        {"filterType": "PRICE_FILTER", "tickSize": "0.0001"},
-                        {"filterType": "MIN_NOTIONAL", "minNotional": "10.0"},
-                    ],
-                }
-            ]
-        }
+        """Mocks get_exchange_info with basic precision.
+
+        Returns the shared module-level payload; callers must not mutate it.
+        """
+        return _EXCHANGE_INFO
@@ -5,17 +5,67 @@ if __name__ == "__main__" and __package__ is None:
         "请在项目根目录使用 `p -m backtester.strategy` 运行该模块, 无需手动修改 sys.path"
     )
 
-import contextlib
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from types import ModuleType
 from typing import Any
 
+import numpy as np
+import pandas as pd
 from binance.exceptions import BinanceAPIException
 from loguru import logger
 
-# Important: Import the modules to be patched
+# Important: Import the modules to be patched.
+# 全部在模块级绑定一次 (order_builder.app 本身已传递导入它们),
+# 重复实例化策略的参数扫描与逐 tick 调用不再重复执行 import 语句
+import database.crud as crud_module
+import database.symbol_crud as symbol_crud_module
+import database.trading_log_crud as trading_log_crud_module
+import ibkr_api.common as common_module
+import ibkr_api.get_all_orders as get_all_orders_module
+import ibkr_api.get_balance as get_balance_module
+import ibkr_api.get_klines as get_klines_module
+import ibkr_api.get_open_orders as get_open_orders_module
+import indicators.atr.binance_atr as atr_binance_module
+import indicators.demark.binance_demark as demark_binance_module
+import indicators.ema.binance_ema as ema_binance_module
+import indicators.supertrend.binance_supertrend as supertrend_binance_module
+import indicators.td_iven.binance_td_iven as td_iven_binance_module
+import order_builder.app as order_builder_app_module
+import order_builder.calculation as calculation_module
+import order_builder.order.stop_market as stop_market_module
+import order_checker.common as order_checker_common_module
+import order_checker.signal_validation as signal_validation_module
+import shared.async_notifier as async_notifier_module
 from order_builder.app import run_order_builder
 from shared.clock import BacktestClock, override_clock
 
+# 模块级导入了 ibkr_api.get_klines.klines 的模块, 回测时统一替换为截断版本
+_KLINE_PATCH_MODULES: tuple[ModuleType, ...] = (
+    get_klines_module,
+    demark_binance_module,
+    td_iven_binance_module,
+    atr_binance_module,
+    ema_binance_module,
+    supertrend_binance_module,
+)
+# 模块级绑定了 get_configured_client 的模块; 在函数内延迟导入的模块
+# 会直接读取已替换的 ibkr_api.common, 无需列出
+_CLIENT_PATCH_MODULES: tuple[ModuleType, ...] = (
+    ema_binance_module,
+    demark_binance_module,
+    atr_binance_module,
+    order_checker_common_module,
+    supertrend_binance_module,
+    stop_market_module,
+    get_all_orders_module,
+    get_balance_module,
+    get_open_orders_module,
+)
+
+# (symbol, timeframe) -> (symbol_info, timeframe_config, min_notional)
+SymbolMetadataCache = dict[tuple[str, str], tuple[Any, Any, Any]]
+
 
 class Strategy:
     """
@@ -48,13 +98,36 @@ class DemarkStrategy(Strategy):
     function within the backtesting engine.
     """
 
-    def __init__(self, broker, data, mock_client, symbol: str, timeframe: str):
+    def __init__(
+        self,
+        broker,
+        data,
+        mock_client,
+        symbol: str,
+        timeframe: str,
+        metadata_cache: SymbolMetadataCache | None = None,
+    ):
         """Store symbol/timeframe context alongside broker, data and client."""
         super().__init__(broker, data, mock_client)
         self.symbol = symbol.upper()
         self.timeframe = timeframe.lower()
-        # Cache for processed kline times to avoid repeated database queries
+        # 品种元数据缓存由回测运行方持有并传入; 参数扫描复用同一个 dict 时,
+        # 免去每次 init() 的三次数据库查询, 修改交易对配置后由运行方清空
+        self._metadata_cache: SymbolMetadataCache = (
+            {} if metadata_cache is None else metadata_cache
+        )
+        # Cache for processed kline times to avoid repeated database queries:
+        # 回测数据内的 K 线按位置记在布尔位图中, 数据区间外的时间才落入集合
+        index = getattr(data, "index", None)
+        self._kline_open_ms: np.ndarray = (
+            index.as_unit("ms").asi8
+            if isinstance(index, pd.DatetimeIndex)
+            else np.empty(0, dtype=np.int64)
+        )
+        self._processed_mask = np.zeros(len(self._kline_open_ms), dtype=np.bool_)
         self._processed_kline_times: set[int] = set()
+        # 各 K 线开盘时间的 datetime, 首次使用时由索引整体转换一次
+        self._open_datetimes: list[datetime] | None = None
 
     def init(self):
         """
@@ -77,30 +150,19 @@ class DemarkStrategy(Strategy):
 
         if self.tick < 20:
             return
+        if self._signal_kline_processed():
+            return
 
         try:
-            with (
-                override_clock(BacktestClock(self._current_open_datetime())),
-                self._suppress_notifications(),
-            ):
+            # 通知副作用已在 init() 中一次性关闭, 每个 tick 只需覆盖时钟
+            with override_clock(BacktestClock(self._current_open_datetime())):
                 result = run_order_builder(
                     symbol=self.data.name, timeframe=self.timeframe
                 )
-                # Record processed K-line if order was placed successfully
-                if hasattr(result, "order_id") and result.order_id:
-                    # Extract K-line time from signal klines
-                    try:
-                        from indicators.demark.binance_demark import (
-                            demark_with_ibkr_api,
-                        )
-
-                        _, _, _, signal_klines = demark_with_ibkr_api(
-                            self.data.name, self.timeframe
-                        )
-                        kline_time = int(signal_klines[-1]["open_time"])
-                        self._record_processed_kline(kline_time)
-                    except Exception:
-                        pass
+                # Record processed K-line if order was placed successfully;
+                # the result carries the signal kline time, no indicator re-run
+                if result["action"] == "ORDER_PLACED":
+                    self._record_processed_kline(result["kline_time"])
         except (ValueError, BinanceAPIException):
             # Suppress expected business validation errors and API errors
             pass
@@ -112,37 +174,20 @@ class DemarkStrategy(Strategy):
 
     def _inject_mock_client(self) -> Callable[[], Any]:
         """Replace the global client getter so strategy code uses mock client."""
-        import ibkr_api.common as common_module
 
         def get_mock_client() -> Any:
             return self.mock_client
 
-        with contextlib.suppress(Exception):
-            common_module._client_cache = self.mock_client  # type: ignore[attr-defined]
+        # 模块属性赋值不会失败, 无需 suppress 包裹
+        common_module._client_cache = self.mock_client  # type: ignore[attr-defined]
         common_module.get_configured_client = get_mock_client
         return get_mock_client
 
     def _patch_klines(self) -> None:
         """Ensure all kline helpers respect the mock client's current tick."""
-        import ibkr_api.get_klines as get_klines_module
-        import indicators.atr.binance_atr as atr_binance_module
-        import indicators.demark.binance_demark as demark_binance_module
-        import indicators.ema.binance_ema as ema_binance_module
-        import indicators.supertrend.binance_supertrend as supertrend_binance_module
-        import indicators.td_iven.binance_td_iven as td_iven_binance_module
-
         patched = self._patched_klines
-        get_klines_module.klines = patched
-        if hasattr(demark_binance_module, "klines"):
-            demark_binance_module.klines = patched
-        if hasattr(td_iven_binance_module, "klines"):
-            td_iven_binance_module.klines = patched
-        if hasattr(atr_binance_module, "klines"):
-            atr_binance_module.klines = patched
-        if hasattr(ema_binance_module, "klines"):
-            ema_binance_module.klines = patched
-        if hasattr(supertrend_binance_module, "klines"):
-            supertrend_binance_module.klines = patched
+        for module in _KLINE_PATCH_MODULES:
+            module.klines = patched  # type: ignore[attr-defined]
 
     def _patched_klines(
         self,
@@ -152,29 +197,29 @@ class DemarkStrategy(Strategy):
         limit: int = 100,
     ) -> list[dict[str, object]]:
         """Adapter for klines that truncates history to the active backtest tick."""
+        symbol = symbol.upper()
+        # 回测自身的交易对与周期: 直接切片已加载的数据, 不足 limit 根时回退到数据库
+        recent_klines = getattr(client, "recent_klines", None)
+        if (
+            recent_klines is not None
+            and symbol == self.symbol
+            and interval.lower() == self.timeframe
+        ):
+            raw_klines = recent_klines(int(limit))
+            if raw_klines is not None:
+                return [self._format_kline_row(kline) for kline in raw_klines]
         end_ms = self._derive_end_timestamp()
         kwargs = {"endTime": end_ms} if end_ms is not None else {}
         raw_klines = client.get_klines(
-            symbol=symbol.upper(), interval=interval, limit=limit, **kwargs
+            symbol=symbol, interval=interval, limit=limit, **kwargs
         )
         return [self._format_kline_row(kline) for kline in raw_klines]
 
     def _derive_end_timestamp(self) -> int | None:
         """Compute the endTime parameter based on the mock client's tick pointer."""
-        tick = getattr(self.mock_client, "_tick", None)
-        try:
-            if hasattr(tick, "to_pydatetime"):
-                return int(tick.to_pydatetime().timestamp() * 1000)
-            if isinstance(tick, int):
-                index_ts = self.data.index[tick]
-                if hasattr(index_ts, "to_pydatetime"):
-                    return int(index_ts.to_pydatetime().timestamp() * 1000)
-                return int(index_ts.timestamp() * 1000)
-            if tick is not None:
-                return int(tick.timestamp() * 1000)
-        except Exception:
-            return None
-        return None
+        # 毫秒时间戳统一由 MockBinanceClient.update_tick 解析, 策略不再自行换算,
+        # 保证 endTime 与模拟交易所的订单时间一致
+        return getattr(self.mock_client, "current_time_ms", None)
 
     def _format_kline_row(self, kline: Sequence[object]) -> dict[str, object]:
         """Convert raw kline arrays to dict shape consumed by strategy helpers."""
@@ -194,46 +239,11 @@ class DemarkStrategy(Strategy):
 
     def _patch_client_consumers(self, mock_getter: Callable[[], Any]) -> None:
         """Rebind helper modules that cached the real get_configured_client."""
-        import ibkr_api.cancel_order as cancel_order_module
-        import ibkr_api.get_account as get_account_module
-        import ibkr_api.get_all_orders
-        import ibkr_api.get_balance as get_balance_module
-        import ibkr_api.get_exchange_info as get_exchange_info_module
-        import ibkr_api.get_open_orders as get_open_orders_module
-        import ibkr_api.get_symbol_ticker as get_symbol_ticker_module
-        import indicators.atr.binance_atr as atr_binance_module
-        import indicators.demark.binance_demark
-        import indicators.ema.binance_ema as ema_binance_module
-        import indicators.supertrend.binance_supertrend
-        import order_builder.order.stop_market as stop_market_module
-        import order_checker.common
-
-        modules_to_patch = (
-            ema_binance_module,
-            indicators.demark.binance_demark,
-            atr_binance_module,
-            order_checker.common,
-            indicators.supertrend.binance_supertrend,
-            stop_market_module,
-            ibkr_api.get_all_orders,
-            get_balance_module,
-            get_account_module,
-            get_symbol_ticker_module,
-            get_open_orders_module,
-            cancel_order_module,
-            get_exchange_info_module,
-        )
-        for module in modules_to_patch:
-            if hasattr(module, "get_configured_client"):
-                module.get_configured_client = mock_getter  # type: ignore[assignment]
-
-        with contextlib.suppress(Exception):
-            get_balance_module.get_configured_client()
+        for module in _CLIENT_PATCH_MODULES:
+            module.get_configured_client = mock_getter  # type: ignore[attr-defined]
 
     def _disable_async_notifications(self) -> None:
         """Silence async notifier side-effects during backtests."""
-        import database.trading_log_crud as trading_log_crud_module
-        import shared.async_notifier as async_notifier_module
 
         def _noop(*_: object, **__: object) -> None:
             return None
@@ -247,13 +257,6 @@ class DemarkStrategy(Strategy):
     def _cache_symbol_metadata(self) -> None:
         """Cache frequently accessed symbol information for repeated calls."""
         try:
-            import database.crud as crud_module
-            import database.symbol_crud as symbol_crud_module
-            import order_builder.app as order_builder_app_module
-            import order_builder.calculation as calculation_module
-            import order_checker.common
-            import order_checker.signal_validation as signal_validation_module
-
             original_get_symbol_info = crud_module.get_symbol_info
             original_get_symbol_timeframe_config = (
                 crud_module.get_symbol_timeframe_config
@@ -262,11 +265,16 @@ class DemarkStrategy(Strategy):
                 symbol_crud_module.get_validated_min_notional
             )
 
-            cached_symbol_info = original_get_symbol_info(self.symbol)
-            cached_tf_config = original_get_symbol_timeframe_config(
-                self.symbol, self.timeframe
-            )
-            cached_min_notional = original_get_validated_min_notional(self.symbol)
+            key = (self.symbol, self.timeframe)
+            metadata = self._metadata_cache.get(key)
+            if metadata is None:
+                metadata = (
+                    original_get_symbol_info(self.symbol),
+                    original_get_symbol_timeframe_config(self.symbol, self.timeframe),
+                    original_get_validated_min_notional(self.symbol),
+                )
+                self._metadata_cache[key] = metadata
+            cached_symbol_info, cached_tf_config, cached_min_notional = metadata
 
             def cached_get_symbol_info(symbol: str):
                 if symbol.upper() == self.symbol:
@@ -309,7 +317,7 @@ class DemarkStrategy(Strategy):
                 cached_get_symbol_timeframe_config
             )
 
-            order_checker.common.get_symbol_info = cached_get_symbol_info
+            order_checker_common_module.get_symbol_info = cached_get_symbol_info
 
         except Exception:  # pragma: no cover - best effort fallback
             return None
@@ -322,8 +330,6 @@ class DemarkStrategy(Strategy):
         successfully completes and places an order, we add the K-line time to the cache.
         """
         try:
-            import database.trading_log_crud as trading_log_crud_module
-
             original_check = trading_log_crud_module.check_kline_already_processed
 
             def cached_check(symbol: str, timeframe: str, kline_time: int) -> bool:
@@ -332,76 +338,74 @@ class DemarkStrategy(Strategy):
                     return original_check(symbol, timeframe, kline_time)
 
                 # Return cached result if available
-                return kline_time in self._processed_kline_times
+                return self._is_kline_processed(kline_time)
 
             # Replace the function with cached version
             trading_log_crud_module.check_kline_already_processed = cached_check
 
-            # Also replace in order_builder module if it's already imported
-            try:
-                import order_builder.app as order_builder_app_module
-
-                order_builder_app_module.check_kline_already_processed = cached_check
-            except Exception:
-                pass
+            # Also replace the name order_builder.app bound at import time
+            order_builder_app_module.check_kline_already_processed = cached_check
 
         except Exception:  # pragma: no cover - best effort fallback
             return None
 
     def _record_processed_kline(self, kline_time: int) -> None:
         """Record a successfully processed K-line to prevent re-processing."""
-        self._processed_kline_times.add(kline_time)
+        position = self._kline_position(kline_time)
+        if position is None:
+            self._processed_kline_times.add(kline_time)
+        else:
+            self._processed_mask[position] = True
+
+    def _is_kline_processed(self, kline_time: int) -> bool:
+        """Check the processed bitmap, or the overflow set for out-of-range times."""
+        position = self._kline_position(kline_time)
+        if position is None:
+            return kline_time in self._processed_kline_times
+        return bool(self._processed_mask[position])
+
+    def _kline_position(self, kline_time: int) -> int | None:
+        """Return the data row whose open time equals ``kline_time``, if any."""
+        open_ms = self._kline_open_ms
+        position = int(np.searchsorted(open_ms, kline_time))
+        if position < len(open_ms) and open_ms[position] == kline_time:
+            return position
+        return None
 
     def _current_open_datetime(self):
         """Return datetime corresponding to the current mock tick."""
-        tick = getattr(self.mock_client, "_tick", None)
-        try:
-            if hasattr(tick, "to_pydatetime"):
-                return tick.to_pydatetime()
-            if isinstance(tick, int):
-                index_value = self.data.index[tick]
-            else:
-                index_value = tick or self.data.index[-1]
-            if hasattr(index_value, "to_pydatetime"):
-                return index_value.to_pydatetime()
-            return index_value
-        except Exception:
-            fallback = self.data.index[-1]
-            return (
-                fallback.to_pydatetime()
-                if hasattr(fallback, "to_pydatetime")
-                else fallback
-            )
-
-    @contextlib.contextmanager
-    def _suppress_notifications(self) -> Iterator[None]:
-        """Temporarily disable trading log side-effects while executing a tick."""
-        try:
-            import database.trading_log_crud as trading_log_crud_module
-        except Exception:
-            yield
-            return
+        # 与 endTime 共用同一毫秒时间戳解析, 免去逐 tick 的类型探测
+        current_time_ms = self._derive_end_timestamp()
+        if current_time_ms is None:
+            return self.data.index[-1].to_pydatetime()
+        position = self._current_position(current_time_ms)
+        if position is None:
+            return datetime.fromtimestamp(current_time_ms / 1000, tz=UTC)
+        if self._open_datetimes is None:
+            self._open_datetimes = self.data.index.to_pydatetime().tolist()
+        return self._open_datetimes[position]
+
+    def _signal_kline_processed(self) -> bool:
+        """Whether this tick's signal kline is already marked processed.
+
+        The signal kline is the last completed bar, one row before the tick.
+        run_order_builder would only read klines and then return
+        KLINE_ALREADY_PROCESSED for it, so next() can skip the call.
+        """
+        current_time_ms = self._derive_end_timestamp()
+        if current_time_ms is None:
+            return False
+        position = self._current_position(current_time_ms)
+        return bool(position and self._processed_mask[position - 1])
 
-        orig_created = getattr(
-            trading_log_crud_module, "publish_trading_log_event", None
-        )
-        orig_updated = getattr(
-            trading_log_crud_module, "publish_trading_log_updated", None
-        )
-        orig_requests = getattr(trading_log_crud_module, "requests", None)
+    def _current_position(self, current_time_ms: int) -> int | None:
+        """Return the data row of the current tick.
 
-        trading_log_crud_module.publish_trading_log_event = (  # type: ignore[assignment]
-            lambda *_args, **_kwargs: None
-        )
-        trading_log_crud_module.publish_trading_log_updated = None  # type: ignore[assignment]
-        trading_log_crud_module.requests = None  # type: ignore[assignment]
-        try:
-            yield
-        finally:
-            if orig_created is not None:
-                trading_log_crud_module.publish_trading_log_event = orig_created  # type: ignore[assignment]
-            if orig_updated is not None or hasattr(
-                trading_log_crud_module, "publish_trading_log_updated"
-            ):
-                trading_log_crud_module.publish_trading_log_updated = orig_updated  # type: ignore[assignment]
-            trading_log_crud_module.requests = orig_requests  # type: ignore[assignment]
+        The engine calls next() once per bar, so the row is normally
+        ``tick - 1``; otherwise it is looked up by open time.
+        """
+        position = self.tick - 1
+        open_ms = self._kline_open_ms
+        if 0 <= position < len(open_ms) and open_ms[position] == current_time_ms:
+            return position
+        return self._kline_position(current_time_ms)
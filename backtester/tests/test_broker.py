@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for package imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pytest
+
+from backtester.broker import Broker
+
+
+def test_portfolio_value_single_symbol():
+    broker = Broker(initial_cash=100.0)
+    broker.buy("ADAUSDC", 10, 5.0)
+
+    assert broker.cash == pytest.approx(50.0)
+    assert broker.positions["ADAUSDC"] == pytest.approx(10.0)
+    assert broker.get_portfolio_value({"ADAUSDC": 6.0}) == pytest.approx(110.0)
+
+
+def test_portfolio_value_multiple_symbols_ignores_short_and_unpriced():
+    broker = Broker(initial_cash=100.0)
+    broker.positions["ADAUSDC"] = 10.0
+    broker.positions["BTCUSDC"] = -1.0
+    broker.positions["ETHUSDC"] = 2.0
+
+    value = broker.get_portfolio_value({"ADAUSDC": 2.0, "BTCUSDC": 50.0})
+
+    assert value == pytest.approx(120.0)
+
+
+def test_sell_rejects_quantity_above_position():
+    broker = Broker(initial_cash=100.0)
+    broker.positions["ADAUSDC"] = 1.0
+
+    broker.sell("ADAUSDC", 2.0, 5.0)
+    broker.sell("BTCUSDC", 1.0, 5.0)
+
+    assert broker.cash == pytest.approx(100.0)
+    assert broker.positions["ADAUSDC"] == pytest.approx(1.0)
+    assert "BTCUSDC" not in broker.positions
+
+
+def test_second_symbol_leaves_single_symbol_fast_path():
+    broker = Broker(initial_cash=100.0)
+    broker.buy("ADAUSDC", 10, 2.0)
+    broker.sell("ADAUSDC", 4, 2.5)
+    assert broker.position("ADAUSDC") == pytest.approx(6.0)
+
+    broker.buy("BTCUSDC", 1, 50.0)
+
+    assert dict(broker.positions) == pytest.approx({"ADAUSDC": 6.0, "BTCUSDC": 1.0})
+    value = broker.get_portfolio_value({"ADAUSDC": 3.0, "BTCUSDC": 60.0})
+    assert value == pytest.approx(40.0 + 18.0 + 60.0)
+    assert broker.position("ETHUSDC") == 0.0
+    assert "ETHUSDC" not in broker.positions
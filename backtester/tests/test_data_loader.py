@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for package imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pytest
+
+import backtester.data_loader as data_loader
+from database.connection import DatabaseConfig, DatabaseManager
+from database.schema import CREATE_BACKTEST_KLINES_TABLE
+
+
+@pytest.fixture
+def db_manager(monkeypatch, tmp_path):
+    manager = DatabaseManager(DatabaseConfig(db_path=tmp_path / "klines.db"))
+    with manager.transaction() as conn:
+        conn.execute(CREATE_BACKTEST_KLINES_TABLE)
+    monkeypatch.setattr(data_loader, "get_db_manager", lambda: manager)
+    data_loader.clear_klines_cache()
+    yield manager
+    data_loader.clear_klines_cache()
+    manager.close()
+
+
+def _insert_klines(manager: DatabaseManager, rows: list[tuple]) -> None:
+    with manager.transaction() as conn:
+        conn.executemany(
+            """
+            INSERT INTO backtest_klines (
+                symbol, timeframe, open_time, open_price, high_price, low_price,
+                close_price, volume, close_time, quote_asset_volume, number_of_trades,
+                taker_buy_base_asset_volume, taker_buy_quote_asset_volume
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+
+def test_load_klines_types_and_window(db_manager):
+    _insert_klines(
+        db_manager,
+        [
+            (
+                "ADAUSDC",
+                "1m",
+                60_000 * i,
+                "1.5",
+                "1.7",
+                "1.4",
+                "1.6",
+                "10",
+                60_000 * i + 59_999,
+                "16",
+                3,
+                "5",
+                "8",
+            )
+            for i in range(4)
+        ],
+    )
+
+    df = data_loader.load_klines_to_dataframe(
+        "ADAUSDC", "1m", start_ts=60_000, end_ts=120_000
+    )
+
+    assert len(df) == 2
+    assert str(df.index.tz) == "UTC"
+    assert df.index[0].value // 1_000_000 == 60_000
+    for column in ("open", "high", "low", "close", "volume"):
+        assert df[column].dtype == "float64"
+    assert df["close"].iloc[0] == pytest.approx(1.6)
+    assert str(df["close_time"].dt.tz) == "UTC"
+
+
+def test_load_klines_reuses_cached_frame(monkeypatch, db_manager):
+    _insert_klines(
+        db_manager,
+        [("ADAUSDC", "1m", 0, 1.5, 1.7, 1.4, 1.6, 10, 59_999, 16, 3, 5, 8)],
+    )
+    first = data_loader.load_klines_to_dataframe("ADAUSDC", "1m")
+
+    def _fail():
+        raise AssertionError("cached load must not touch the database")
+
+    monkeypatch.setattr(data_loader, "get_db_manager", _fail)
+    second = data_loader.load_klines_to_dataframe("ADAUSDC", "1m")
+
+    assert second is not first
+    assert second.equals(first)
+    second["close"] = 0.0
+    second.iloc[0, second.columns.get_loc("open")] = 0.0
+    reloaded = data_loader.load_klines_to_dataframe("ADAUSDC", "1m")
+    assert reloaded["close"].iloc[0] == 1.6
+    assert reloaded["open"].iloc[0] == 1.5
+
+
+def test_load_klines_empty(db_manager):
+    df = data_loader.load_klines_to_dataframe("ADAUSDC", "1m")
+
+    assert df.empty
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for package imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from backtester import kernels
+
+
+def test_loop_kernels_match_vectorized_versions():
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        size = int(rng.integers(0, 20))
+        stops = rng.uniform(0.0, 10.0, size)
+        sides = rng.integers(0, 2, size).astype(np.int8)
+        high = float(rng.uniform(5.0, 10.0))
+        low = float(rng.uniform(0.0, 5.0))
+        np.testing.assert_array_equal(
+            kernels._scan_stop_triggers_loop(stops, sides, high, low),
+            kernels._scan_stop_triggers(stops, sides, high, low),
+        )
+
+        highs = rng.uniform(5.0, 10.0, 16)
+        lows = rng.uniform(0.0, 5.0, 16)
+        for buy_stop, sell_stop in ((9.5, 0.5), (np.inf, -np.inf), (11.0, 4.0)):
+            assert kernels._first_trigger_offset_loop(
+                highs, lows, buy_stop, sell_stop
+            ) == kernels._first_trigger_offset(highs, lows, buy_stop, sell_stop)
+
+
+def test_compiled_kernels_on_known_bar():
+    stops = np.array([5.0, 3.8, 7.0, 5.5], dtype=np.float64)
+    sides = np.array(
+        [kernels.SIDE_BUY, kernels.SIDE_SELL, kernels.SIDE_BUY, kernels.SIDE_SELL],
+        dtype=np.int8,
+    )
+
+    assert kernels.scan_stop_triggers(stops, sides, 6.2, 5.0).tolist() == [0, 3]
+    highs = np.array([4.0, 4.5, 6.0])
+    lows = np.array([3.9, 4.1, 5.0])
+    assert kernels.first_trigger_offset(highs, lows, 5.0, 3.8) == 2
+    assert kernels.first_trigger_offset(highs, lows, np.inf, -np.inf) == -1
@@ -0,0 +1,136 @@
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+# Ensure project root on sys.path for package imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pytest
+
+import backtester.data_loader as data_loader
+import backtester.klines_syncer as klines_syncer
+from database.connection import DatabaseConfig, DatabaseManager
+from database.schema import CREATE_BACKTEST_KLINES_TABLE
+
+
+def _kline(open_time: int) -> list:
+    return [
+        open_time,
+        "1.5",
+        "1.7",
+        "1.4",
+        "1.6",
+        "10",
+        open_time + 59_999,
+        "16",
+        3,
+        "5",
+        "8",
+        "0",
+    ]
+
+
+class _PagedClient:
+    def __init__(self, pages: list[list[list]]):
+        self._pages = pages
+        self.calls: list[int] = []
+
+    def get_klines(self, symbol, interval, limit, startTime):
+        self.calls.append(startTime)
+        return self._pages.pop(0) if self._pages else []
+
+
+class _WindowClient:
+    def __init__(self, open_times: list[int]):
+        self._open_times = open_times
+        self.windows: list[tuple[int, int]] = []
+        self._lock = threading.Lock()
+
+    def get_klines(self, symbol, interval, limit, startTime, endTime):
+        with self._lock:
+            self.windows.append((startTime, endTime))
+        return [_kline(t) for t in self._open_times if startTime <= t <= endTime]
+
+
+@pytest.fixture
+def db_manager(monkeypatch, tmp_path):
+    manager = DatabaseManager(DatabaseConfig(db_path=tmp_path / "klines.db"))
+    with manager.transaction() as conn:
+        conn.execute(CREATE_BACKTEST_KLINES_TABLE)
+    monkeypatch.setattr(klines_syncer, "get_db_manager", lambda: manager)
+    yield manager
+    manager.close()
+
+
+def test_sync_klines_saves_all_pages(monkeypatch, db_manager):
+    client = _PagedClient([[_kline(0), _kline(60_000)], [_kline(120_000)]])
+    monkeypatch.setattr(klines_syncer, "get_configured_client", lambda: client)
+
+    klines_syncer.sync_klines("ADAUSDC", "1m", 0, throttle=False, workers=1)
+
+    rows = db_manager.execute_query(
+        "SELECT open_time, close_price FROM backtest_klines ORDER BY open_time"
+    )
+    assert [row["open_time"] for row in rows] == [0, 60_000, 120_000]
+    assert client.calls == [0, 60_000, 120_000]
+    assert klines_syncer.get_latest_kline_timestamp("ADAUSDC", "1m") == 120_000
+
+
+def test_sync_klines_fetches_windows_concurrently(monkeypatch, db_manager):
+    span = klines_syncer.PAGE_LIMIT * 60_000
+    open_times = [0, 60_000, span, span + 60_000, 2 * span]
+    client = _WindowClient(open_times)
+    monkeypatch.setattr(klines_syncer, "get_configured_client", lambda: client)
+    monkeypatch.setattr(klines_syncer.time, "time", lambda: (2 * span + 1) / 1000)
+
+    klines_syncer.sync_klines("ADAUSDC", "1m", 0, throttle=False, workers=3)
+
+    rows = db_manager.execute_query(
+        "SELECT open_time FROM backtest_klines ORDER BY open_time"
+    )
+    assert [row["open_time"] for row in rows] == open_times
+    assert sorted(client.windows) == [
+        (0, span - 1),
+        (span, 2 * span - 1),
+        (2 * span, 3 * span - 1),
+    ]
+
+
+def test_sync_klines_invalidates_loaded_frames(monkeypatch, db_manager):
+    monkeypatch.setattr(data_loader, "get_db_manager", lambda: db_manager)
+    data_loader.clear_klines_cache()
+    klines_syncer.save_klines_to_db([_kline(0)], "ADAUSDC", "1m")
+    assert len(data_loader.load_klines_to_dataframe("ADAUSDC", "1m")) == 1
+
+    client = _PagedClient([[_kline(60_000)]])
+    monkeypatch.setattr(klines_syncer, "get_configured_client", lambda: client)
+    klines_syncer.sync_klines("ADAUSDC", "1m", 0, throttle=False, workers=1)
+
+    assert len(data_loader.load_klines_to_dataframe("ADAUSDC", "1m")) == 2
+    data_loader.clear_klines_cache()
+
+
+def test_sync_klines_does_not_hold_write_lock_while_fetching(monkeypatch, db_manager):
+    db_path = db_manager.config.db_path
+    lock_free: list[bool] = []
+
+    class _CheckingClient(_PagedClient):
+        def get_klines(self, symbol, interval, limit, startTime):
+            # 另一个写入方在拉取期间应能立即拿到写锁
+            other = sqlite3.connect(db_path, timeout=0)
+            try:
+                other.execute("BEGIN IMMEDIATE")
+                other.rollback()
+                lock_free.append(True)
+            finally:
+                other.close()
+            return super().get_klines(symbol, interval, limit, startTime)
+
+    client = _CheckingClient([[_kline(0), _kline(60_000)], [_kline(120_000)]])
+    monkeypatch.setattr(klines_syncer, "get_configured_client", lambda: client)
+
+    klines_syncer.sync_klines("ADAUSDC", "1m", 0, throttle=False, workers=1)
+
+    assert lock_free == [True, True, True]
+    assert klines_syncer.get_latest_kline_timestamp("ADAUSDC", "1m") == 120_000
@@ -1,3 +1,4 @@
+import math
 import sys
 from pathlib import Path
 
@@ -63,6 +64,7 @@ def test_stop_loss_buy_fill_next_tick(monkeypatch, sample_data):
     ada = next(b for b in acct["balances"] if b["asset"] == "ADA")
     assert usdc["free"] == "100.0" or float(usdc["free"]) == 100.0
     assert float(ada["free"]) == 0.0
+    assert usdc["locked"] == "0.00000000"
 
     # Place STOP_LOSS BUY qty=10 at stop=5 (reserve 50 USDC)
     order = client.create_order(
@@ -157,3 +159,395 @@ def test_reject_stop_that_would_trigger_immediately(monkeypatch, sample_data):
         )
     assert "Stop price would trigger immediately" in str(excinfo.value)
     assert len(client.pending_orders) == 0
+
+
+def test_reject_unknown_side(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+    client.update_tick(sample_data.index[0])
+
+    with pytest.raises(ValueError, match="Unsupported order side"):
+        client.create_order(
+            symbol="ADAUSDC", side="HOLD", type="STOP_LOSS", quantity="1", stopPrice="9"
+        )
+    assert client.pending_orders == []
+
+
+def test_only_crossed_stops_fill(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    broker = Broker(initial_cash=100.0)
+    broker.positions["ADAUSDC"] = 10.0
+    client = MockBinanceClient(broker, sample_data)
+
+    client.update_tick(sample_data.index[1])
+    assert client.current_time_ms == int(sample_data.index[1].timestamp() * 1000)
+    sell = client.create_order(
+        symbol="ADAUSDC", side="SELL", type="STOP_LOSS", quantity="2", stopPrice="5.2"
+    )
+    untouched = client.create_order(
+        symbol="ADAUSDC", side="BUY", type="STOP_LOSS", quantity="1", stopPrice="9"
+    )
+    assert client.trigger_bounds() == (9.0, 5.2)
+
+    client.process_pending_orders_now()
+    assert client.trigger_bounds() == (9.0, -math.inf)
+
+    assert [o["orderId"] for o in client.pending_orders] == [untouched["orderId"]]
+    assert client.get_open_orders(symbol="adausdc") == [untouched]
+    assert client.get_open_orders(symbol="BTCUSDC") == []
+    filled = client.get_all_orders(symbol="ADAUSDC")
+    assert [o["orderId"] for o in filled] == [sell["orderId"]]
+    assert pytest.approx(broker.positions["ADAUSDC"]) == 8.0
+
+    # Cancelling keeps the remaining pending order set consistent
+    client.cancel_order(symbol="ADAUSDC", orderId=untouched["orderId"])
+    assert client.trigger_bounds() == (math.inf, -math.inf)
+    client.update_tick(sample_data.index[2])
+    client.process_pending_orders_now()
+    assert client.pending_orders == []
+    assert client.get_open_orders(symbol="ADAUSDC") == []
+    assert len(client.get_all_orders(symbol="ADAUSDC")) == 1
+
+
+def test_executed_history_merges_symbols_and_trims_window(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+    day_ms = 24 * 60 * 60 * 1000
+
+    client._store_executed_order({"orderId": 1, "symbol": "ADAUSDC"}, 0)
+    client._store_executed_order({"orderId": 2, "symbol": "BTCUSDC"}, 10)
+    client._store_executed_order({"orderId": 3, "symbol": "ADAUSDC"}, 20)
+    assert [o["orderId"] for o in client.executed_orders] == [1, 2, 3]
+    assert [o["orderId"] for o in client.get_all_orders(symbol="ADAUSDC")] == [1, 3]
+
+    client._store_executed_order({"orderId": 4, "symbol": "ADAUSDC"}, day_ms + 5)
+    assert [o["orderId"] for o in client.get_all_orders(symbol="ADAUSDC")] == [3, 4]
+    assert [o["orderId"] for o in client.get_all_orders()] == [2, 3, 4]
+
+
+def test_pending_stop_buffer_stays_aligned_past_initial_capacity(
+    monkeypatch, sample_data
+):
+    patch_symbol_info(monkeypatch)
+    broker = Broker(initial_cash=100.0)
+    broker.positions["ADAUSDC"] = 100.0
+    client = MockBinanceClient(broker, sample_data)
+
+    client.update_tick(sample_data.index[1])
+    orders = [
+        client.create_order(
+            symbol="ADAUSDC",
+            side="SELL",
+            type="STOP_LOSS",
+            quantity="1",
+            stopPrice=str(round(1.0 + 0.2 * i, 1)),
+        )
+        for i in range(20)
+    ]
+    client.cancel_order(symbol="ADAUSDC", orderId=orders[15]["orderId"])
+
+    # low=3.5 crosses the stops at 3.6 .. 4.8 except the cancelled 4.0
+    client.update_tick(sample_data.index[0])
+    client.process_pending_orders_now()
+
+    assert [o["orderId"] for o in client.pending_orders] == [
+        o["orderId"] for o in orders[:13]
+    ]
+    assert client._pending_stops.stops.tolist() == [
+        float(o["stopPrice"]) for o in client.pending_orders
+    ]
+    assert pytest.approx(broker.positions["ADAUSDC"]) == 94.0
+
+
+def test_cancelled_slots_are_compacted_and_never_trigger(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    broker = Broker(initial_cash=100.0)
+    broker.positions["ADAUSDC"] = 100.0
+    client = MockBinanceClient(broker, sample_data)
+
+    client.update_tick(sample_data.index[1])
+    orders = [
+        client.create_order(
+            symbol="ADAUSDC",
+            side="SELL",
+            type="STOP_LOSS",
+            quantity="1",
+            stopPrice=str(4.0 + 0.4 * i),
+        )
+        for i in range(4)
+    ]
+    client.cancel_order(symbol="ADAUSDC", orderId=orders[3]["orderId"])
+    assert client._pending_stops.size == 4  # tombstoned, not shifted
+    client.cancel_order(symbol="ADAUSDC", orderId=orders[1]["orderId"])
+    client.cancel_order(symbol="ADAUSDC", orderId=orders[2]["orderId"])
+
+    assert client._pending_stops.stops.tolist() == [4.0]
+    assert client.get_open_orders(symbol="ADAUSDC") == [orders[0]]
+
+    # low=3.5 would have crossed every cancelled stop as well
+    client.update_tick(sample_data.index[0])
+    client.process_pending_orders_now()
+
+    assert client.pending_orders == []
+    assert pytest.approx(broker.positions["ADAUSDC"]) == 99.0
+
+
+def test_symbol_info_is_read_once_per_symbol(monkeypatch, sample_data):
+    import backtester.mock_client as mc
+
+    calls: list[str] = []
+
+    def _counting_get_symbol_info(symbol: str):
+        calls.append(symbol)
+        return SimpleNamespace(base_asset="ADA", quote_asset="USDC")
+
+    monkeypatch.setattr(mc, "get_symbol_info", _counting_get_symbol_info)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+    client.update_tick(sample_data.index[0])
+
+    order = client.create_order(
+        symbol="ADAUSDC", side="BUY", type="STOP_LOSS", quantity="1", stopPrice="9"
+    )
+    client.get_account()
+    client.cancel_order(symbol="ADAUSDC", orderId=order["orderId"])
+
+    assert calls == ["ADAUSDC"]
+
+
+def test_symbol_ticker_is_reused_within_a_tick(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+
+    client.update_tick(sample_data.index[0])
+    first = client.get_symbol_ticker(symbol="ADAUSDC")
+    assert first == {"symbol": "ADAUSDC", "price": "4.2"}
+    assert client.get_symbol_ticker(symbol="ADAUSDC") is first
+
+    client.update_tick(sample_data.index[1])
+    assert client.get_symbol_ticker(symbol="ADAUSDC") == {
+        "symbol": "ADAUSDC",
+        "price": "6.0",
+    }
+    assert first["price"] == "4.2"
+
+
+def test_prices_read_first_row_before_first_tick(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+
+    assert client.get_symbol_ticker(symbol="ADAUSDC")["price"] == "4.2"
+    client.process_pending_orders_now()
+
+
+def test_cancel_by_client_order_id_matches_earliest_pending(monkeypatch, sample_data):
+    patch_symbol_info(monkeypatch)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+    client.update_tick(sample_data.index[0])
+
+    first, second = (
+        client.create_order(
+            symbol="ADAUSDC",
+            side="BUY",
+            type="STOP_LOSS",
+            quantity="1",
+            stopPrice=stop,
+            newClientOrderId="5m",
+        )
+        for stop in ("9", "10")
+    )
+
+    assert client.cancel_order("ADAUSDC", origClientOrderId="5m") is first
+    assert client.cancel_order("ADAUSDC", origClientOrderId="5m") is second
+    assert client.pending_orders == []
+    assert client.trigger_bounds() == (math.inf, -math.inf)
+
+
+def test_get_klines_windows_and_binance_row_shape(monkeypatch, tmp_path, sample_data):
+    import backtester.mock_client as mc
+    from database.connection import DatabaseConfig, DatabaseManager
+    from database.schema import CREATE_BACKTEST_KLINES_TABLE
+
+    manager = DatabaseManager(DatabaseConfig(db_path=tmp_path / "klines.db"))
+    with manager.transaction() as conn:
+        conn.execute(CREATE_BACKTEST_KLINES_TABLE)
+        conn.executemany(
+            "INSERT INTO backtest_klines VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    "ADAUSDC",
+                    "1m",
+                    t,
+                    1.5,
+                    1.7,
+                    1.4,
+                    1.6,
+                    10.0,
+                    t + 59_999,
+                    16.0,
+                    3,
+                    5.0,
+                    8.0,
+                )
+                for t in (0, 60_000, 120_000)
+            ],
+        )
+    monkeypatch.setattr(mc, "get_db_manager", lambda: manager)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+
+    latest = client.get_klines(symbol="adausdc", interval="1m", limit=2)
+    assert [k[0] for k in latest] == [60_000, 120_000]
+    assert latest[0] == (
+        60_000,
+        "1.5",
+        "1.7",
+        "1.4",
+        "1.6",
+        "10.0",
+        119_999,
+        "16.0",
+        3,
+        "5.0",
+        "8.0",
+        "0",
+    )
+
+    capped = client.get_klines(symbol="ADAUSDC", interval="1m", endTime=60_000)
+    assert [k[0] for k in capped] == [0, 60_000]
+
+    window = client.get_klines(
+        symbol="ADAUSDC", interval="1m", limit=None, startTime=60_000, endTime=120_000
+    )
+    assert [k[0] for k in window] == [60_000, 120_000]
+
+    # The same klines served from the loaded frame match the DB passthrough
+    open_times = [0, 60_000, 120_000]
+    frame = pd.DataFrame(
+        {
+            "open": 1.5,
+            "high": 1.7,
+            "low": 1.4,
+            "close": 1.6,
+            "volume": 10.0,
+            "close_time": pd.to_datetime(
+                [t + 59_999 for t in open_times], unit="ms", utc=True
+            ),
+            "quote_asset_volume": 16.0,
+            "number_of_trades": 3,
+            "taker_buy_base_asset_volume": 5.0,
+            "taker_buy_quote_asset_volume": 8.0,
+        },
+        index=pd.to_datetime(open_times, unit="ms", utc=True),
+    )
+    frame_client = MockBinanceClient(Broker(initial_cash=100.0), frame)
+    frame_client.update_tick(frame.index[1])
+    assert frame_client.recent_klines(2) == frame_client.get_klines(
+        symbol="ADAUSDC", interval="1m", limit=2, endTime=60_000
+    )
+    assert frame_client.recent_klines(3) is None
+    assert client.recent_klines(1) is None  # sample_data lacks kline columns
+    manager.close()
+
+
+# Values SQLite's CAST(REAL AS TEXT) renders lossily or in its own exponent style
+_FINE_PRICES = (1 / 3, 1e-05, 0.1 + 0.2, 12345.678901234567)
+
+
+def _fine_kline_db(tmp_path, open_times):
+    from database.connection import DatabaseConfig, DatabaseManager
+    from database.schema import CREATE_BACKTEST_KLINES_TABLE
+
+    manager = DatabaseManager(DatabaseConfig(db_path=tmp_path / "fine.db"))
+    with manager.transaction() as conn:
+        conn.execute(CREATE_BACKTEST_KLINES_TABLE)
+        conn.executemany(
+            "INSERT INTO backtest_klines VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    "ADAUSDC",
+                    "1m",
+                    t,
+                    *_FINE_PRICES,
+                    1e-05,
+                    t + 59_999,
+                    1 / 3,
+                    7,
+                    0.1,
+                    2e20,
+                )
+                for t in open_times
+            ],
+        )
+    return manager
+
+
+def test_get_klines_keeps_full_float_precision(monkeypatch, tmp_path, sample_data):
+    import backtester.mock_client as mc
+
+    manager = _fine_kline_db(tmp_path, [0])
+    monkeypatch.setattr(mc, "get_db_manager", lambda: manager)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+
+    (row,) = client.get_klines(symbol="ADAUSDC", interval="1m", limit=1)
+
+    assert row[1:6] == tuple(repr(v) for v in (*_FINE_PRICES, 1e-05))
+    assert [float(v) for v in row[1:5]] == list(_FINE_PRICES)
+    assert row[7:] == (repr(1 / 3), 7, "0.1", "2e+20", "0")
+    manager.close()
+
+
+def test_recent_klines_match_get_klines_for_fine_floats(monkeypatch, tmp_path):
+    import backtester.mock_client as mc
+
+    open_times = [0, 60_000, 120_000]
+    manager = _fine_kline_db(tmp_path, open_times)
+    monkeypatch.setattr(mc, "get_db_manager", lambda: manager)
+    frame = pd.DataFrame(
+        {
+            "open": _FINE_PRICES[0],
+            "high": _FINE_PRICES[1],
+            "low": _FINE_PRICES[2],
+            "close": _FINE_PRICES[3],
+            "volume": 1e-05,
+            "close_time": pd.to_datetime(
+                [t + 59_999 for t in open_times], unit="ms", utc=True
+            ),
+            "quote_asset_volume": 1 / 3,
+            "number_of_trades": 7,
+            "taker_buy_base_asset_volume": 0.1,
+            "taker_buy_quote_asset_volume": 2e20,
+        },
+        index=pd.to_datetime(open_times, unit="ms", utc=True),
+    )
+    client = MockBinanceClient(Broker(initial_cash=100.0), frame)
+    client.update_tick(frame.index[2])
+
+    served = client.recent_klines(2)
+    assert (
+        served
+        == client.get_klines(symbol="ADAUSDC", interval="1m", endTime=120_000)[-2:]
+    )
+    assert served[0][1] == repr(1 / 3)
+    manager.close()
+
+
+def test_open_orders_validate_as_binance_open_orders(monkeypatch, sample_data):
+    from database.order_models import BinanceOpenOrder
+
+    patch_symbol_info(monkeypatch)
+    client = MockBinanceClient(Broker(initial_cash=100.0), sample_data)
+    client.update_tick(sample_data.index[0])
+    for stop in ("9", "10"):
+        client.create_order(
+            symbol="ADAUSDC",
+            side="BUY",
+            type="STOP_LOSS",
+            quantity="1",
+            stopPrice=stop,
+            newClientOrderId="5m",
+        )
+
+    orders = BinanceOpenOrder.from_api_list(client.get_open_orders(symbol="ADAUSDC"))
+
+    assert [order.order_id for order in orders] == [1, 2]
+    assert [order.stop_price for order in orders] == ["9", "10"]
+    assert orders[0].client_order_id == "5m"
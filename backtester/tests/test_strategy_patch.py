@@ -6,7 +6,13 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+import database.crud as crud_module
+import database.symbol_crud as symbol_crud_module
 import indicators.td_iven.binance_td_iven as td_module
+import order_builder.app as order_builder_app_module
+import order_builder.calculation as calculation_module
+import order_checker.common as order_checker_common_module
+import order_checker.signal_validation as signal_validation_module
 from backtester.strategy import DemarkStrategy
 
 
@@ -22,3 +28,64 @@ def test_patch_klines_updates_td_iven_module() -> None:
     strategy._patch_klines()
 
     assert td_module.klines == strategy._patched_klines
+
+
+def test_symbol_metadata_cache_is_shared_until_cleared(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def install_fakes() -> None:
+        # 每次重新安装计数桩; monkeypatch 在用例结束时还原被策略替换的函数
+        for module in (
+            crud_module,
+            order_builder_app_module,
+            calculation_module,
+            order_checker_common_module,
+        ):
+            monkeypatch.setattr(
+                module,
+                "get_symbol_info",
+                lambda s: calls.append("info") or s,
+                raising=False,
+            )
+        for module in (
+            crud_module,
+            order_builder_app_module,
+            calculation_module,
+            signal_validation_module,
+        ):
+            monkeypatch.setattr(
+                module,
+                "get_symbol_timeframe_config",
+                lambda s, t: calls.append("config") or t,
+                raising=False,
+            )
+        for module in (symbol_crud_module, order_builder_app_module):
+            monkeypatch.setattr(
+                module,
+                "get_validated_min_notional",
+                lambda s: calls.append("notional") or 5.0,
+                raising=False,
+            )
+
+    def init_metadata(cache: dict) -> None:
+        install_fakes()
+        DemarkStrategy(
+            broker=SimpleNamespace(),
+            data=SimpleNamespace(name="ADAUSDC"),
+            mock_client=SimpleNamespace(),
+            symbol="adausdc",
+            timeframe="1H",
+            metadata_cache=cache,
+        )._cache_symbol_metadata()
+
+    cache: dict = {}
+    init_metadata(cache)
+    assert calls == ["info", "config", "notional"]
+    assert cache == {("ADAUSDC", "1h"): ("ADAUSDC", "1h", 5.0)}
+
+    init_metadata(cache)
+    assert len(calls) == 3
+
+    cache.clear()
+    init_metadata(cache)
+    assert len(calls) == 6
@@ -30,27 +30,73 @@ create_all_tables(db_manager)
 ```
 """
 
-# 导出主要接口
-from .config import ApiConfig, ConfigManager
-from .connection import DatabaseConfig, DatabaseManager, get_database_manager
-from .crud import (
-    create_symbol_timeframe_config,
-    create_trading_log,
-    create_trading_symbol,
-    get_recent_trading_logs,
-    get_symbol_info,
-    get_symbol_timeframe_config,
-)
-from .models import (
-    OperMode,
-    OrderStatus,
-    OrderType,
-    SymbolTimeframeConfig,
-    SystemConfig,
-    TradingLog,
-    TradingSymbol,
-)
-from .schema import create_all_tables, drop_all_tables, get_table_info
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import ApiConfig, ConfigManager
+    from .connection import DatabaseConfig, DatabaseManager, get_database_manager
+    from .crud import (
+        create_symbol_timeframe_config,
+        create_trading_log,
+        create_trading_logs_bulk,
+        create_trading_symbol,
+        get_recent_trading_logs,
+        get_symbol_info,
+        get_symbol_timeframe_config,
+    )
+    from .models import (
+        OperMode,
+        OrderStatus,
+        OrderType,
+        SymbolTimeframeConfig,
+        SystemConfig,
+        TradingLog,
+        TradingSymbol,
+    )
+    from .schema import create_all_tables, drop_all_tables, get_table_info
+
+# 导出主要接口: 名称 -> 所在子模块, 首次访问时才导入 (PEP 562);
+# 只需建表的入口 (init_db) 不必加载配置, CRUD 与 pydantic 模型
+_LAZY: dict[str, str] = {
+    "ApiConfig": ".config",
+    "ConfigManager": ".config",
+    "DatabaseConfig": ".connection",
+    "DatabaseManager": ".connection",
+    "get_database_manager": ".connection",
+    "create_symbol_timeframe_config": ".crud",
+    "create_trading_log": ".crud",
+    "create_trading_logs_bulk": ".crud",
+    "create_trading_symbol": ".crud",
+    "get_recent_trading_logs": ".crud",
+    "get_symbol_info": ".crud",
+    "get_symbol_timeframe_config": ".crud",
+    "OperMode": ".models",
+    "OrderStatus": ".models",
+    "OrderType": ".models",
+    "SymbolTimeframeConfig": ".models",
+    "SystemConfig": ".models",
+    "TradingLog": ".models",
+    "TradingSymbol": ".models",
+    "create_all_tables": ".schema",
+    "drop_all_tables": ".schema",
+    "get_table_info": ".schema",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # 缓存到包命名空间, 之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
 
 __all__ = [
     # 数据模型
@@ -72,6 +118,7 @@ __all__ = [
     "create_all_tables",
     "create_symbol_timeframe_config",
     "create_trading_log",
+    "create_trading_logs_bulk",
     "create_trading_symbol",
     "drop_all_tables",
     "get_database_manager",
@@ -27,7 +27,7 @@ class AdminAuth(BaseModel):
             raise ValueError("用户名长度至少3个字符")
         return v
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 class SystemConfig(BaseModel):
@@ -51,7 +51,7 @@ class SystemConfig(BaseModel):
             raise ValueError("配置键只能包含字母,数字,下划线和点")
         return v
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 if __name__ == "__main__":
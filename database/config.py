@@ -5,8 +5,12 @@
 遵循金融数据零容忍原则:配置缺失必须立即失败
 """
 
+import asyncio
+import json
+from typing import Any, ClassVar
+
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .connection import DatabaseManager
 
@@ -20,6 +24,9 @@ class ApiConfig(BaseModel):
     test_api_key: str | None = None
     test_secret_key: str | None = None
 
+    # 实例在配置管理器中缓存并共享, 冻结以防调用方改写缓存内容
+    model_config = ConfigDict(frozen=True)
+
     def get_api_key(self) -> str:
         """根据环境获取API密钥"""
         if self.environment == "testnet":
@@ -59,11 +66,46 @@ class ConfigManager:
     """
     配置管理器
 
-    从数据库读取系统配置,提供类型安全的配置访问
+    从数据库读取系统配置,提供类型安全的配置访问.
+    配置在进程内缓存, 经 set_system_config 写入时同步更新;
+    绕过本实例直接修改数据库后需调用 clear_cache.
+    API 配置整体存为一行 JSON (__api_config__), 一次点查即可读出;
+    单键 (ENVIRONMENT 等) 仍可读写, 写入时同步更新 JSON 行.
     """
 
+    # 固定 SQL 文本, 让 sqlite3 的语句缓存命中同一条预编译语句
+    _GET_CONFIG_SQL = "SELECT value FROM system_configs WHERE key = ? AND is_active = 1"
+    _SET_CONFIG_SQL = """
+            INSERT OR REPLACE INTO system_configs (key, value, description, is_active)
+            VALUES (?, ?, ?, 1)
+        """
+    _INSERT_DEFAULT_CONFIG_SQL = """
+            INSERT OR IGNORE INTO system_configs (key, value, description, is_active)
+            VALUES (?, ?, ?, 1)
+        """
+    _API_CONFIG_BLOB_KEY = "__api_config__"
+    # 单键配置名 -> ApiConfig 字段名
+    _API_CONFIG_FIELDS: ClassVar[dict[str, str]] = {
+        "ENVIRONMENT": "environment",
+        "MAIN_MEXC_API_KEY": "main_api_key",
+        "MAIN_MEXC_SECRET_KEY": "main_secret_key",
+        "TEST_MEXC_API_KEY": "test_api_key",
+        "TEST_MEXC_SECRET_KEY": "test_secret_key",
+    }
+    _GET_API_CONFIG_SQL = (
+        "SELECT key, value FROM system_configs "
+        f"WHERE key IN ({','.join('?' * len(_API_CONFIG_FIELDS))}) AND is_active = 1"
+    )
+
     def __init__(self, db_manager: DatabaseManager) -> None:
         self.db = db_manager
+        self._config_cache: dict[str, str | None] = {}
+        self._api_config_cache: ApiConfig | None = None
+
+    def clear_cache(self) -> None:
+        """清空配置缓存, 下次读取重新查询数据库"""
+        self._config_cache.clear()
+        self._api_config_cache = None
 
     def get_system_config(self, key: str) -> str | None:
         """
@@ -75,13 +117,14 @@ class ConfigManager:
         Returns:
             str | None: 配置值,不存在时返回None
         """
-        sql = "SELECT value FROM system_configs WHERE key = ? AND is_active = 1"
-        results = self.db.execute_query(sql, (key,))
+        if key in self._config_cache:
+            return self._config_cache[key]
 
-        if results:
-            return results[0]["value"]
+        results = self.db.execute_query_tuples(self._GET_CONFIG_SQL, (key,))
 
-        return None
+        value = results[0][0] if results else None
+        self._config_cache[key] = value
+        return value
 
     def set_system_config(self, key: str, value: str, description: str = "") -> None:
         """
@@ -92,12 +135,53 @@ class ConfigManager:
             value: 配置值
             description: 配置描述
         """
-        sql = """
-            INSERT OR REPLACE INTO system_configs (key, value, description, is_active)
-            VALUES (?, ?, ?, 1)
+        self.set_system_configs_batch([(key, value, description)])
+
+    def set_system_configs_batch(self, configs: list[tuple[str, str, str]]) -> None:
         """
+        批量设置系统配置 - 一个事务内 executemany 写入, 只提交一次
 
-        _ = self.db.execute_update(sql, (key, value, description))
+        Args:
+            configs: (配置键名, 配置值, 配置描述) 列表
+        """
+        fields = [
+            (field, value)
+            for key, value, _ in configs
+            if (field := self._API_CONFIG_FIELDS.get(key)) is not None
+        ]
+        blob = self.get_config_blob(self._API_CONFIG_BLOB_KEY) if fields else None
+        blob_value: str | None = None
+
+        with self.db.transaction() as conn:
+            _ = conn.executemany(self._SET_CONFIG_SQL, configs)
+            if blob is not None:
+                blob.update(fields)
+                blob_value = json.dumps(blob, separators=(",", ":"))
+                _ = conn.execute(
+                    self._SET_CONFIG_SQL,
+                    (self._API_CONFIG_BLOB_KEY, blob_value, "API配置(JSON)"),
+                )
+
+        for key, value, _ in configs:
+            self._config_cache[key] = value
+        if blob_value is not None:
+            self._config_cache[self._API_CONFIG_BLOB_KEY] = blob_value
+        # 只有写入 API 相关键时才作废整体缓存, 其他配置写入不影响 get_api_config
+        if fields or any(key == self._API_CONFIG_BLOB_KEY for key, _, _ in configs):
+            self._api_config_cache = None
+
+    def get_config_blob(self, name: str) -> dict[str, Any] | None:
+        """读取以 JSON 存储的整块配置, 不存在时返回 None"""
+        raw = self.get_system_config(name)
+        return json.loads(raw) if raw else None
+
+    def set_config_blob(
+        self, name: str, values: dict[str, Any], description: str = ""
+    ) -> None:
+        """将整块配置序列化为紧凑 JSON 写入单行"""
+        self.set_system_config(
+            name, json.dumps(values, separators=(",", ":")), description
+        )
 
     def get_api_config(self) -> ApiConfig:
         """
@@ -106,14 +190,45 @@ class ConfigManager:
         Returns:
             ApiConfig: API配置模型
         """
-
-        return ApiConfig(
-            environment=self.get_system_config("ENVIRONMENT") or "testnet",
-            main_api_key=self.get_system_config("MAIN_MEXC_API_KEY"),
-            main_secret_key=self.get_system_config("MAIN_MEXC_SECRET_KEY"),
-            test_api_key=self.get_system_config("TEST_MEXC_API_KEY"),
-            test_secret_key=self.get_system_config("TEST_MEXC_SECRET_KEY"),
+        if self._api_config_cache is not None:
+            return self._api_config_cache
+
+        values = self.get_config_blob(self._API_CONFIG_BLOB_KEY)
+        if values is None:
+            # 尚未迁移 (未执行 init_default_configs) 的数据库回退到单键读取
+            values = self._read_api_config_fields()
+        # 数据来自本库且写入时已约束, 跳过逐字段校验
+        self._api_config_cache = ApiConfig.model_construct(
+            **{**values, "environment": values.get("environment") or "testnet"}
         )
+        return self._api_config_cache
+
+    async def get_system_config_async(self, key: str) -> str | None:
+        """get_system_config 的异步版本, 在默认线程池中执行"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_system_config, key)
+
+    async def get_api_config_async(self) -> ApiConfig:
+        """
+        get_api_config 的异步版本
+
+        在默认线程池中执行, 每个线程从连接池借用独立连接;
+        WAL 模式下读不阻塞, 多个读取可经 asyncio.gather 并发进行.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_api_config)
+
+    def _read_api_config_fields(self) -> dict[str, str | None]:
+        """一条 IN 查询读取全部 API 单键, 返回以 ApiConfig 字段名为键的字典"""
+        keys = tuple(self._API_CONFIG_FIELDS)
+        if not all(key in self._config_cache for key in keys):
+            fetched = dict.fromkeys(keys)
+            fetched.update(self.db.execute_query_tuples(self._GET_API_CONFIG_SQL, keys))
+            self._config_cache.update(fetched)
+        return {
+            field: self._config_cache[key]
+            for key, field in self._API_CONFIG_FIELDS.items()
+        }
 
     def is_api_configured(self) -> bool:
         """检查API是否已配置 - 遵循fail-fast原则,异常直接向上传播"""
@@ -134,10 +249,20 @@ class ConfigManager:
             ("MAIN_MEXC_SECRET_KEY", "", "主网Secret密钥"),
         ]
 
-        for key, value, description in default_configs:
-            existing = self.get_system_config(key)
-            if existing is None:
-                self.set_system_config(key, value, description)
+        # INSERT OR IGNORE 不覆盖已有配置, 一个事务写入全部默认值
+        with self.db.transaction() as conn:
+            _ = conn.executemany(self._INSERT_DEFAULT_CONFIG_SQL, default_configs)
+        for key, _, _ in default_configs:
+            self._config_cache.pop(key, None)
+        self._api_config_cache = None
+
+        # 迁移: 由现有单键组装 API 配置 JSON 行
+        if self.get_config_blob(self._API_CONFIG_BLOB_KEY) is None:
+            self.set_config_blob(
+                self._API_CONFIG_BLOB_KEY,
+                self._read_api_config_fields(),
+                "API配置(JSON)",
+            )
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@
 """
 
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .connection import DatabaseManager
 
@@ -18,6 +18,9 @@ class ApiConfigOptimized(BaseModel):
     test_api_key: str | None = None
     test_secret_key: str | None = None
 
+    # 实例在配置管理器中缓存并共享, 冻结以防调用方改写缓存内容
+    model_config = ConfigDict(frozen=True)
+
     def get_api_key(self) -> str:
         """根据环境获取API密钥"""
         if self.environment == "testnet":
@@ -61,10 +64,18 @@ class ConfigManagerOptimized:
     1. 批量查询替代单独查询
     2. 减少数据库访问次数
     3. 提高性能
+    4. 进程内缓存已读取的配置, 外部修改数据库后需调用 clear_cache
     """
 
     def __init__(self, db_manager: DatabaseManager) -> None:
         self.db = db_manager
+        self._config_cache: dict[str, str | None] = {}
+        self._api_config_cache: ApiConfigOptimized | None = None
+
+    def clear_cache(self) -> None:
+        """清空配置缓存, 下次读取重新查询数据库"""
+        self._config_cache.clear()
+        self._api_config_cache = None
 
     def get_system_configs_batch(self, keys: list[str]) -> dict[str, str | None]:
         """
@@ -79,23 +90,27 @@ class ConfigManagerOptimized:
         if not keys:
             return {}
 
+        missing = [key for key in keys if key not in self._config_cache]
+        if not missing:
+            return {key: self._config_cache[key] for key in keys}
+
         try:
-            # 构建 IN 查询语句
-            placeholders = ",".join("?" * len(keys))
+            # 构建 IN 查询语句, 只查询未缓存的键
+            placeholders = ",".join("?" * len(missing))
             sql = f"""
                 SELECT key, value
                 FROM system_configs
                 WHERE key IN ({placeholders}) AND is_active = 1
             """
 
-            results = self.db.execute_query(sql, tuple(keys))
+            results = self.db.execute_query_tuples(sql, tuple(missing))
 
-            # 构建结果字典, 缺失的键设为 None
-            config_dict = dict.fromkeys(keys)
-            for row in results:
-                config_dict[row["key"]] = row["value"]
+            # 缺失的键缓存为 None
+            fetched = dict.fromkeys(missing)
+            fetched.update(results)
+            self._config_cache.update(fetched)
 
-            return config_dict
+            return {key: self._config_cache[key] for key in keys}
 
         except Exception as e:
             logger.error(
@@ -112,6 +127,9 @@ class ConfigManagerOptimized:
         Returns:
             ApiConfigOptimized: API配置模型
         """
+        if self._api_config_cache is not None:
+            return self._api_config_cache
+
         try:
             logger.debug("🔍 从数据库批量获取API配置")
 
@@ -127,13 +145,15 @@ class ConfigManagerOptimized:
             # 一次性获取所有配置
             configs = self.get_system_configs_batch(required_keys)
 
-            return ApiConfigOptimized(
+            # 数据来自本库, 跳过逐字段校验
+            self._api_config_cache = ApiConfigOptimized.model_construct(
                 environment=configs.get("ENVIRONMENT") or "testnet",
                 main_api_key=configs.get("MAIN_MEXC_API_KEY"),
                 main_secret_key=configs.get("MAIN_MEXC_SECRET_KEY"),
                 test_api_key=configs.get("TEST_MEXC_API_KEY"),
                 test_secret_key=configs.get("TEST_MEXC_SECRET_KEY"),
             )
+            return self._api_config_cache
 
         except Exception as e:
             logger.error(f"❌ 获取API配置失败: {e}", exc_info=True)
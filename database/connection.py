@@ -7,12 +7,15 @@
 
 import sqlite3
 import threading
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Literal
 
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from database.pool import SQLiteConnectionPool
 
 
 class DatabaseConfig(BaseModel):
@@ -22,6 +25,15 @@ class DatabaseConfig(BaseModel):
     timeout: float = 30.0
     check_same_thread: bool = False
     enable_foreign_keys: bool = True
+    # WAL 下 NORMAL 不会损坏数据库, 仅断电时可能丢失最后提交的事务; 需要逐事务落盘时设为 FULL
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    cache_kb: int = 65536
+    mmap_bytes: int = 268_435_456
+    wal_autocheckpoint: int = 1000
+    # 连接池上限; 内存数据库每个连接互相独立, 固定只用一个连接
+    pool_size: int = 8
+
+    model_config = ConfigDict(frozen=True)
 
 
 class DatabaseManager:
@@ -29,20 +41,33 @@ class DatabaseManager:
     线程安全的数据库连接管理器
 
     Features:
-    - 连接池管理
+    - 连接池管理: 有界连接池, 线程按需借出/归还, 建连与 PRAGMA 设置只在首次创建时发生
     - 自动事务处理
     - 外键约束启用
     - 连接超时配置
+
+    同一线程内嵌套的 get_connection/transaction 复用已借出的连接,
+    因此能看到本线程未提交的写入, 也不会因连接池耗尽而自锁.
     """
 
     def __init__(self, config: DatabaseConfig) -> None:
         self.config = config
+        # 当前线程借出的连接 (嵌套使用时复用)
         self._local = threading.local()
-        self._lock = threading.Lock()
-
-        # 确保数据库目录存在 (内存数据库无须创建)
-        if str(self.config.db_path) != ":memory:":
-            self.config.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 路径字符串只转换一次, 每个线程建连时直接复用
+        self._db_path_str = str(self.config.db_path)
+        self._is_memory = self._db_path_str == ":memory:"
+
+        # 确保数据库目录存在 (内存数据库无须创建, 已存在时跳过 mkdir)
+        parent = self.config.db_path.parent
+        if not self._is_memory and not parent.is_dir():
+            parent.mkdir(parents=True, exist_ok=True)
+
+        self._pool = SQLiteConnectionPool(
+            self._create_connection,
+            size=1 if self._is_memory else self.config.pool_size,
+            timeout=self.config.timeout,
+        )
 
         # 初始化数据库
         self._init_database()
@@ -50,49 +75,67 @@ class DatabaseManager:
     def _init_database(self) -> None:
         """初始化数据库连接和基础设置"""
         with self.get_connection() as conn:
-            # 启用外键约束
-            if self.config.enable_foreign_keys:
-                _ = conn.execute("PRAGMA foreign_keys = ON")
-
-            # 设置 WAL 模式提高并发性能
-            _ = conn.execute("PRAGMA journal_mode = WAL")
-
-            # 设置同步模式
-            _ = conn.execute("PRAGMA synchronous = FULL")
-
+            # 设置 WAL 模式提高并发性能 (持久化在数据库文件中, 只需设置一次);
+            # 内存数据库不支持 WAL, 日志直接放内存
+            journal_mode = "MEMORY" if self._is_memory else "WAL"
+            _ = conn.execute(f"PRAGMA journal_mode = {journal_mode}")
             conn.commit()
 
-    def _get_local_connection(self) -> sqlite3.Connection:
-        """获取线程本地连接"""
-        if not hasattr(self._local, "connection") or self._local.connection is None:
-            self._local.connection = sqlite3.connect(
-                str(self.config.db_path),
-                timeout=self.config.timeout,
-                check_same_thread=self.config.check_same_thread,
-            )
-            # 设置行工厂为字典模式
-            self._local.connection.row_factory = sqlite3.Row
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """应用连接级 PRAGMA: 这些设置只对当前连接生效, 每个线程连接都要设置"""
+        # 启用外键约束
+        if self.config.enable_foreign_keys:
+            _ = conn.execute("PRAGMA foreign_keys = ON")
+        # 设置同步模式
+        _ = conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+        # 页缓存与内存映射, 临时表放内存
+        _ = conn.execute(f"PRAGMA cache_size = -{int(self.config.cache_kb)}")
+        _ = conn.execute(f"PRAGMA mmap_size = {int(self.config.mmap_bytes)}")
+        _ = conn.execute("PRAGMA temp_store = MEMORY")
+        _ = conn.execute(
+            f"PRAGMA wal_autocheckpoint = {int(self.config.wal_autocheckpoint)}"
+        )
 
-            logger.trace(f"🔗 创建新的数据库连接: {threading.current_thread().name}")
+    def _create_connection(self) -> sqlite3.Connection:
+        """新建连接并应用连接级设置"""
+        connection = sqlite3.connect(
+            self._db_path_str,
+            timeout=self.config.timeout,
+            check_same_thread=self.config.check_same_thread,
+            # 预编译语句缓存按 SQL 文本命中, 调大后热点查询免去重复解析
+            cached_statements=256,
+        )
+        # 默认行工厂为字典模式; 热点单列查询走 execute_query_tuples
+        connection.row_factory = sqlite3.Row
+        self._configure_connection(connection)
 
-        connection = self._local.connection
-        if not isinstance(connection, sqlite3.Connection):
-            raise RuntimeError("Database connection is not valid")
+        logger.trace("🔗 创建新的数据库连接: {}", threading.current_thread().name)
         return connection
 
+    @contextmanager
+    def _borrow(self) -> Generator[sqlite3.Connection, None, None]:
+        """借出连接直到上下文结束; 同一线程嵌套调用复用同一连接"""
+        borrowed = getattr(self._local, "connection", None)
+        if borrowed is not None:
+            yield borrowed
+            return
+
+        with self._pool.connection() as conn:
+            self._local.connection = conn
+            try:
+                yield conn
+            finally:
+                self._local.connection = None
+
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
         获取数据库连接的上下文管理器
 
-        自动处理连接的获取和释放, 确保连接正确关闭.
+        从连接池借出连接, 上下文结束时归还 (不关闭).
         """
-        conn = self._get_local_connection()
-        try:
+        with self._borrow() as conn:
             yield conn
-        finally:
-            # 连接不在这里关闭, 由线程结束时清理
-            pass
 
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Connection, None, None]:
@@ -102,16 +145,16 @@ class DatabaseManager:
         自动处理事务的开始,提交和回滚.
         金融系统要求: 确保数据一致性.
         """
-        conn = self._get_local_connection()
-        try:
-            _ = conn.execute("BEGIN")
-            yield conn
-            conn.commit()
-            logger.trace("✅ 事务提交成功")
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"❌ 事务回滚: {e}", exc_info=True)
-            raise ValueError(f"数据库事务失败: {e}") from e
+        with self._borrow() as conn:
+            try:
+                _ = conn.execute("BEGIN")
+                yield conn
+                conn.commit()
+                logger.trace("✅ 事务提交成功")
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"❌ 事务回滚: {e}", exc_info=True)
+                raise ValueError(f"数据库事务失败: {e}") from e
 
     def execute_query(
         self, query: str, params: tuple[object, ...] = ()
@@ -129,7 +172,27 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.execute(query, params)
             results = cursor.fetchall()
-            logger.trace(f"🔍 查询执行成功, 返回 {len(results)} 条记录")
+            logger.trace("🔍 查询执行成功, 返回 {} 条记录", len(results))
+            return results
+
+    def execute_query_tuples(
+        self, query: str, params: tuple[object, ...] = ()
+    ) -> list[tuple[Any, ...]]:
+        """
+        执行查询并返回普通元组 - 省去 sqlite3.Row 的逐行包装, 供按位置取值的热点查询使用
+
+        Args:
+            query: SQL 查询语句
+            params: 查询参数
+
+        Returns:
+            查询结果元组列表
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            results = cursor.execute(query, params).fetchall()
+            logger.trace("🔍 查询执行成功, 返回 {} 条记录", len(results))
             return results
 
     def execute_update(self, query: str, params: tuple[object, ...] = ()) -> int:
@@ -142,19 +205,51 @@ class DatabaseManager:
 
         Returns:
             影响的行数
+
+        单条语句无需显式 BEGIN: 由 sqlite3 隐式开启并在此提交, 省去一次往返;
+        若当前线程已处于外层事务中, 则并入该事务, 由外层负责提交.
+        """
+        with self._borrow() as conn:
+            joined = conn.in_transaction
+            try:
+                cursor = conn.execute(query, params)
+                if not joined:
+                    conn.commit()
+            except Exception as e:
+                if not joined:
+                    conn.rollback()
+                logger.error(f"❌ 更新失败: {e}", exc_info=True)
+                raise ValueError(f"数据库更新失败: {e}") from e
+            rowcount = cursor.rowcount
+            logger.trace("📝 更新执行成功, 影响 {} 行", rowcount)
+            return rowcount
+
+    def execute_many(
+        self, query: str, seq_of_params: Iterable[tuple[object, ...]]
+    ) -> int:
+        """
+        在单个显式事务内批量执行同一语句 - 一次提交, 失败整体回滚
+
+        Args:
+            query: SQL 更新语句
+            seq_of_params: 每行的参数序列
+
+        Returns:
+            影响的总行数
         """
         with self.transaction() as conn:
-            cursor = conn.execute(query, params)
+            cursor = conn.executemany(query, seq_of_params)
             rowcount = cursor.rowcount
-            logger.trace(f"📝 更新执行成功, 影响 {rowcount} 行")
+            logger.trace("📝 批量更新执行成功, 影响 {} 行", rowcount)
             return rowcount
 
+    def warm_pool(self, count: int | None = None) -> int:
+        """预先建立连接 (默认建满连接池), 返回新建数量; 适合在并发任务开始前调用"""
+        return self._pool.warm(count)
+
     def close(self) -> None:
-        """关闭所有连接"""
-        if hasattr(self._local, "connection") and self._local.connection:
-            self._local.connection.close()
-            self._local.connection = None
-            logger.trace("🔒 数据库连接已关闭")
+        """关闭连接池中的空闲连接; 之后的调用会按需重新建连"""
+        _ = self._pool.close()
 
 
 # 全局数据库管理器实例
@@ -177,16 +272,24 @@ def get_database_manager(config: DatabaseConfig | None = None) -> DatabaseManage
     """
     global _db_manager
 
-    if _db_manager is None:
-        with _init_lock:
-            if _db_manager is None:
-                if config is None:
-                    error_msg = "首次调用必须提供数据库配置"
-                    logger.critical(f"💥 {error_msg}")
-                    raise ValueError(error_msg)
+    # 快路径: 已初始化时只读一次全局变量, 不加锁
+    manager = _db_manager
+    if manager is not None:
+        return manager
+
+    with _init_lock:
+        if _db_manager is None:
+            if config is None:
+                error_msg = "首次调用必须提供数据库配置"
+                logger.critical(f"💥 {error_msg}")
+                raise ValueError(error_msg)
+
+            _db_manager = DatabaseManager(config)
+        return _db_manager
 
-                _db_manager = DatabaseManager(config)
 
+def peek_database_manager() -> DatabaseManager | None:
+    """无锁读取当前全局数据库管理器, 未初始化时返回 None"""
     return _db_manager
 
 
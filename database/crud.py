@@ -20,6 +20,7 @@ from .symbol_crud import (
 )
 from .trading_log_crud import (
     create_trading_log,
+    create_trading_logs_bulk,
     get_recent_trading_logs,
     update_trading_log,
 )
@@ -30,6 +31,7 @@ __all__ = [
     "cascade_delete_related_data",
     "create_symbol_timeframe_config",
     "create_trading_log",
+    "create_trading_logs_bulk",
     "create_trading_symbol",
     "delete_trading_symbol",
     "get_recent_trading_logs",
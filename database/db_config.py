@@ -5,28 +5,38 @@
 遵循单一职责原则,统一管理数据库配置.
 """
 
-import sys
+from functools import cache
 from pathlib import Path
 
 from loguru import logger
 
-# 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    try:
+        from shared.path_utils import ensure_project_root_for_script
+    except ImportError:
+        import sys
+
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+        from shared.path_utils import ensure_project_root_for_script
+
+    ensure_project_root_for_script(__file__)
 
 from database.connection import (
     DatabaseConfig,
     DatabaseManager,
     get_database_manager,
+    peek_database_manager,
     reset_database_manager,
 )
 
 
+@cache
 def get_project_root() -> Path:
     """获取项目根目录"""
     return Path(__file__).parent.parent
 
 
+@cache
 def get_database_path() -> Path:
     """
     获取数据库文件路径 - 项目唯一配置入口
@@ -37,18 +47,22 @@ def get_database_path() -> Path:
     return get_project_root() / "data" / "bot.db"
 
 
+@cache
 def get_default_database_config() -> DatabaseConfig:
     """
-    获取默认数据库配置
+    获取默认数据库配置 (只构建一次; DatabaseConfig 不可变, 可安全共享)
 
     Returns:
-        标准数据库配置对象
+        标准数据库配置对象 (WAL + synchronous=NORMAL, 64MiB 页缓存, 256MiB mmap)
     """
     return DatabaseConfig(
         db_path=get_database_path(),
         timeout=30.0,
         check_same_thread=False,
         enable_foreign_keys=True,
+        synchronous="NORMAL",
+        cache_kb=65536,
+        mmap_bytes=268_435_456,
     )
 
 
@@ -59,9 +73,14 @@ def get_db_manager() -> DatabaseManager:
     Returns:
         使用默认配置的数据库管理器
     """
+    # 已初始化时直接返回, 免去每次调用构建 Path 与 DatabaseConfig
+    manager = peek_database_manager()
+    if manager is not None:
+        return manager
     return get_database_manager(get_default_database_config())
 
 
+@cache
 def get_in_memory_database_config() -> DatabaseConfig:
     """构建内存数据库配置"""
     return DatabaseConfig(
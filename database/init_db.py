@@ -7,17 +7,23 @@
 
 from loguru import logger
 
-# 双重用途模块导入处理 - 唯一允许的 try-except
-try:
-    from .db_config import get_database_path, get_db_manager
-    from .schema import create_all_tables
-except ImportError:
-    import sys
-    from pathlib import Path
+if __name__ == "__main__":
+    try:
+        from shared.path_utils import ensure_project_root_for_script
+    except ImportError:
+        import sys
+        from pathlib import Path
+
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+        from shared.path_utils import ensure_project_root_for_script
+
+    ensure_project_root_for_script(__file__)
 
-    sys.path.insert(0, str(Path(__file__).parent))
-    from db_config import get_database_path, get_db_manager
-    from schema import create_all_tables
+from database.db_config import get_database_path, get_db_manager
+from database.schema import create_all_tables, is_schema_current
+
+# 进程内已确认初始化; 之后的 ensure_database_initialized 调用直接返回, 不再 stat 文件
+_database_initialized: bool = False
 
 
 def init_database() -> None:
@@ -26,12 +32,17 @@ def init_database() -> None:
 
     创建所有必要的表,索引和触发器
     这个函数应该在系统首次部署或升级时调用
+    DDL 指纹与库中记录一致时跳过, 不再逐条执行建表语句
     """
     logger.info("🗄️ 开始初始化数据库")
 
     # 获取数据库管理器
     db_manager = get_db_manager()
 
+    if is_schema_current(db_manager):
+        logger.info("✅ 数据库结构已是最新, 跳过建表")
+        return
+
     # 创建所有表
     create_all_tables(db_manager)
 
@@ -54,13 +65,23 @@ def ensure_database_initialized() -> None:
     确保数据库已初始化
 
     如果数据库不存在,则自动初始化
-    这是一个安全的幂等操作
+    这是一个安全的幂等操作, 每个进程只检查一次
     """
+    global _database_initialized
+    if _database_initialized:
+        return
     if not check_database_exists():
         logger.info("🔄 数据库不存在,自动初始化")
         init_database()
     else:
         logger.debug("✅ 数据库已存在")
+    _database_initialized = True
+
+
+def reset_initialization_flag() -> None:
+    """清除进程内的初始化标记 (切换数据库文件或测试中删除数据库后调用)"""
+    global _database_initialized
+    _database_initialized = False
 
 
 if __name__ == "__main__":
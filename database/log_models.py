@@ -9,12 +9,14 @@ from datetime import datetime
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from shared.typing import SymbolStr
+
 
 class TradingLog(BaseModel):
     """交易日志模型"""
 
     id: int | None = None
-    symbol: str = Field(..., description="交易对符号")
+    symbol: SymbolStr = Field(..., description="交易对符号")
     kline_timeframe: str = Field(..., description="K线时间周期")
     demark: int | None = Field(default=None, description="DeMark信号值")
     side: str | None = Field(default=None, description="订单方向")
@@ -39,11 +41,6 @@ class TradingLog(BaseModel):
     )
     created_at: datetime | None = None
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        return v.upper()
-
     @field_validator("demark")
     @classmethod
     def validate_demark(cls, v: int | None) -> int | None:
@@ -52,7 +49,8 @@ class TradingLog(BaseModel):
             raise ValueError("DeMark信号值必须在1-50范围内")
         return v
 
-    model_config = ConfigDict(use_enum_values=True)
+    # 日志写入后不再修改, 冻结后可安全共享
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 if __name__ == "__main__":
@@ -19,14 +19,47 @@ if __name__ == "__main__":
 
     ensure_project_root_for_script(__file__)
 
-from database.auth_models import SystemConfig
-from database.enums import OperMode, OrderStatus, OrderType
-from database.log_models import TradingLog
-from database.order_models import AccountTradeList, BinanceFilledOrder
-from database.stats_models import CSVImportStats, MatchingStats
-from database.trading_models import SymbolTimeframeConfig, TradingSymbol
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from database.auth_models import SystemConfig
+    from database.enums import OperMode, OrderStatus, OrderType
+    from database.log_models import TradingLog
+    from database.order_models import AccountTradeList, BinanceFilledOrder
+    from database.stats_models import CSVImportStats, MatchingStats
+    from database.trading_models import SymbolTimeframeConfig, TradingSymbol
+
+# 模型名 -> 所在模块; 首次访问时才导入 (PEP 562),
+# 只用到部分模型的入口不必为其余模型构建 schema
+_LAZY: dict[str, str] = {
+    "SystemConfig": "database.auth_models",
+    "OperMode": "database.enums",
+    "OrderStatus": "database.enums",
+    "OrderType": "database.enums",
+    "TradingLog": "database.log_models",
+    "AccountTradeList": "database.order_models",
+    "BinanceFilledOrder": "database.order_models",
+    "CSVImportStats": "database.stats_models",
+    "MatchingStats": "database.stats_models",
+    "SymbolTimeframeConfig": "database.trading_models",
+    "TradingSymbol": "database.trading_models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间, 之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
 
-# 模型已直接导入,无需重新导出
 
 # 导出所有模型供外部使用
 __all__ = [
@@ -52,6 +85,11 @@ __all__ = [
 
 if __name__ == "__main__":
     """数据库模型测试"""
+    from database.auth_models import SystemConfig
+    from database.enums import OperMode
+    from database.log_models import TradingLog
+    from database.trading_models import SymbolTimeframeConfig, TradingSymbol
+
     logger.info("🗄️ 数据库模型模块")
     logger.info("统一导出所有数据库模型:")
     logger.info("- 枚举类型: OrderStatus, OrderType, OperMode")
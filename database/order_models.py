@@ -4,12 +4,13 @@
 定义各种订单类型的Pydantic模型,包括账户交易记录和已完成订单
 """
 
+import operator
 import re
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 if __name__ == "__main__":
     try:
@@ -24,13 +25,60 @@ if __name__ == "__main__":
     ensure_project_root_for_script(__file__)
 
 from shared.constants import BUY, SELL
+from shared.typing import SymbolStr
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# CSV 数值列带单位 (如 "12.5 ADA"), 只取数值部分
+_NUMERIC_RE = re.compile(r"[\d.]+")
+# 向量化提取用的捕获组版本
+_NUMERIC_CAPTURE = f"({_NUMERIC_RE.pattern})"
+_CSV_NUMERIC_COLUMNS: tuple[str, ...] = (
+    "Order Price",
+    "Order Amount",
+    "Executed",
+    "Average Price",
+    "Trading total",
+)
+
+
+# filled_orders 中 TEXT NOT NULL 列: sqlite3 已返回 str, 原样取用
+_FILLED_ORDER_TEXT_FIELDS: tuple[str, ...] = (
+    "date_utc",
+    "order_no",
+    "pair",
+    "order_type",
+    "side",
+    "order_price",
+    "order_amount",
+    "time",
+    "executed",
+    "trading_total",
+    "status",
+)
+# REAL 列 (需转 str) 与可空 TEXT 列 (保留 None) 紧随其后
+_FILLED_ORDER_ROW_GETTER = operator.itemgetter(
+    "id",
+    *_FILLED_ORDER_TEXT_FIELDS,
+    "average_price",
+    "unmatched_qty",
+    "matched_time",
+    "client_order_id",
+)
+
+
+def _extract_numeric(value: str) -> str:
+    """提取字符串中的数值部分, 去除单位"""
+    match = _NUMERIC_RE.search(value)
+    return match.group() if match else "0"
 
 
 class AccountTradeList(BaseModel):
     """账户交易记录模型"""
 
     db_id: int | None = Field(default=None, description="数据库自增ID")
-    symbol: str = Field(..., description="交易对符号")
+    symbol: SymbolStr = Field(..., description="交易对符号")
     trade_id: str = Field(..., description="交易ID", alias="id")
     order_id: str = Field(..., description="订单ID", alias="orderId")
     order_list_id: int = Field(
@@ -54,12 +102,6 @@ class AccountTradeList(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """验证交易对符号"""
-        return v.upper()
-
     @field_validator("trade_id")
     @classmethod
     def validate_trade_id(cls, v: str) -> str:
@@ -68,14 +110,15 @@ class AccountTradeList(BaseModel):
             raise ValueError("交易ID不能为空")
         return v
 
-    model_config = ConfigDict(use_enum_values=True, populate_by_name=True)
+    # 成交记录来自 API, 入库前后均不修改
+    model_config = ConfigDict(use_enum_values=True, populate_by_name=True, frozen=True)
 
 
 class MexcFilledOrder(BaseModel):
     """MEXC已完成订单模型"""
 
     id: int | None = None
-    symbol: str = Field(..., description="交易对符号")
+    symbol: SymbolStr = Field(..., description="交易对符号")
     order_id: int = Field(..., description="订单ID", alias="orderId")
     order_list_id: int | None = Field(
         default=None, description="订单列表ID", alias="orderListId"
@@ -121,12 +164,6 @@ class MexcFilledOrder(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """验证交易对符号"""
-        return v.upper()
-
     model_config = ConfigDict(use_enum_values=True, populate_by_name=True)
 
 
@@ -136,7 +173,7 @@ class BinanceFilledOrder(BaseModel):
     id: int | None = None
     date_utc: str = Field(..., description="订单创建时间(UTC)")
     order_no: str = Field(..., description="订单号")
-    pair: str = Field(..., description="交易对")
+    pair: SymbolStr = Field(..., description="交易对")
     order_type: str = Field(..., description="订单类型")
     side: str = Field(..., description="买卖方向")
     order_price: str = Field(..., description="订单价格")
@@ -154,12 +191,6 @@ class BinanceFilledOrder(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    @field_validator("pair")
-    @classmethod
-    def validate_pair(cls, v: str) -> str:
-        """验证交易对符号"""
-        return v.upper()
-
     @field_validator("order_no")
     @classmethod
     def validate_order_no(cls, v: str) -> str:
@@ -171,13 +202,7 @@ class BinanceFilledOrder(BaseModel):
     @classmethod
     def from_csv_row(cls, row: dict[str, str]) -> "BinanceFilledOrder":
         """从CSV行数据创建BinanceFilledOrder对象"""
-
-        def extract_numeric_value(value: str) -> str:
-            """提取字符串中的数值部分, 去除单位"""
-            match = re.search(r"[\d.]+", value)
-            return match.group() if match else "0"
-
-        executed_value = extract_numeric_value(row["Executed"])
+        executed_value = _extract_numeric(row["Executed"])
 
         return cls(
             date_utc=row["Date(UTC)"],
@@ -185,23 +210,117 @@ class BinanceFilledOrder(BaseModel):
             pair=row["Pair"],
             order_type=row["Type"],
             side=BUY if row["Side"].upper() == "BUY" else SELL,
-            order_price=extract_numeric_value(row["Order Price"]),
-            order_amount=extract_numeric_value(row["Order Amount"]),
+            order_price=_extract_numeric(row["Order Price"]),
+            order_amount=_extract_numeric(row["Order Amount"]),
             time=row["Time"],
             executed=executed_value,
-            average_price=extract_numeric_value(row["Average Price"]),
-            trading_total=extract_numeric_value(row["Trading total"]),
+            average_price=_extract_numeric(row["Average Price"]),
+            trading_total=_extract_numeric(row["Trading total"]),
             status=row["Status"],
             unmatched_qty=executed_value if row["Status"] == "FILLED" else "0",
             client_order_id=None,  # CSV 文件通常不包含此字段
         )
 
+    @classmethod
+    def from_csv_dataframe(cls, df: "pd.DataFrame") -> list["BinanceFilledOrder"]:
+        """从整张 CSV 表 (所有列为 str) 批量创建对象, 结果与逐行 from_csv_row 一致
+
+        数值提取, 交易对大写与订单号非空校验在整列上一次完成,
+        随后用 model_construct 构建对象, 跳过逐行校验.
+        """
+        if df["OrderNo"].eq("").any():
+            raise ValueError("订单号不能为空")
+
+        numeric = {
+            column: df[column].str.extract(_NUMERIC_CAPTURE, expand=False).fillna("0")
+            for column in _CSV_NUMERIC_COLUMNS
+        }
+        executed = numeric["Executed"]
+        status = df["Status"]
+        side = df["Side"].str.upper().eq("BUY").map({True: BUY, False: SELL})
+        unmatched_qty = executed.where(status.eq("FILLED"), "0")
+
+        return [
+            cls.model_construct(
+                date_utc=date_utc,
+                order_no=order_no,
+                pair=pair,
+                order_type=order_type,
+                side=order_side,
+                order_price=order_price,
+                order_amount=order_amount,
+                time=time,
+                executed=executed_value,
+                average_price=average_price,
+                trading_total=trading_total,
+                status=order_status,
+                unmatched_qty=unmatched,
+            )
+            for (
+                date_utc,
+                order_no,
+                pair,
+                order_type,
+                order_side,
+                order_price,
+                order_amount,
+                time,
+                executed_value,
+                average_price,
+                trading_total,
+                order_status,
+                unmatched,
+            ) in zip(
+                df["Date(UTC)"].tolist(),
+                df["OrderNo"].tolist(),
+                df["Pair"].str.upper().tolist(),
+                df["Type"].tolist(),
+                side.tolist(),
+                numeric["Order Price"].tolist(),
+                numeric["Order Amount"].tolist(),
+                df["Time"].tolist(),
+                executed.tolist(),
+                numeric["Average Price"].tolist(),
+                numeric["Trading total"].tolist(),
+                status.tolist(),
+                unmatched_qty.tolist(),
+                strict=True,
+            )
+        ]
+
     @classmethod
     def from_db_dict(cls, row_dict: dict[str, Any]) -> "BinanceFilledOrder":
-        """从数据库字典创建BinanceFilledOrder对象 - 使用字段名映射避免索引错误"""
+        """从数据库字典创建BinanceFilledOrder对象 - 使用字段名映射避免索引错误
+
+        数据写入时已校验 (交易对已大写, 订单号非空), 使用 model_construct 跳过校验.
+        完整行 (SELECT *) 走一次 itemgetter 批量取值; 缺列时退回逐字段带默认值读取.
+        """
+        try:
+            (
+                id_val,
+                *text_values,
+                average_price,
+                unmatched_qty,
+                matched_time,
+                client_order_id,
+            ) = _FILLED_ORDER_ROW_GETTER(row_dict)
+        except KeyError:
+            return cls._from_partial_db_dict(row_dict)
+        return cls.model_construct(
+            id=id_val if isinstance(id_val, int) else None,
+            **dict(zip(_FILLED_ORDER_TEXT_FIELDS, text_values, strict=True)),
+            average_price=str(average_price),
+            unmatched_qty=str(unmatched_qty),
+            matched_time=matched_time,
+            client_order_id=client_order_id,
+        )
+
+    @classmethod
+    def _from_partial_db_dict(cls, row_dict: dict[str, Any]) -> "BinanceFilledOrder":
+        """缺少部分列的数据库字典: 逐字段读取, 缺失字段使用默认值"""
         id_val = row_dict.get("id")
         id_typed = int(id_val) if isinstance(id_val, int) else None
-        return cls(
+        return cls.model_construct(
             id=id_typed,
             date_utc=_to_str(row_dict, "date_utc"),
             order_no=_to_str(row_dict, "order_no"),
@@ -226,7 +345,7 @@ class BinanceFilledOrder(BaseModel):
 class BinanceOpenOrder(BaseModel):
     """Binance 未成交订单模型 - 基于 API 返回格式"""
 
-    symbol: str = Field(..., description="交易对")
+    symbol: SymbolStr = Field(..., description="交易对")
     order_id: int = Field(..., description="订单ID", alias="orderId")
     client_order_id: str = Field(..., description="客户端订单ID", alias="clientOrderId")
     price: str = Field(..., description="订单价格")
@@ -254,12 +373,6 @@ class BinanceOpenOrder(BaseModel):
         ..., description="自成交防止模式", alias="selfTradePreventionMode"
     )
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """验证交易对符号"""
-        return v.upper()
-
     @field_validator("side")
     @classmethod
     def validate_side(cls, v: str) -> str:
@@ -269,7 +382,16 @@ class BinanceOpenOrder(BaseModel):
             raise ValueError(f"买卖方向必须是 {BUY} 或 {SELL}, 不能是 {side_upper}")
         return side_upper
 
-    model_config = ConfigDict(use_enum_values=True, populate_by_name=True)
+    @classmethod
+    def from_api_list(cls, orders: list[dict[str, Any]]) -> list["BinanceOpenOrder"]:
+        """批量校验 API 返回的挂单列表, 一次 TypeAdapter 调用替代逐条 **kwargs 构造"""
+        return _OPEN_ORDER_LIST_ADAPTER.validate_python(orders)
+
+    # 挂单快照只读; BinanceFilledOrder 在撮合中会改写剩余数量, 保持可变
+    model_config = ConfigDict(use_enum_values=True, populate_by_name=True, frozen=True)
+
+
+_OPEN_ORDER_LIST_ADAPTER = TypeAdapter(list[BinanceOpenOrder])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+"""
+SQLite 连接池
+
+有界连接池: 连接按需创建, 上限之内复用空闲连接, 达到上限时等待归还.
+建连与连接级 PRAGMA 设置由传入的工厂函数完成, 只在连接首次创建时发生.
+"""
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+
+from loguru import logger
+
+
+class SQLiteConnectionPool:
+    """
+    线程安全的有界 SQLite 连接池
+
+    acquire/release 成对使用, 或通过 connection() 上下文管理器借用.
+    同一连接同一时刻只借给一个借用者; 线程内的嵌套复用由调用方负责.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        size: int,
+        timeout: float,
+    ) -> None:
+        self._factory = factory
+        self._size = max(1, size)
+        self._timeout = timeout
+        self._idle: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=self._size)
+        self._lock = threading.Lock()
+        # 已创建 (空闲 + 借出) 的连接数, 由 _lock 保护
+        self._created = 0
+
+    @property
+    def size(self) -> int:
+        """连接数上限"""
+        return self._size
+
+    @property
+    def created(self) -> int:
+        """当前已创建的连接数 (空闲 + 借出)"""
+        return self._created
+
+    def _reserve_slot(self) -> bool:
+        with self._lock:
+            if self._created >= self._size:
+                return False
+            self._created += 1
+            return True
+
+    def _create(self) -> sqlite3.Connection:
+        try:
+            return self._factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def acquire(self) -> sqlite3.Connection:
+        """借出连接: 优先复用空闲连接, 未达上限时新建, 否则等待归还"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        if self._reserve_slot():
+            return self._create()
+        try:
+            return self._idle.get(timeout=self._timeout)
+        except queue.Empty as e:
+            raise TimeoutError(
+                f"等待数据库连接超时 ({self._timeout}s), 连接池已满"
+            ) from e
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        归还连接, 并清理借用方留下的状态, 避免影响下一个借用者:
+        回滚未提交的事务 (释放写锁), 恢复默认行工厂
+        """
+        if conn.in_transaction:
+            logger.warning("⚠️ 归还的数据库连接仍有未提交事务, 已回滚")
+            conn.rollback()
+        conn.row_factory = sqlite3.Row
+        self._idle.put_nowait(conn)
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """借出连接直到上下文结束"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def warm(self, count: int | None = None) -> int:
+        """
+        预先创建连接放入空闲队列, 让首批借用者免去建连开销
+
+        Args:
+            count: 期望的已创建连接数, 默认为连接池上限
+
+        Returns:
+            本次新建的连接数
+        """
+        target = self._size if count is None else min(count, self._size)
+        warmed = 0
+        while self._created < target and self._reserve_slot():
+            self._idle.put_nowait(self._create())
+            warmed += 1
+        return warmed
+
+    def close(self) -> int:
+        """关闭全部空闲连接并返回关闭数量; 之后的借用会按需重新建连"""
+        closed = 0
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if closed == 0:
+                # SQLite 建议关闭前执行: 依据本次会话的查询刷新统计信息, 通常为空操作
+                _ = conn.execute("PRAGMA optimize")
+            conn.close()
+            closed += 1
+        with self._lock:
+            self._created -= closed
+        if closed:
+            logger.trace("🔒 数据库连接已关闭: {} 个", closed)
+        return closed
@@ -5,6 +5,7 @@
 金融系统要求:完整的约束和索引设计.
 """
 
+import hashlib
 from typing import Any
 
 from loguru import logger
@@ -66,9 +67,7 @@ CREATE TABLE IF NOT EXISTS trading_symbols (
     last_updated_price DATETIME,                        -- 价格数据最后更新时间
     max_fund INTEGER DEFAULT NULL,                      -- 最大资金限制 (本系统自定义字段)
     base_asset_balance REAL DEFAULT 0.0,                -- 基础资产余额 (如BTC数量)
-    quote_asset_balance REAL DEFAULT 0.0,               -- 计价资产余额 (如USDT数量)
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    quote_asset_balance REAL DEFAULT 0.0                -- 计价资产余额 (如USDT数量)
 );
 """
 
@@ -196,16 +195,16 @@ CREATE TABLE IF NOT EXISTS backtest_klines (
     symbol TEXT NOT NULL,
     timeframe TEXT NOT NULL,
     open_time INTEGER NOT NULL,
-    open_price TEXT NOT NULL,
-    high_price TEXT NOT NULL,
-    low_price TEXT NOT NULL,
-    close_price TEXT NOT NULL,
-    volume TEXT NOT NULL,
+    open_price REAL NOT NULL,
+    high_price REAL NOT NULL,
+    low_price REAL NOT NULL,
+    close_price REAL NOT NULL,
+    volume REAL NOT NULL,
     close_time INTEGER NOT NULL,
-    quote_asset_volume TEXT NOT NULL,
+    quote_asset_volume REAL NOT NULL,
     number_of_trades INTEGER NOT NULL,
-    taker_buy_base_asset_volume TEXT NOT NULL,
-    taker_buy_quote_asset_volume TEXT NOT NULL,
+    taker_buy_base_asset_volume REAL NOT NULL,
+    taker_buy_quote_asset_volume REAL NOT NULL,
     PRIMARY KEY (symbol, timeframe, open_time)
 );
 """
@@ -282,6 +281,18 @@ CREATE_TABLES = [
     CREATE_BACKTEST_KLINES_TABLE,
 ]
 
+# 建表指纹: 记录最近一次 create_all_tables 使用的 DDL 摘要, DDL 未变时可跳过重建
+CREATE_SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    hash TEXT NOT NULL                                       -- DDL 摘要
+);
+"""
+
+# 对全部建表/索引/触发器语句取摘要, 任一语句改动都会使指纹失效
+SCHEMA_HASH = hashlib.sha1(
+    "\n".join([*CREATE_TABLES, *INDEXES, *TRIGGERS]).encode()
+).hexdigest()
+
 
 def _create_tables_in_transaction(conn: Any) -> None:
     """在事务中创建所有表"""
@@ -304,6 +315,29 @@ def _create_triggers_in_transaction(conn: Any) -> None:
         logger.debug("✅ 触发器创建成功")
 
 
+def _record_schema_hash_in_transaction(conn: Any) -> None:
+    """在事务中写入当前 DDL 指纹 (表内只保留一行)"""
+    conn.execute(CREATE_SCHEMA_VERSION_TABLE)
+    conn.execute("DELETE FROM schema_version")
+    conn.execute("INSERT INTO schema_version (hash) VALUES (?)", (SCHEMA_HASH,))
+
+
+def is_schema_current(db_manager: DatabaseManager) -> bool:
+    """
+    判断数据库是否已按当前 DDL 建表
+
+    Args:
+        db_manager: 数据库管理器实例
+
+    Returns:
+        bool: 记录的指纹与当前 DDL 摘要一致时为 True
+    """
+    with db_manager.transaction() as conn:
+        conn.execute(CREATE_SCHEMA_VERSION_TABLE)
+        row = conn.execute("SELECT hash FROM schema_version").fetchone()
+    return row is not None and row[0] == SCHEMA_HASH
+
+
 def create_all_tables(db_manager: DatabaseManager) -> None:
     """
     创建所有数据库表,索引和触发器
@@ -318,6 +352,7 @@ def create_all_tables(db_manager: DatabaseManager) -> None:
         _create_tables_in_transaction(conn)
         _create_indexes_in_transaction(conn)
         _create_triggers_in_transaction(conn)
+        _record_schema_hash_in_transaction(conn)
 
     logger.info("🗄️ 所有数据库表,索引和触发器创建完成")
 
@@ -325,6 +360,7 @@ def create_all_tables(db_manager: DatabaseManager) -> None:
 def _get_table_drop_order() -> list[str]:
     """获取表删除的正确顺序(先删除有外键约束的表)"""
     return [
+        "schema_version",  # 先清除指纹, 之后的建表不会被跳过
         "backtest_klines",
         "trading_logs",  # 有外键约束,先删除
         "symbol_timeframe_configs",  # 有外键约束,先删除
@@ -145,7 +145,8 @@ def create_symbol_timeframe_config(
                 config.demark_sell,
                 config.daily_max_percentage,
                 config.monitor_delay,
-                config.oper_mode.value,
+                # use_enum_values=True: 字段已是枚举值字符串, 无需 .value
+                config.oper_mode,
                 config.is_active,
                 config.minimum_profit_percentage,
             ),
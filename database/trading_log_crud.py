@@ -20,6 +20,15 @@ from shared.async_notifier import (
 _trading_log_enabled: bool = True
 _fake_log_id_counter = 1
 
+# 批量插入使用固定列集合 (None 写入 NULL), 整批共用一条预编译语句
+_BULK_INSERT_FIELDS: tuple[str, ...] = tuple(
+    name for name in TradingLog.model_fields if name not in {"id", "created_at"}
+)
+_BULK_INSERT_QUERY = (
+    f"INSERT INTO trading_logs ({', '.join(_BULK_INSERT_FIELDS)}) "
+    f"VALUES ({', '.join('?' * len(_BULK_INSERT_FIELDS))})"
+)
+
 
 def set_trading_log_enabled(enabled: bool) -> None:
     global _trading_log_enabled
@@ -40,15 +49,17 @@ def _next_fake_log_id() -> int:
 """交易日志通知改为异步后台发送,避免阻塞主流程"""
 
 
-def _build_insert_query_and_params(log: TradingLog) -> tuple[str, tuple[object, ...]]:
-    """根据TradingLog对象动态构建插入SQL查询和参数"""
+def _build_insert_query_and_params(
+    log_data: dict[str, Any],
+) -> tuple[str, tuple[object, ...]]:
+    """根据 TradingLog.model_dump() 的结果动态构建插入SQL查询和参数"""
     # 获取所有非None且非id的字段
     fields: list[str] = []
     values: list[str] = []
     params: list[object] = []
 
-    for field_name, field_value in log.model_dump(exclude={"id", "created_at"}).items():
-        if field_value is not None:
+    for field_name, field_value in log_data.items():
+        if field_value is not None and field_name not in ("id", "created_at"):
             fields.append(field_name)
             values.append("?")
             params.append(field_value)
@@ -70,7 +81,9 @@ def create_trading_log(log: TradingLog) -> int:
         return fake_id
 
     db_manager = get_db_manager()
-    query, params = _build_insert_query_and_params(log)
+    # 只序列化一次, 插入参数与事件通知共用
+    log_data = log.model_dump()
+    query, params = _build_insert_query_and_params(log_data)
 
     # 先完成插入并提交
     with db_manager.transaction() as conn:
@@ -82,11 +95,43 @@ def create_trading_log(log: TradingLog) -> int:
 
     # 异步投递通知,不阻塞主流程
     with suppress(Exception):
-        enqueue_trading_log_created(log_id, log.model_dump())
+        enqueue_trading_log_created(log_id, log_data)
 
     return log_id
 
 
+def create_trading_logs_bulk(logs: list[TradingLog]) -> list[int]:
+    """批量创建交易日志记录, 按输入顺序返回 ID
+
+    整批在一个事务内 executemany 写入, 只提交 (fsync) 一次.
+    事务持有写锁期间自增 ID 连续分配, 由最后一行 ID 反推整批 ID.
+    """
+    if not logs:
+        return []
+
+    if not _trading_log_enabled:
+        fake_ids = [_next_fake_log_id() for _ in logs]
+        logger.debug("Trading log disabled, returning {} fake IDs", len(fake_ids))
+        return fake_ids
+
+    dumps = [log.model_dump() for log in logs]
+    rows = [tuple(dump[name] for name in _BULK_INSERT_FIELDS) for dump in dumps]
+
+    db_manager = get_db_manager()
+    with db_manager.transaction() as conn:
+        _ = conn.executemany(_BULK_INSERT_QUERY, rows)
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    log_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+    logger.info("批量创建交易日志: {} 条, ID {}-{}", len(log_ids), log_ids[0], last_id)
+
+    # 异步投递通知,不阻塞主流程
+    with suppress(Exception):
+        for log_id, dump in zip(log_ids, dumps, strict=True):
+            enqueue_trading_log_created(log_id, dump)
+
+    return log_ids
+
+
 def update_trading_log(log_id: int, **kwargs: Any) -> None:
     """更新交易日志记录
 
@@ -23,6 +23,21 @@ if __name__ == "__main__":
 
 from database.enums import OperMode
 
+# 配置允许的 K 线周期; 集合用于 O(1) 校验, 元组保持报错信息中的顺序
+_CONFIG_TIMEFRAMES: tuple[str, ...] = (
+    "1m",
+    "3m",
+    "5m",
+    "15m",
+    "30m",
+    "1h",
+    "4h",
+    "1d",
+    "1W",
+    "1M",
+)
+_CONFIG_TIMEFRAME_SET: frozenset[str] = frozenset(_CONFIG_TIMEFRAMES)
+
 
 class TradingSymbol(BaseModel):
     """交易对模型"""
@@ -92,20 +107,8 @@ class SymbolTimeframeConfig(BaseModel):
     @classmethod
     def validate_timeframe(cls, v: str) -> str:
         """验证时间周期格式"""
-        valid_timeframes = [
-            "1m",
-            "3m",
-            "5m",
-            "15m",
-            "30m",
-            "1h",
-            "4h",
-            "1d",
-            "1W",
-            "1M",
-        ]
-        if v not in valid_timeframes:
-            raise ValueError(f"时间周期必须是: {valid_timeframes}")
+        if v not in _CONFIG_TIMEFRAME_SET:
+            raise ValueError(f"时间周期必须是: {list(_CONFIG_TIMEFRAMES)}")
         return v
 
     model_config = ConfigDict(use_enum_values=True)
@@ -28,6 +28,8 @@ from loguru import logger
 _config_cache: dict[str, Any] | None = None
 # 简单的客户端缓存, 避免重复创建与握手
 _client_cache: IBKRClient | None = None
+# 保护首次建连, 避免并发调用各自握手出多条 socket
+_client_lock = threading.Lock()
 
 
 @dataclass(slots=True)
@@ -69,9 +71,11 @@ class IBKRClient(EWrapper, EClient):
             self._summary.setdefault("currency", currency)
 
     def nextValidId(self, orderId: int) -> None:  # - IBKR 回调命名
-        self._connected_event.set()
         with self._order_id_lock:
-            self._next_order_id = orderId
+            # 只升不降: 重连后服务端下发的起始ID不能让已分配的ID被重复使用
+            current = self._next_order_id
+            self._next_order_id = orderId if current is None else max(current, orderId)
+        self._connected_event.set()
 
     def accountSummaryEnd(self, reqId: int) -> None:  # - IBKR 回调命名
         self._summary_event.set()
@@ -160,6 +164,9 @@ class IBKRClient(EWrapper, EClient):
     # ===== 业务方法 =====
     def connect_and_start(self, timeout: float = 5.0) -> None:
         """连接 IB Gateway/TWS 并启动读写线程."""
+        # 重连时必须等到新会话的 nextValidId 才算握手完成;
+        # 保留已分配的订单ID计数, 由 nextValidId 取较大值, 避免重复使用旧ID
+        self._connected_event.clear()
         self.connect(self.config.host, self.config.port, self.config.client_id)
         thread = threading.Thread(target=self.run, name="ibkr-client-thread", daemon=True)
         thread.start()
@@ -231,6 +238,7 @@ class IBKRClient(EWrapper, EClient):
         if not self._open_orders_event.wait(timeout=timeout):
             raise TimeoutError("获取 IBKR 未完成订单超时")
 
+        # TWS 会在下单和状态变化时主动推送 openOrder 并追加到内部列表, 返回快照
         return list(self._open_orders)
 
     def executions(self, timeout: float = 5.0) -> list[dict[str, Any]]:
@@ -263,6 +271,15 @@ class IBKRClient(EWrapper, EClient):
             self._next_order_id += 1
             return order_id
 
+    def next_order_ids(self, count: int) -> range:
+        """一次加锁预留 count 个连续订单ID, 供批量下单使用."""
+        with self._order_id_lock:
+            if self._next_order_id is None:
+                raise TimeoutError("尚未从 IBKR 获取有效的订单ID")
+            first = self._next_order_id
+            self._next_order_id += count
+            return range(first, first + count)
+
     def get_current_price(self, contract: Contract) -> Decimal:
         """占位: 获取当前价格, 需要补充行情订阅实现."""
         raise NotImplementedError("行情获取需另行实现")
@@ -296,17 +313,25 @@ def get_api_config() -> IBKRConfig:
 
 
 def get_configured_client() -> IBKRClient:
-    """获取已配置的 IBKR 客户端."""
-    global _client_cache
+    """获取已配置的 IBKR 客户端.
 
-    if _client_cache is not None:
-        return _client_cache
+    进程内复用同一条长连接: 已连接时直接返回缓存; 连接断开时在原客户端上重连,
+    不重新构建客户端与配置.
+    """
+    global _client_cache
 
-    config = get_api_config()
-    client = IBKRClient(config)
-    client.connect_and_start()
-    _client_cache = client
-    return client
+    client = _client_cache
+    if client is not None and client.isConnected():
+        return client
+
+    with _client_lock:
+        client = _client_cache
+        if client is None:
+            client = IBKRClient(get_api_config())
+        if not client.isConnected():
+            client.connect_and_start()
+        _client_cache = client
+        return client
 
 
 def get_configured_client_with_config() -> tuple[IBKRClient, IBKRConfig]:
@@ -1,5 +1,6 @@
 """获取 Binance K 线数据 - 纯函数实现."""
 
+from collections.abc import Sequence
 from typing import cast
 
 if __name__ == "__main__" and __package__ is None:
@@ -27,14 +28,14 @@ def klines(
         list[dict]: K线数据列表
     """
 
-    raw_klines: list[list[object]] = client.get_klines(
+    raw_klines: list[Sequence[object]] = client.get_klines(
         symbol=symbol.upper(), interval=interval, limit=limit
     )
 
     # 转换为标准格式
     klines_data: list[Kline] = []
     for kline in raw_klines:
-        row = cast(list[int | str], kline)
+        row = cast(Sequence[int | str], kline)
         klines_data.append(
             cast(
                 Kline,
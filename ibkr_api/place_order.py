@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import sys
+import argparse
+import os
+from collections.abc import Mapping, Sequence
 from decimal import Decimal
 from typing import Any
 
@@ -15,9 +17,20 @@ from ibapi.contract import Contract
 from ibapi.order import Order as IBOrder
 from loguru import logger
 
-from ibkr_api.common import IBKRClient, get_api_config, get_configured_client
+from ibkr_api.common import (
+    IBKRClient,
+    get_api_config,
+    get_configured_client,
+    reset_client_cache,
+)
 from shared.output_utils import print_json
 
+# 需要 lmtPrice 的 IBKR 订单类型
+_LIMIT_PRICE_ORDER_TYPES = frozenset({"LMT", "STP LMT"})
+# 下单热路径默认不写日志; 设置 ORDER_DEBUG=1 时输出逐笔提交明细
+_DEBUG_ORDERS = os.environ.get("ORDER_DEBUG") == "1"
+_ORDER_LOG = logger.bind(subsystem="order")
+
 
 def _build_contract(symbol: str, exchange: str, currency: str, sec_type: str) -> Contract:
     contract = Contract()
@@ -42,16 +55,16 @@ def _build_order(
     order.totalQuantity = int(quantity)
     order.tif = tif.upper()
     order.outsideRth = outside_rth
-    if order.orderType == "LMT":
+    if order.orderType in _LIMIT_PRICE_ORDER_TYPES:
         if limit_price is None:
             raise ValueError("限价单需要提供 limit_price")
         order.lmtPrice = float(limit_price)
     return order
 
 
-def place_order(
-    client: IBKRClient,
+def _prepare_order(
     symbol: str,
+    default_currency: str,
     exchange: str = "SMART",
     currency: str | None = None,
     sec_type: str = "STK",
@@ -61,78 +74,138 @@ def place_order(
     limit_price: Decimal | float | str | None = None,
     tif: str = "DAY",
     outside_rth: bool = False,
-) -> dict[str, Any]:
-    """下单并返回订单基础信息."""
+) -> tuple[Contract, IBOrder, dict[str, Any]]:
+    """校验并构建单笔订单, 返回 (合约, 订单, 不含 order_id 的订单信息)."""
     qty_decimal = Decimal(str(quantity))
     limit_decimal = Decimal(str(limit_price)) if limit_price is not None else None
-
-    cfg = get_api_config()
-    use_currency = currency or cfg.base_currency
+    use_currency = currency or default_currency
 
     contract = _build_contract(symbol, exchange, use_currency, sec_type)
     order = _build_order(side, order_type, qty_decimal, limit_decimal, tif, outside_rth)
-
-    order_id = client.next_order_id()
-    logger.info(
-        f"📤 提交订单 id={order_id} {side.upper()} {qty_decimal} {symbol.upper()} "
-        f"type={order_type.upper()} tif={tif} exch={exchange.upper()} cur={use_currency}"
-    )
-    client.placeOrder(order_id, contract, order)
-
-    return {
-        "order_id": order_id,
-        "symbol": symbol.upper(),
-        "exchange": exchange.upper(),
-        "currency": use_currency.upper(),
-        "sec_type": sec_type.upper(),
-        "side": side.upper(),
-        "order_type": order_type.upper(),
+    info = {
+        "symbol": contract.symbol,
+        "exchange": contract.exchange,
+        "currency": contract.currency,
+        "sec_type": contract.secType,
+        "side": order.action,
+        "order_type": order.orderType,
         "quantity": str(qty_decimal),
         "limit_price": str(limit_decimal) if limit_decimal is not None else None,
-        "tif": tif.upper(),
+        "tif": order.tif,
         "outside_rth": outside_rth,
     }
+    return contract, order, info
+
+
+def place_orders(
+    client: IBKRClient, orders: Sequence[Mapping[str, Any]]
+) -> list[dict[str, Any]]:
+    """批量下单, 按输入顺序返回订单基础信息.
+
+    每个元素为 place_order 的关键字参数 (不含 client). 全部订单先完成校验再提交,
+    任一校验失败则一笔都不下; 配置只解析一次, 订单ID一次性连续预留.
+    """
+    default_currency = get_api_config().base_currency
+    prepared = [_prepare_order(default_currency=default_currency, **o) for o in orders]
+
+    results: list[dict[str, Any]] = []
+    for order_id, (contract, order, info) in zip(
+        client.next_order_ids(len(prepared)), prepared, strict=True
+    ):
+        if _DEBUG_ORDERS:
+            _ORDER_LOG.info(
+                "📤 提交订单 id={} {} {} {} type={} tif={} exch={} cur={}",
+                order_id,
+                info["side"],
+                info["quantity"],
+                info["symbol"],
+                info["order_type"],
+                info["tif"],
+                info["exchange"],
+                info["currency"],
+            )
+        client.placeOrder(order_id, contract, order)
+        results.append({"order_id": order_id, **info})
+    return results
 
 
-def main() -> None:
-    """命令行演示: 提交市价买单."""
-    client = get_configured_client()
+def place_order(
+    client: IBKRClient,
+    symbol: str,
+    exchange: str = "SMART",
+    currency: str | None = None,
+    sec_type: str = "STK",
+    side: str = "BUY",
+    order_type: str = "MKT",
+    quantity: Decimal | float | str = "0",
+    limit_price: Decimal | float | str | None = None,
+    tif: str = "DAY",
+    outside_rth: bool = False,
+) -> dict[str, Any]:
+    """下单并返回订单基础信息."""
+    # 只传入有值的可选参数, 其余沿用 _prepare_order 的默认值
+    spec: dict[str, Any] = {
+        "symbol": symbol,
+        "exchange": exchange,
+        "sec_type": sec_type,
+        "side": side,
+        "order_type": order_type,
+        "quantity": quantity,
+        "tif": tif,
+        "outside_rth": outside_rth,
+    }
+    if currency is not None:
+        spec["currency"] = currency
+    if limit_price is not None:
+        spec["limit_price"] = limit_price
+    return place_orders(client, [spec])[0]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="p -m ibkr_api.place_order",
+        description="提交 IBKR 订单",
+        epilog="示例: p -m ibkr_api.place_order AAPL 10 SMART USD BUY LMT 150",
+    )
+    parser.add_argument("symbol", help="标的代码, 如 AAPL")
+    parser.add_argument("quantity", help="下单数量")
+    parser.add_argument("exchange", nargs="?", default="SMART")
+    parser.add_argument("currency", nargs="?", default=None)
+    parser.add_argument("side", nargs="?", default="BUY")
+    parser.add_argument("order_type", nargs="?", default="MKT")
+    parser.add_argument("limit_price", nargs="?", default=None)
+    return parser
 
-    if len(sys.argv) < 3:
-        _print_usage()
-        return
 
-    symbol = sys.argv[1]
-    qty_arg = sys.argv[2]
-    exchange = sys.argv[3] if len(sys.argv) > 3 else "SMART"
-    currency = sys.argv[4] if len(sys.argv) > 4 else None
-    side = sys.argv[5] if len(sys.argv) > 5 else "BUY"
-    order_type = sys.argv[6] if len(sys.argv) > 6 else "MKT"
-    limit_price = sys.argv[7] if len(sys.argv) > 7 else None
+# 解析器在导入时构建一次, 脚本循环调用 main 时不再重复搭建
+_PARSER = _build_parser()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """命令行演示: 默认提交市价买单."""
+    # 先解析参数, 参数错误时无需建立 IBKR 连接
+    args = _PARSER.parse_args(argv)
+    client = get_configured_client()
 
     try:
         result = place_order(
             client=client,
-            symbol=symbol,
-            exchange=exchange,
-            currency=currency,
+            symbol=args.symbol,
+            exchange=args.exchange,
+            currency=args.currency,
             sec_type="STK",
-            side=side,
-            order_type=order_type,
-            quantity=qty_arg,
-            limit_price=limit_price,
+            side=args.side,
+            order_type=args.order_type,
+            quantity=args.quantity,
+            limit_price=args.limit_price,
         )
     except Exception as exc:  # - CLI 入口统一提示
         logger.error(f"❌ 下单失败: {exc}")
     else:
         print_json(result)
     finally:
-        client.disconnect()
-
-
-def _print_usage() -> None:
-    logger.info("用法: p -m ibkr_api.place_order SYMBOL QTY [EXCHANGE] [CURRENCY] [SIDE] [TYPE] [LIMIT_PRICE]")
-    logger.info("示例: p -m ibkr_api.place_order AAPL 10 SMART USD BUY LMT 150")
+        # 断开后同时清除缓存, 避免后续调用拿到已断开的客户端
+        reset_client_cache()
 
 
 if __name__ == "__main__":
@@ -210,6 +210,7 @@ def _process_trade_execution(
             qty=float(qty),
             price=float(price),
             order_id=order_id,
+            kline_time=int(signal_klines[-1]["open_time"]),
         )
 
     # 执行到这里说明业务异常被 TradingLogContext 消化了
@@ -4,11 +4,11 @@ Binance CSV导入功能模块
 遵循CLAUDE.md规范: fail-fast原则,类型注解,禁用try-except
 """
 
-import csv
 import sys
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
 from loguru import logger
 
 # 处理相对导入问题
@@ -18,7 +18,23 @@ if __name__ == "__main__":
     sys.path.insert(0, str(parent_dir))
 
 from database.models import BinanceFilledOrder, CSVImportStats
-from order_filler.data_access import clear_all_orders, insert_order
+from order_filler.data_access import clear_all_orders, insert_orders
+
+# Binance CSV 导出的必需字段
+REQUIRED_FIELDS: tuple[str, ...] = (
+    "Date(UTC)",
+    "OrderNo",
+    "Pair",
+    "Type",
+    "Side",
+    "Order Price",
+    "Order Amount",
+    "Time",
+    "Executed",
+    "Average Price",
+    "Trading total",
+    "Status",
+)
 
 
 class BinanceCSVImporter:
@@ -54,43 +70,6 @@ class BinanceCSVImporter:
         )
         return stats
 
-    def _parse_csv_row(
-        self, row: dict[str, str], row_num: int
-    ) -> BinanceFilledOrder | None:
-        """
-        解析CSV行数据为BinanceFilledOrder对象(基于实际Binance CSV格式)
-
-        Args:
-            row: CSV行数据
-            row_num: 行号(用于错误报告)
-
-        Returns:
-            BinanceFilledOrder对象或None(解析失败)
-        """
-        # 检查必需字段
-        required_fields = [
-            "Date(UTC)",
-            "OrderNo",
-            "Pair",
-            "Type",
-            "Side",
-            "Order Price",
-            "Order Amount",
-            "Time",
-            "Executed",
-            "Average Price",
-            "Trading total",
-            "Status",
-        ]
-
-        missing_fields = [field for field in required_fields if field not in row]
-        if missing_fields:
-            logger.warning(f"第{row_num}行缺少字段: {missing_fields}")
-            return None
-
-        # 使用模型的 from_csv_row 方法创建对象
-        return BinanceFilledOrder.from_csv_row(row)
-
     def _resolve_csv_path(self, csv_file_path: str) -> Path:
         """解析并校验CSV文件路径"""
         csv_path = Path(csv_file_path)
@@ -117,31 +96,44 @@ class BinanceCSVImporter:
         }
 
     def _process_csv_rows(self, csv_path: Path, stats_state: dict[str, Any]) -> None:
-        """遍历CSV行并更新统计信息"""
-        with csv_path.open(encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, 2):
-                stats_state["total_rows"] += 1
-                self._handle_csv_row(row, row_num, stats_state)
-
-    def _handle_csv_row(
-        self, row: dict[str, str], row_num: int, stats_state: dict[str, Any]
-    ) -> None:
-        """处理单行CSV记录"""
-        order = self._parse_csv_row(row, row_num)
-        if not order:
+        """整表读取CSV并向量化解析, 已完成订单在一个事务内批量写入"""
+        # 没有表头的文件 (零字节, 仅 BOM 或空行) 会让 read_csv 抛 EmptyDataError; 按零行导出处理
+        try:
+            df = pd.read_csv(
+                csv_path, dtype=str, keep_default_na=False, encoding="utf-8-sig"
+            )
+        except pd.errors.EmptyDataError:
+            logger.warning(f"CSV文件为空: {csv_path}")
             return
+        stats_state["total_rows"] = len(df)
 
-        if order.status != "FILLED":
-            logger.debug(f"跳过未完成订单: {order.order_no}, 状态: {order.status}")
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in df.columns]
+        if missing_fields:
+            logger.warning(f"CSV缺少字段: {missing_fields}, 跳过全部{len(df)}行")
             return
 
-        if insert_order(order):
-            stats_state["imported_new"] += 1
-            stats_state["order_filler"] += 1
-        else:
-            stats_state["errors"].append(f"第{row_num}行: 插入数据库失败")
+        batch: list[BinanceFilledOrder] = []
+        seen_order_nos: set[str] = set()
+        for row_num, order in enumerate(BinanceFilledOrder.from_csv_dataframe(df), 2):
+            if order.status != "FILLED":
+                logger.debug(
+                    "跳过未完成订单: {}, 状态: {}", order.order_no, order.status
+                )
+                continue
+            # order_no 唯一, 重复行会被 INSERT OR IGNORE 忽略, 记为插入失败
+            if order.order_no in seen_order_nos:
+                stats_state["errors"].append(f"第{row_num}行: 插入数据库失败")
+                continue
+            seen_order_nos.add(order.order_no)
+            batch.append(order)
+
+        inserted = insert_orders(batch)
+        stats_state["imported_new"] += inserted
+        stats_state["order_filler"] += inserted
+        if inserted < len(batch):
+            stats_state["errors"].append(
+                f"{len(batch) - inserted}条订单插入数据库失败(订单号已存在)"
+            )
 
     def _build_stats(
         self, csv_path: Path, stats_state: dict[str, Any]
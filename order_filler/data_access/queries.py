@@ -178,7 +178,7 @@ def get_pending_timeframes_from_db(pair: str) -> list[str]:
         base_timeframes.add(base_tf)
 
     timeframes = list(base_timeframes)
-    logger.debug(f"原始时间周期: {raw_timeframes}")
-    logger.debug(f"提取基础时间周期: {timeframes}")
+    logger.debug("原始时间周期: {}", raw_timeframes)
+    logger.debug("提取基础时间周期: {}", timeframes)
 
     return timeframes
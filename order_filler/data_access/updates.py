@@ -34,7 +34,7 @@ def update_order_unmatched_qty(
             _ = transaction_conn.execute(sql, (unmatched_qty, order_no))
     else:
         _ = conn.execute(sql, (unmatched_qty, order_no))
-    logger.debug(f"更新Binance订单 {order_no} 未撮合数量: {unmatched_qty}")
+    logger.debug("更新Binance订单 {} 未撮合数量: {}", order_no, unmatched_qty)
     return True
 
 
@@ -59,7 +59,7 @@ def update_order_profit(
             _ = transaction_conn.execute(sql, (profit, order_no))
     else:
         _ = conn.execute(sql, (profit, order_no))
-    logger.debug(f"更新订单 {order_no} 利润: {profit}")
+    logger.debug("更新订单 {} 利润: {}", order_no, profit)
     return True
 
 
@@ -87,5 +87,5 @@ def update_order_matched_time(
     else:
         _ = conn.execute(sql, (time_str, order_no))
 
-    logger.debug(f"更新订单 {order_no} 撮合完成时间: {time_str}")
+    logger.debug("更新订单 {} 撮合完成时间: {}", order_no, time_str)
     return True
@@ -115,8 +115,8 @@ def match_sell_with_buy_pool(
         )
         matched_count += 1
 
-        # 如果BUY订单完全撮合,从池中移除
-        if Decimal(buy_order.unmatched_qty) == 0:
+        # 如果BUY订单完全撮合,从池中移除 (剩余量已知, 无需重新解析字符串)
+        if match_qty == buy_qty_remaining:
             _ = update_order_matched_time(buy_order.order_no, now_utc(), conn=conn)
             buy_pool.remove(buy_order)
 
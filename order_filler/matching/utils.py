@@ -4,6 +4,7 @@
 提供撮合过程中需要的通用工具函数和计算逻辑
 """
 
+import bisect
 from decimal import Decimal
 
 from loguru import logger
@@ -59,18 +60,13 @@ def add_to_buy_pool(
         buy_pool: 买单池
         buy_order: 买单
     """
-    # 插入排序,按实际成交价格升序(最便宜在前)
-    buy_price = Decimal(buy_order.average_price)
-    insert_index = 0
-
-    for i, pool_order in enumerate(buy_pool):
-        pool_price = Decimal(pool_order.average_price)
-        if buy_price < pool_price:
-            insert_index = i
-            break
-        insert_index = i + 1
-
-    buy_pool.insert(insert_index, buy_order)
+    # 二分插入,按实际成交价格升序(最便宜在前), 同价按加入顺序;
+    # 每次只解析 O(log n) 个价格, 而非逐个扫描整个买单池
+    bisect.insort_right(buy_pool, buy_order, key=_average_price)
+
+
+def _average_price(order: BinanceFilledOrder) -> Decimal:
+    return Decimal(order.average_price)
 
 
 def calculate_match_profit(
@@ -216,6 +216,11 @@ class DatabaseMigrator:
                 "删除 symbol_timeframe_configs 表的 minimum_price_change_percentage 字段",
                 self.migration_v35_remove_minimum_price_change_percentage,
             ),
+            (
+                36,
+                "将 backtest_klines 价格/成交量字段改为 REAL 类型",
+                self.migration_v36_convert_backtest_klines_to_real,
+            ),
         ]
 
     def register_migration(
@@ -1651,6 +1656,64 @@ class DatabaseMigrator:
                 "✅ 已删除 symbol_timeframe_configs 表的 minimum_price_change_percentage 字段"
             )
 
+    def migration_v36_convert_backtest_klines_to_real(self) -> None:
+        """迁移 v36: 将 backtest_klines 的价格/成交量字段从 TEXT 改为 REAL"""
+        if not self.table_exists("backtest_klines"):
+            logger.info("表 backtest_klines 不存在, 跳过 v36")
+            return
+
+        with self.db_manager.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE backtest_klines_new (
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    open_time INTEGER NOT NULL,
+                    open_price REAL NOT NULL,
+                    high_price REAL NOT NULL,
+                    low_price REAL NOT NULL,
+                    close_price REAL NOT NULL,
+                    volume REAL NOT NULL,
+                    close_time INTEGER NOT NULL,
+                    quote_asset_volume REAL NOT NULL,
+                    number_of_trades INTEGER NOT NULL,
+                    taker_buy_base_asset_volume REAL NOT NULL,
+                    taker_buy_quote_asset_volume REAL NOT NULL,
+                    PRIMARY KEY (symbol, timeframe, open_time)
+                )
+            """
+            )
+            conn.execute(
+                """
+                INSERT INTO backtest_klines_new
+                SELECT
+                    symbol,
+                    timeframe,
+                    open_time,
+                    CAST(open_price AS REAL),
+                    CAST(high_price AS REAL),
+                    CAST(low_price AS REAL),
+                    CAST(close_price AS REAL),
+                    CAST(volume AS REAL),
+                    close_time,
+                    CAST(quote_asset_volume AS REAL),
+                    number_of_trades,
+                    CAST(taker_buy_base_asset_volume AS REAL),
+                    CAST(taker_buy_quote_asset_volume AS REAL)
+                FROM backtest_klines
+            """
+            )
+            conn.execute("DROP TABLE backtest_klines")
+            conn.execute("ALTER TABLE backtest_klines_new RENAME TO backtest_klines")
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_backtest_klines_symbol_timeframe_open_time
+                ON backtest_klines(symbol, timeframe, open_time)
+            """
+            )
+
+        logger.info("✅ backtest_klines 价格/成交量字段已转换为 REAL")
+
 
 def main() -> None:
     """主函数"""
@@ -5,6 +5,7 @@
 """
 
 import sys
+from functools import cache
 from pathlib import Path
 
 from loguru import logger
@@ -38,22 +39,26 @@ def ensure_project_root_for_script(current_file: str) -> None:
     查找规则:
     - 自当前文件向上查找,遇到包含 `pyproject.toml` 的目录即视为项目根
     - 若未找到,回退到 `Path(current_file).resolve().parents[1]`
+
+    幂等: 根目录已在 sys.path 中时不做任何修改
     """
+    root = str(_find_project_root(current_file))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
+@cache
+def _find_project_root(current_file: str) -> Path:
+    """向上查找项目根目录; 按文件缓存, 重复调用不再逐级 stat"""
     cur = Path(current_file).resolve()
-    root: Path | None = None
 
     for parent in [cur, *list(cur.parents)]:
         if (parent / "pyproject.toml").exists():
-            root = parent
-            break
-
-    if root is None and len(cur.parents) >= 2:
-        root = cur.parents[1]
-    elif root is None:
-        root = cur.parent
+            return parent
 
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
+    if len(cur.parents) >= 2:
+        return cur.parents[1]
+    return cur.parent
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ Shared type definitions package.
 Provide precise types for common data structures to avoid using Any.
 """
 
+from collections.abc import Sequence
 from typing import Protocol, TypedDict, runtime_checkable
 
 
@@ -33,7 +34,7 @@ class BinanceKlinesClient(Protocol):
         symbol: str,
         interval: str,
         limit: int,
-    ) -> list[list[object]]:
+    ) -> list[Sequence[object]]:
         ...
 
 
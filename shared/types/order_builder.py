@@ -29,6 +29,7 @@ class OrderPlacedResult(TypedDict):
     qty: float
     price: float
     order_id: str
+    kline_time: int
 
 
 class ErrorResult(TypedDict):
@@ -5,11 +5,16 @@
 """
 
 from decimal import Decimal
-from typing import Literal, TypeAlias
+from typing import Annotated, Literal, TypeAlias
+
+from pydantic import StringConstraints
 
 # 数字或可转数字类型
 NumberLike: TypeAlias = str | int | float | Decimal | None
 
+# 交易对符号: 由 pydantic-core 统一转为大写, 无需逐模型编写 Python 校验器
+SymbolStr: TypeAlias = Annotated[str, StringConstraints(to_upper=True)]
+
 # 订单方向字面量
 SideLiteral: TypeAlias = Literal["BUY", "SELL"]
 
@@ -0,0 +1,148 @@
+"""
+ConfigManager 配置缓存测试(使用临时 SQLite 文件)
+"""
+
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from database.config import ConfigManager
+from database.config_optimized import ConfigManagerOptimized
+from database.connection import DatabaseConfig, DatabaseManager
+
+# ConfigManager 读写的键值表结构
+_CREATE_SYSTEM_CONFIGS = """
+CREATE TABLE system_configs (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    description TEXT,
+    is_active INTEGER NOT NULL DEFAULT 1
+)
+"""
+
+
+class _CountingManager(DatabaseManager):
+    def __init__(self, config: DatabaseConfig) -> None:
+        super().__init__(config)
+        self.queries = 0
+
+    def execute_query(self, *args, **kwargs):
+        self.queries += 1
+        return super().execute_query(*args, **kwargs)
+
+    def execute_query_tuples(self, *args, **kwargs):
+        self.queries += 1
+        return super().execute_query_tuples(*args, **kwargs)
+
+
+def _make_manager(tmp: str) -> _CountingManager:
+    mgr = _CountingManager(DatabaseConfig(db_path=Path(tmp) / "config.db"))
+    with mgr.transaction() as conn:
+        _ = conn.execute(_CREATE_SYSTEM_CONFIGS)
+    return mgr
+
+
+def test_api_config_cached_until_set():
+    with TemporaryDirectory() as tmp:
+        mgr = _make_manager(tmp)
+        config = ConfigManager(mgr)
+        config.set_system_config("TEST_MEXC_API_KEY", "k1")
+
+        first = config.get_api_config()
+        queries = mgr.queries
+        assert config.get_api_config() is first
+        assert config.get_system_config("MISSING") is None
+        assert config.get_system_config("MISSING") is None
+        assert mgr.queries == queries + 1
+
+        config.set_system_config("UNRELATED", "x")
+        assert config.get_api_config() is first
+
+        config.set_system_config("TEST_MEXC_API_KEY", "k2")
+        assert config.get_api_config().test_api_key == "k2"
+        assert mgr.queries == queries + 1
+        mgr.close()
+
+
+def test_optimized_api_config_cached_until_cleared():
+    with TemporaryDirectory() as tmp:
+        mgr = _make_manager(tmp)
+        ConfigManager(mgr).set_system_config("ENVIRONMENT", "mainnet")
+        config = ConfigManagerOptimized(mgr)
+
+        assert config.get_api_config_optimized().environment == "mainnet"
+        queries = mgr.queries
+        assert config.get_api_config_optimized().environment == "mainnet"
+        assert config.get_system_configs_batch(["ENVIRONMENT"]) == {
+            "ENVIRONMENT": "mainnet"
+        }
+        assert mgr.queries == queries
+
+        ConfigManager(mgr).set_system_config("ENVIRONMENT", "testnet")
+        config.clear_cache()
+        assert config.get_api_config_optimized().environment == "testnet"
+        mgr.close()
+
+
+def test_api_config_reads_json_row_after_migration():
+    with TemporaryDirectory() as tmp:
+        mgr = _make_manager(tmp)
+        ConfigManager(mgr).set_system_config("TEST_MEXC_API_KEY", "k1")
+        config = ConfigManager(mgr)
+        config.init_default_configs()
+        assert config.get_config_blob("__api_config__") == {
+            "environment": "testnet",
+            "main_api_key": "",
+            "main_secret_key": "",
+            "test_api_key": "k1",
+            "test_secret_key": "",
+        }
+
+        config.set_system_config("ENVIRONMENT", "mainnet")
+        fresh = ConfigManager(mgr)
+        queries = mgr.queries
+        api_config = fresh.get_api_config()
+        assert mgr.queries == queries + 1
+        assert api_config.environment == "mainnet"
+        assert api_config.test_api_key == "k1"
+        assert fresh.get_system_config("ENVIRONMENT") == "mainnet"
+        mgr.close()
+
+
+def test_batch_set_commits_once_and_syncs_json_row():
+    with TemporaryDirectory() as tmp:
+        mgr = _make_manager(tmp)
+        config = ConfigManager(mgr)
+        config.init_default_configs()
+        config.init_default_configs()  # 重复执行不覆盖已有配置
+
+        config.set_system_configs_batch(
+            [("TEST_MEXC_API_KEY", "k", "测试网API密钥"), ("LOG_LEVEL", "DEBUG", "")]
+        )
+
+        fresh = ConfigManager(mgr)
+        assert fresh.get_api_config().test_api_key == "k"
+        assert fresh.get_system_config("LOG_LEVEL") == "DEBUG"
+        mgr.close()
+
+
+def test_async_reads_run_concurrently():
+    with TemporaryDirectory() as tmp:
+        mgr = _make_manager(tmp)
+        config = ConfigManager(mgr)
+        config.set_system_config("ENVIRONMENT", "mainnet")
+        config.set_system_config("TEST_MEXC_API_KEY", "k1")
+        config.clear_cache()
+
+        async def read_all():
+            return await asyncio.gather(
+                config.get_api_config_async(),
+                config.get_system_config_async("TEST_MEXC_API_KEY"),
+                config.get_system_config_async("MISSING"),
+            )
+
+        api_config, api_key, missing = asyncio.run(read_all())
+        assert api_config.environment == "mainnet"
+        assert api_key == "k1"
+        assert missing is None
+        mgr.close()
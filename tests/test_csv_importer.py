@@ -0,0 +1,97 @@
+"""
+Binance CSV 导入测试(使用临时 SQLite 文件)
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import order_filler.data_access.crud as order_crud
+from database.connection import DatabaseConfig, DatabaseManager
+from database.models import BinanceFilledOrder
+from database.schema import CREATE_FILLED_ORDERS_TABLE
+from order_filler.csv_importer import REQUIRED_FIELDS, import_binance_csv
+
+_ROWS = [
+    ["2024-01-01 00:00:00", "1", "adausdc", "LIMIT", "buy", "0.5 USDC", "10 ADA",
+     "2024-01-01 00:00:01", "10ADA", "0.5", "5 USDC", "FILLED"],
+    ["2024-01-01 00:01:00", "2", "ADAUSDC", "LIMIT", "SELL", "0.6", "4",
+     "2024-01-01 00:01:01", "4", "0.6", "2.4", "CANCELED"],
+    ["2024-01-01 00:02:00", "3", "ADAUSDC", "LIMIT", "SELL", "0.7", "n/a",
+     "2024-01-01 00:02:01", "3", "0.7", "2.1", "FILLED"],
+    ["2024-01-01 00:03:00", "3", "ADAUSDC", "LIMIT", "SELL", "0.7", "3",
+     "2024-01-01 00:03:01", "3", "0.7", "2.1", "FILLED"],
+]  # fmt: skip
+
+
+def test_csv_dataframe_matches_per_row_parsing():
+    df = pd.DataFrame(_ROWS, columns=list(REQUIRED_FIELDS))
+
+    vectorized = BinanceFilledOrder.from_csv_dataframe(df)
+    per_row = [
+        BinanceFilledOrder.from_csv_row(dict(zip(REQUIRED_FIELDS, row, strict=True)))
+        for row in _ROWS
+    ]
+
+    assert [o.model_dump() for o in vectorized] == [o.model_dump() for o in per_row]
+
+
+def test_import_csv_inserts_filled_orders_in_one_batch(monkeypatch, tmp_path: Path):
+    mgr = DatabaseManager(DatabaseConfig(db_path=tmp_path / "orders.db"))
+    with mgr.transaction() as conn:
+        _ = conn.execute(CREATE_FILLED_ORDERS_TABLE)
+    monkeypatch.setattr(order_crud, "get_db_manager", lambda: mgr)
+    csv_path = tmp_path / "orders.csv"
+    pd.DataFrame(_ROWS, columns=list(REQUIRED_FIELDS)).to_csv(csv_path, index=False)
+
+    stats = import_binance_csv(str(csv_path))
+
+    assert stats.total_rows == 4
+    assert stats.imported_new == 2
+    assert stats.errors == ["第5行: 插入数据库失败"]
+    rows = mgr.execute_query(
+        "SELECT order_no, pair, order_amount, unmatched_qty FROM filled_orders "
+        "ORDER BY order_no"
+    )
+    assert [tuple(r) for r in rows] == [
+        ("1", "ADAUSDC", "10", 10.0),
+        ("3", "ADAUSDC", "0", 3.0),
+    ]
+    mgr.close()
+
+
+def test_from_db_dict_fast_path_matches_partial_path(monkeypatch, tmp_path: Path):
+    mgr = DatabaseManager(DatabaseConfig(db_path=tmp_path / "orders.db"))
+    with mgr.transaction() as conn:
+        _ = conn.execute(CREATE_FILLED_ORDERS_TABLE)
+    monkeypatch.setattr(order_crud, "get_db_manager", lambda: mgr)
+    df = pd.DataFrame(_ROWS[:1], columns=list(REQUIRED_FIELDS))
+    assert order_crud.insert_orders(BinanceFilledOrder.from_csv_dataframe(df)) == 1
+
+    row = dict(mgr.execute_query("SELECT * FROM filled_orders")[0])
+    fast = BinanceFilledOrder.from_db_dict(row)
+
+    assert (
+        fast.model_dump() == BinanceFilledOrder._from_partial_db_dict(row).model_dump()
+    )
+    assert fast.unmatched_qty == "10.0"
+    assert fast.client_order_id is None
+    mgr.close()
+
+
+@pytest.mark.parametrize("content", [b"", b"\xef\xbb\xbf", b"\n"])
+def test_import_empty_csv_reports_zero_rows(monkeypatch, tmp_path: Path, content):
+    mgr = DatabaseManager(DatabaseConfig(db_path=tmp_path / "orders.db"))
+    with mgr.transaction() as conn:
+        _ = conn.execute(CREATE_FILLED_ORDERS_TABLE)
+    monkeypatch.setattr(order_crud, "get_db_manager", lambda: mgr)
+    csv_path = tmp_path / "empty.csv"
+    csv_path.write_bytes(content)
+
+    stats = import_binance_csv(str(csv_path))
+
+    assert stats.total_rows == 0
+    assert stats.imported_new == 0
+    assert stats.errors == []
+    mgr.close()
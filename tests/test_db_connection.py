@@ -2,10 +2,15 @@
 DatabaseManager 最小 CRUD 测试(使用临时 SQLite 文件)
 """
 
+import sqlite3
+import threading
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import database.init_db as init_db
 from database.connection import DatabaseConfig, DatabaseManager
+from database.pool import SQLiteConnectionPool
+from database.schema import create_all_tables, drop_all_tables, is_schema_current
 
 
 def test_db_manager_crud():
@@ -28,3 +33,217 @@ def test_db_manager_crud():
         assert len(rows) == 1
         r = rows[0]
         assert r["name"] == "alice"
+
+
+def test_connection_pragmas_apply_to_every_thread():
+    with TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(
+            DatabaseConfig(db_path=Path(tmp) / "t.db", synchronous="FULL")
+        )
+        seen: dict[str, int] = {}
+
+        def read_pragmas() -> None:
+            with mgr.get_connection() as conn:
+                seen["foreign_keys"] = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+                seen["synchronous"] = conn.execute("PRAGMA synchronous").fetchone()[0]
+                seen["cache_size"] = conn.execute("PRAGMA cache_size").fetchone()[0]
+            mgr.close()
+
+        worker = threading.Thread(target=read_pragmas)
+        worker.start()
+        worker.join()
+
+        # synchronous: 2 = FULL
+        assert seen == {"foreign_keys": 1, "synchronous": 2, "cache_size": -65536}
+        with mgr.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        mgr.close()
+
+
+def test_pool_reuses_connections_and_nests_within_a_thread():
+    with TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(DatabaseConfig(db_path=Path(tmp) / "t.db", pool_size=2))
+        with mgr.transaction() as conn:
+            _ = conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+
+        with mgr.transaction() as conn:
+            _ = conn.execute("INSERT INTO t (id) VALUES (1)")
+            # 嵌套调用复用同一连接, 可见本事务未提交的写入
+            with mgr.get_connection() as inner:
+                assert inner is conn
+            assert mgr.execute_query("SELECT id FROM t")[0]["id"] == 1
+
+        seen: set[int] = set()
+
+        def borrow() -> None:
+            for _ in range(20):
+                with mgr.get_connection() as conn:
+                    seen.add(id(conn))
+
+        workers = [threading.Thread(target=borrow) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert len(seen) <= 2
+        mgr.close()
+
+
+def test_in_memory_database_is_shared_across_threads():
+    mgr = DatabaseManager(DatabaseConfig(db_path=Path(":memory:")))
+    with mgr.transaction() as conn:
+        _ = conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+
+    rows: list[int] = []
+    worker = threading.Thread(
+        target=lambda: rows.append(len(mgr.execute_query("SELECT id FROM t")))
+    )
+    worker.start()
+    worker.join()
+
+    assert rows == [0]
+    mgr.close()
+
+
+def test_execute_many_and_update_inside_transaction():
+    with TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(DatabaseConfig(db_path=Path(tmp) / "t.db"))
+        with mgr.transaction() as conn:
+            _ = conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+
+        n = mgr.execute_many(
+            "INSERT INTO t (name) VALUES (?)", [("a",), ("b",), ("c",)]
+        )
+        assert n == 3
+
+        # 外层事务回滚时, 其中的 execute_update 一并回滚
+        try:
+            with mgr.transaction():
+                _ = mgr.execute_update("DELETE FROM t")
+                raise RuntimeError("abort")
+        except ValueError:
+            pass
+        rows = mgr.execute_query("SELECT COUNT(*) AS c FROM t")
+        assert rows[0]["c"] == 3
+        mgr.close()
+
+
+def test_query_tuples_and_row_factory_reset_on_return():
+    with TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(DatabaseConfig(db_path=Path(tmp) / "t.db", pool_size=1))
+        with mgr.transaction() as conn:
+            _ = conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+        _ = mgr.execute_update("INSERT INTO t (name) VALUES (?)", ("alice",))
+
+        assert mgr.execute_query_tuples("SELECT id, name FROM t") == [(1, "alice")]
+
+        # 借用方改写的行工厂不会泄漏给下一个借用者
+        with mgr.get_connection() as conn:
+            conn.row_factory = None
+        assert mgr.execute_query("SELECT name FROM t")[0]["name"] == "alice"
+        mgr.close()
+
+
+def test_uncommitted_transaction_rolled_back_on_return():
+    with TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(DatabaseConfig(db_path=Path(tmp) / "t.db", pool_size=1))
+        with mgr.transaction() as conn:
+            _ = conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+
+        # 借用方执行 DML 后未提交就归还连接
+        with mgr.get_connection() as conn:
+            _ = conn.execute("INSERT INTO t (name) VALUES (?)", ("dangling",))
+            assert conn.in_transaction
+
+        def _borrow_in_other_thread(result: list[bool]) -> None:
+            with mgr.get_connection() as conn:
+                result.append(conn.in_transaction)
+
+        result: list[bool] = []
+        worker = threading.Thread(target=_borrow_in_other_thread, args=(result,))
+        worker.start()
+        worker.join()
+
+        assert result == [False]
+        assert mgr.execute_query_tuples("SELECT COUNT(*) FROM t") == [(0,)]
+        mgr.close()
+
+
+def test_in_memory_database_uses_memory_journal():
+    mgr = DatabaseManager(DatabaseConfig(db_path=Path(":memory:")))
+    rows = mgr.execute_query_tuples("PRAGMA journal_mode")
+    assert rows == [("memory",)]
+    mgr.close()
+
+
+def test_connection_pool_warm_and_close():
+    with TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "t.db"
+        pool = SQLiteConnectionPool(
+            lambda: sqlite3.connect(db_path, check_same_thread=False),
+            size=3,
+            timeout=0.1,
+        )
+        assert pool.warm(2) == 2
+        assert pool.warm() == 1
+        assert pool.created == 3
+
+        conns = [pool.acquire() for _ in range(3)]
+        assert len({id(c) for c in conns}) == 3
+        try:
+            pool.acquire()
+        except TimeoutError:
+            pass
+        else:
+            raise AssertionError("pool must not exceed its size")
+
+        for conn in conns:
+            pool.release(conn)
+        assert pool.close() == 3
+        assert pool.created == 0
+
+
+def test_ensure_database_initialized_checks_once(monkeypatch):
+    checks: list[int] = []
+
+    def _exists() -> bool:
+        checks.append(1)
+        return True
+
+    monkeypatch.setattr(init_db, "check_database_exists", _exists)
+    init_db.reset_initialization_flag()
+    try:
+        init_db.ensure_database_initialized()
+        init_db.ensure_database_initialized()
+        assert len(checks) == 1
+
+        init_db.reset_initialization_flag()
+        init_db.ensure_database_initialized()
+        assert len(checks) == 2
+    finally:
+        init_db.reset_initialization_flag()
+
+
+def test_init_database_skips_when_schema_hash_matches(monkeypatch, tmp_path: Path):
+    mgr = DatabaseManager(DatabaseConfig(db_path=tmp_path / "schema.db"))
+    builds: list[int] = []
+
+    def _create(db_manager: DatabaseManager) -> None:
+        builds.append(1)
+        create_all_tables(db_manager)
+
+    monkeypatch.setattr(init_db, "get_db_manager", lambda: mgr)
+    monkeypatch.setattr(init_db, "create_all_tables", _create)
+
+    assert not is_schema_current(mgr)
+    init_db.init_database()
+    init_db.init_database()
+    assert builds == [1]
+    assert is_schema_current(mgr)
+
+    # 删除全部表会连同指纹一起清除, 下次初始化重新建表
+    drop_all_tables(mgr)
+    init_db.init_database()
+    assert builds == [1, 1]
+    mgr.close()
@@ -0,0 +1,69 @@
+"""
+IBKRClient 握手与订单ID分配测试(不连接真实 Gateway)
+"""
+
+import threading
+from types import SimpleNamespace
+
+from ibkr_api.common import IBKRClient, IBKRConfig
+
+
+def _client() -> IBKRClient:
+    return IBKRClient(
+        IBKRConfig(
+            host="127.0.0.1",
+            port=4002,
+            client_id=1,
+            account=None,
+            base_currency="USD",
+            paper=True,
+        )
+    )
+
+
+def test_next_valid_id_never_lowers_counter():
+    client = _client()
+    client.nextValidId(100)
+    assert list(client.next_order_ids(3)) == [100, 101, 102]
+
+    client.nextValidId(90)
+    assert client.next_order_id() == 103
+
+
+def test_reconnect_waits_for_new_handshake(monkeypatch):
+    client = _client()
+    client.nextValidId(100)
+    _ = client.next_order_ids(5)
+    handshakes: list[int] = []
+
+    def _next_valid_id(order_id: int) -> None:
+        handshakes.append(order_id)
+        IBKRClient.nextValidId(client, order_id)
+
+    def _run() -> None:
+        # 新会话的 nextValidId 在 socket 建立之后才到达, 且低于已分配的ID
+        threading.Timer(0.2, _next_valid_id, args=(50,)).start()
+
+    monkeypatch.setattr(client, "connect", lambda *_args: None)
+    monkeypatch.setattr(client, "isConnected", lambda: True)
+    monkeypatch.setattr(client, "run", _run)
+
+    client.connect_and_start(timeout=2.0)
+
+    assert handshakes == [50]
+    assert client.next_order_id() == 105
+
+
+def test_open_orders_returns_snapshot(monkeypatch):
+    client = _client()
+    monkeypatch.setattr(client, "isConnected", lambda: True)
+    monkeypatch.setattr(client, "reqOpenOrders", client.openOrderEnd)
+
+    orders = client.open_orders(timeout=1.0)
+    # 请求结束后 TWS 仍可能主动推送 openOrder
+    contract = SimpleNamespace(
+        symbol="AAPL", secType="STK", currency="USD", exchange="SMART"
+    )
+    client.openOrder(1, contract, SimpleNamespace(), SimpleNamespace())
+
+    assert orders == []
@@ -0,0 +1,45 @@
+"""
+热点模型的校验器/序列化器须在导入时构建完成, 避免首次下单或写日志时才编译 schema
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from database.log_models import TradingLog
+from database.order_models import AccountTradeList, BinanceFilledOrder, BinanceOpenOrder
+
+
+@pytest.mark.parametrize(
+    "model", [TradingLog, AccountTradeList, BinanceFilledOrder, BinanceOpenOrder]
+)
+def test_hot_models_are_built_at_import(model):
+    assert model.__pydantic_complete__
+    assert isinstance(model.__pydantic_validator__, SchemaValidator)
+    assert isinstance(model.__pydantic_serializer__, SchemaSerializer)
+
+
+def test_snapshot_models_are_frozen_and_hashable():
+    log = TradingLog(symbol="adausdc", kline_timeframe="1h")
+
+    with pytest.raises(ValidationError):
+        log.id = 1
+    saved = log.model_copy(update={"id": 1})
+    assert (saved.id, log.id) == (1, None)
+    assert hash(log) == hash(TradingLog(symbol="ADAUSDC", kline_timeframe="1h"))
+    assert not BinanceFilledOrder.model_config.get("frozen", False)
+
+
+def test_schema_entry_does_not_import_models():
+    code = (
+        "import sys, database.init_db, database.models as m; "
+        "assert 'database.log_models' not in sys.modules; "
+        "assert m.TradingLog.__module__ == 'database.log_models'"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1]
+    )
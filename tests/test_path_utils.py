@@ -2,9 +2,15 @@
 shared.path_utils 测试
 """
 
+import importlib
 import sys
 
-from shared.path_utils import add_project_root_to_path, get_project_root
+import database.db_config
+from shared.path_utils import (
+    add_project_root_to_path,
+    ensure_project_root_for_script,
+    get_project_root,
+)
 
 
 def test_get_project_root_is_parent():
@@ -26,3 +32,18 @@ def test_add_project_root_to_path_idempotent(monkeypatch):
     # 再次添加不会重复
     add_project_root_to_path()
     assert sys.path.count(str(root)) == 1
+
+
+def test_ensure_project_root_for_script_idempotent(monkeypatch):
+    root = str(get_project_root())
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p != root])
+    ensure_project_root_for_script(__file__)
+    ensure_project_root_for_script(__file__)
+    assert sys.path.count(root) == 1
+    assert sys.path[0] == root
+
+
+def test_importing_db_config_leaves_sys_path_alone():
+    before = list(sys.path)
+    importlib.reload(database.db_config)
+    assert sys.path == before
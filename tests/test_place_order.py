@@ -0,0 +1,90 @@
+"""
+place_orders 批量下单测试(使用假客户端, 不连接真实 Gateway)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import ibkr_api.place_order as place_order_module
+from ibkr_api.place_order import place_orders
+
+
+class _FakeClient:
+    """记录订单ID预留与提交顺序的假客户端."""
+
+    def __init__(self, first_id: int) -> None:
+        self._next_id = first_id
+        self.reserved: list[int] = []
+        self.placed: list[tuple[int, str, str, str]] = []
+
+    def next_order_id(self) -> int:
+        raise AssertionError("批量下单应一次性预留连续ID")
+
+    def next_order_ids(self, count: int) -> range:
+        ids = range(self._next_id, self._next_id + count)
+        self._next_id += count
+        self.reserved.extend(ids)
+        return ids
+
+    def placeOrder(self, order_id, contract, order) -> None:
+        self.placed.append((order_id, contract.symbol, order.action, order.orderType))
+
+
+@pytest.fixture(autouse=True)
+def _usd_config(monkeypatch):
+    monkeypatch.setattr(
+        place_order_module,
+        "get_api_config",
+        lambda: SimpleNamespace(base_currency="USD"),
+    )
+
+
+def test_invalid_spec_places_nothing_and_reserves_no_ids():
+    client = _FakeClient(first_id=100)
+    orders = [
+        {"symbol": "aapl", "quantity": 1},
+        {"symbol": "msft", "order_type": "LMT", "quantity": 2},
+    ]
+
+    with pytest.raises(ValueError, match="limit_price"):
+        place_orders(client, orders)  # type: ignore[arg-type]
+
+    assert client.placed == []
+    assert client.reserved == []
+    assert client.next_order_ids(1) == range(100, 101)
+
+
+def test_orders_get_contiguous_ids_in_input_order():
+    client = _FakeClient(first_id=100)
+    orders = [
+        {"symbol": "aapl", "side": "buy", "quantity": 1},
+        {
+            "symbol": "msft",
+            "side": "sell",
+            "order_type": "lmt",
+            "quantity": "2",
+            "limit_price": "410.5",
+            "currency": "eur",
+        },
+        {
+            "symbol": "nvda",
+            "side": "buy",
+            "order_type": "stp lmt",
+            "quantity": 3,
+            "limit_price": 120,
+        },
+    ]
+
+    results = place_orders(client, orders)  # type: ignore[arg-type]
+
+    assert client.reserved == [100, 101, 102]
+    assert client.placed == [
+        (100, "AAPL", "BUY", "MKT"),
+        (101, "MSFT", "SELL", "LMT"),
+        (102, "NVDA", "BUY", "STP LMT"),
+    ]
+    assert [r["order_id"] for r in results] == [100, 101, 102]
+    assert [r["symbol"] for r in results] == ["AAPL", "MSFT", "NVDA"]
+    assert [r["currency"] for r in results] == ["USD", "EUR", "USD"]
+    assert [r["limit_price"] for r in results] == [None, "410.5", "120"]
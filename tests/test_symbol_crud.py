@@ -0,0 +1,47 @@
+"""
+交易对时间框架配置读写测试(使用临时 SQLite 文件)
+"""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+import database.symbol_crud as symbol_crud
+from database.connection import DatabaseConfig, DatabaseManager
+from database.models import OperMode, SymbolTimeframeConfig
+from database.schema import CREATE_SYMBOL_TIMEFRAME_CONFIGS_TABLE
+
+
+def _config(**overrides) -> SymbolTimeframeConfig:
+    fields = {
+        "trading_symbol": "adausdc",
+        "kline_timeframe": "1h",
+        "demark_buy": 9,
+        "demark_sell": 9,
+        "daily_max_percentage": 24.0,
+        "monitor_delay": 1.0,
+        "oper_mode": OperMode.BUY_ONLY,
+        "is_active": True,
+        "minimum_profit_percentage": 0.5,
+    }
+    return SymbolTimeframeConfig(**{**fields, **overrides})
+
+
+def test_symbol_timeframe_config_round_trip(monkeypatch, tmp_path: Path):
+    mgr = DatabaseManager(DatabaseConfig(db_path=tmp_path / "configs.db"))
+    with mgr.transaction() as conn:
+        _ = conn.execute(CREATE_SYMBOL_TIMEFRAME_CONFIGS_TABLE)
+    monkeypatch.setattr(symbol_crud, "get_db_manager", lambda: mgr)
+
+    row_id = symbol_crud.create_symbol_timeframe_config(mgr, _config())
+    loaded = symbol_crud.get_symbol_timeframe_config("ADAUSDC", "1h")
+
+    assert loaded.id == row_id
+    assert loaded.oper_mode == OperMode.BUY_ONLY == "buy_only"
+    mgr.close()
+
+
+def test_symbol_timeframe_config_rejects_unknown_timeframe():
+    with pytest.raises(ValidationError, match="时间周期必须是"):
+        _ = _config(kline_timeframe="2h")
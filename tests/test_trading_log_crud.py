@@ -0,0 +1,46 @@
+"""
+交易日志批量写入测试(使用临时 SQLite 文件)
+"""
+
+from pathlib import Path
+
+import database.trading_log_crud as trading_log_crud
+from database.connection import DatabaseConfig, DatabaseManager
+from database.models import TradingLog
+from database.schema import CREATE_TRADING_LOGS_TABLE
+
+
+def test_create_trading_logs_bulk_returns_ids_in_order(monkeypatch, tmp_path: Path):
+    mgr = DatabaseManager(DatabaseConfig(db_path=tmp_path / "logs.db"))
+    with mgr.transaction() as conn:
+        _ = conn.execute(CREATE_TRADING_LOGS_TABLE)
+    monkeypatch.setattr(trading_log_crud, "get_db_manager", lambda: mgr)
+    created: list[int] = []
+    monkeypatch.setattr(
+        trading_log_crud,
+        "enqueue_trading_log_created",
+        lambda log_id, _data: created.append(log_id),
+    )
+
+    first = trading_log_crud.create_trading_log(
+        TradingLog(symbol="aapl", kline_timeframe="1h")
+    )
+    ids = trading_log_crud.create_trading_logs_bulk(
+        [
+            TradingLog(symbol="msft", kline_timeframe="1h", demark=9),
+            TradingLog(symbol="nvda", kline_timeframe="4h", price=1.5),
+        ]
+    )
+
+    assert ids == [first + 1, first + 2]
+    assert created == [first, *ids]
+    rows = mgr.execute_query(
+        "SELECT id, symbol, demark, price FROM trading_logs ORDER BY id"
+    )
+    assert [(r["id"], r["symbol"]) for r in rows[1:]] == list(
+        zip(ids, ["MSFT", "NVDA"], strict=True)
+    )
+    assert rows[1]["demark"] == 9
+    assert rows[2]["price"] == 1.5
+    assert trading_log_crud.create_trading_logs_bulk([]) == []
+    mgr.close()
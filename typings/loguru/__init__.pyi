@@ -12,5 +12,6 @@ class _Logger:
     def disable(self, __name: str) -> None: ...
     def add(self, *args: Any, **kwargs: Any) -> int: ...
     def remove(self, *args: Any, **kwargs: Any) -> None: ...
+    def bind(self, **kwargs: Any) -> _Logger: ...
 
 logger: _Logger
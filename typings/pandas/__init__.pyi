@@ -1,7 +1,11 @@
 from typing import Any
 
+from . import errors as errors
+
 class DataFrame:
+    columns: Any
     def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+    def __len__(self) -> int: ...
     def set_index(self, *args: Any, **kwargs: Any) -> Any: ...
     def __setitem__(self, key: Any, value: Any) -> None: ...
     def __getitem__(self, key: Any) -> Any: ...
@@ -13,5 +17,6 @@ class Series:
     def __len__(self) -> int: ...
     def __getitem__(self, key: Any) -> Any: ...
 
+def read_csv(filepath_or_buffer: Any, *args: Any, **kwargs: Any) -> DataFrame: ...
 def to_numeric(arg: Any, *args: Any, **kwargs: Any) -> Any: ...
 def to_datetime(arg: Any, *args: Any, **kwargs: Any) -> Any: ...
@@ -0,0 +1 @@
+class EmptyDataError(ValueError): ...